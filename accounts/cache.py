@@ -0,0 +1,32 @@
+# accounts/cache.py
+"""
+Version counter for user data shown publicly (usernames, profile images),
+the counterpart of the published blogs version in blogs/cache.py. The
+CustomUser post_save/post_delete signals (accounts/signals.py) bump it,
+so API responses listing users can be revalidated without a query.
+"""
+import time
+
+from django.core.cache import cache
+
+from core.instrumentation import record_cache
+
+VERSION_KEY = "accounts:users:version"
+
+
+def users_version():
+    version = cache.get(VERSION_KEY)
+    record_cache(hits=version is not None, misses=version is None)
+    if version is None:
+        # Seeded from the clock, like blogs.cache.published_version()
+        cache.add(VERSION_KEY, int(time.time() * 1000), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_users_version():
+    try:
+        return cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, int(time.time() * 1000), None)
+        return cache.get(VERSION_KEY)
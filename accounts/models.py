@@ -1,6 +1,84 @@
 # accounts/models.py
-from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.contrib.auth.models import AbstractUser, UserManager
+from django.db import models, transaction
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def _prefix_range(prefix):
+    """
+    (lower, upper) bounds of every string starting with `prefix`, so a
+    prefix match can be a range scan on an index.
+    """
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class CustomUserQuerySet(models.QuerySet):
+    """
+    Admin-panel lookups and set-based updates. The bulk methods issue one
+    UPDATE each, so they bypass save() and post_save: they apply the
+    "admin implies is_staff" rule themselves and report role changes
+    through the `users_role_changed` signal (accounts/signals.py).
+    """
+
+    # Columns the user administration table renders.
+    LISTING_FIELDS = ("username", "email", "role", "is_active", "date_joined")
+
+    def search(self, prefix):
+        """
+        Users whose username or email starts with `prefix`, ignoring case.
+        Expressed as ranges on LOWER(username) / LOWER(email) so both sides
+        of the OR use the functional indexes.
+        """
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return self
+        start, end = _prefix_range(prefix)
+        return self.alias(
+            username_lower=Lower("username"),
+            email_lower=Lower("email"),
+        ).filter(
+            models.Q(username_lower__gte=start, username_lower__lt=end)
+            | models.Q(email_lower__gte=start, email_lower__lt=end)
+        )
+
+    def for_admin_list(self):
+        return self.only(*self.LISTING_FIELDS)
+
+    def activate(self):
+        return self.filter(is_active=False).update(is_active=True)
+
+    def deactivate(self):
+        return self.filter(is_active=True).update(is_active=False)
+
+    def set_role(self, role):
+        """
+        Move every user in the queryset to `role` in one UPDATE. Like
+        CustomUser.save(), promoting to admin also grants is_staff.
+        Returns the number of users whose role changed.
+        """
+        from .signals import users_role_changed
+
+        values = {"role": role}
+        if role == "admin":
+            values["is_staff"] = True
+
+        with transaction.atomic():
+            targets = self.exclude(role=role).order_by()
+            previous = dict(
+                targets.values_list("role").annotate(total=Count("pk"))
+            )
+            if not previous:
+                return 0
+            updated = targets.update(**values)
+            users_role_changed.send(
+                sender=self.model, role=role, previous=previous
+            )
+        return updated
+
+
+class CustomUserManager(UserManager.from_queryset(CustomUserQuerySet)):
+    pass
 
 
 class CustomUser(AbstractUser):
@@ -22,6 +100,22 @@ class CustomUser(AbstractUser):
         upload_to='profile_images/', blank=True, null=True
     )
 
+    objects = CustomUserManager()
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(
+                fields=["-date_joined", "-id"],
+                name="user_joined_idx",
+            ),
+            models.Index(
+                fields=["role", "-date_joined", "-id"],
+                name="user_role_joined_idx",
+            ),
+            models.Index(Lower("username"), name="user_username_lower_idx"),
+            models.Index(Lower("email"), name="user_email_lower_idx"),
+        ]
+
     def save(self, *args, **kwargs):
         # Ensure is_staff is in sync with role for admin panel access
         if self.role == 'admin':
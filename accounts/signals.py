@@ -0,0 +1,29 @@
+# accounts/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from core.images import schedule_derivatives
+
+from .cache import bump_users_version
+from .models import CustomUser
+
+# Sent by CustomUserQuerySet.set_role() with the new role and previous
+# ({old role: count}). The rows were changed with QuerySet.update(), so
+# post_save did not fire for them.
+users_role_changed = Signal()
+
+
+@receiver(post_save, sender=CustomUser)
+def generate_profile_image_derivatives(sender, instance, raw=False, **kwargs):
+    if raw or "profile_image" in instance.get_deferred_fields():
+        return
+    schedule_derivatives(instance.profile_image, "avatar")
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_users_version(sender, instance, update_fields=None, **kwargs):
+    # Logging in only writes last_login, which nothing public shows
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    bump_users_version()
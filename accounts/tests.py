@@ -1,3 +1,37 @@
 from django.test import TestCase
 
-# Create your tests here.
+from .models import CustomUser
+
+
+class CustomUserQuerySetTests(TestCase):
+    """Admin-panel lookups and set-based updates on CustomUser."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for username, email in (
+            ("Alice", "alice@example.com"),
+            ("alfred", "fred@example.org"),
+            ("bob", "al@example.net"),
+        ):
+            CustomUser.objects.create_user(username, email)
+
+    def _usernames(self, users):
+        return sorted(users.values_list("username", flat=True))
+
+    def test_search_is_a_case_insensitive_prefix_match(self):
+        self.assertEqual(self._usernames(CustomUser.objects.search("AL")), ["Alice", "alfred", "bob"])
+        self.assertEqual(self._usernames(CustomUser.objects.search("ali")), ["Alice"])
+        self.assertEqual(self._usernames(CustomUser.objects.search("  ")), ["Alice", "alfred", "bob"])
+
+    def test_set_role_grants_staff_to_admins(self):
+        users = CustomUser.objects.filter(username__in=["Alice", "bob"])
+        self.assertEqual(users.set_role("admin"), 2)
+        self.assertEqual(users.set_role("admin"), 0)
+        self.assertEqual(
+            self._usernames(CustomUser.objects.filter(role="admin", is_staff=True)), ["Alice", "bob"]
+        )
+
+    def test_activate_and_deactivate(self):
+        self.assertEqual(CustomUser.objects.filter(username="bob").deactivate(), 1)
+        self.assertEqual(CustomUser.objects.deactivate(), 2)
+        self.assertEqual(CustomUser.objects.activate(), 3)
@@ -0,0 +1,74 @@
+# adminpanel/management/commands/export_data.py
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from adminpanel.export import (
+    DATASETS,
+    DEFAULT_CHUNK_SIZE,
+    FORMATS,
+    ExportError,
+    stream_export,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream blogs or users to a file (or stdout) as NDJSON or CSV, "
+        "optionally gzipped, in constant memory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("dataset", choices=sorted(DATASETS))
+        parser.add_argument("--format", choices=sorted(FORMATS), default="ndjson")
+        parser.add_argument("--gzip", action="store_true", help="Gzip the output.")
+        parser.add_argument(
+            "--output",
+            "-o",
+            help="File to write (default: stdout).",
+        )
+        parser.add_argument("--since", help="First day to include (YYYY-MM-DD).")
+        parser.add_argument("--until", help="Last day to include (YYYY-MM-DD).")
+        parser.add_argument("--status", help="Blogs only.")
+        parser.add_argument("--category", help="Blogs only.")
+        parser.add_argument("--role", help="Users only.")
+        parser.add_argument("--active", choices=("1", "0"), help="Users only.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Rows fetched from the database per round trip.",
+        )
+
+    def handle(self, *args, **options):
+        filters = {
+            key: options[key]
+            for key in ("since", "until", "status", "category", "role", "active")
+            if options[key]
+        }
+        try:
+            blocks = stream_export(
+                options["dataset"],
+                options["format"],
+                options["gzip"],
+                chunk_size=options["chunk_size"],
+                **filters,
+            )
+        except ExportError as exc:
+            raise CommandError(str(exc))
+
+        if options["output"]:
+            with open(options["output"], "wb") as output:
+                written = self._write(blocks, output)
+            self.stderr.write(f"Wrote {written:,} bytes to {options['output']}.")
+        else:
+            self._write(blocks, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+
+    @staticmethod
+    def _write(blocks, output):
+        written = 0
+        for block in blocks:
+            output.write(block)
+            written += len(block)
+        return written
@@ -1,3 +1,174 @@
+import csv
+import gzip
+import io
+import json
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import CustomUser
+from blogs.models import Blog
+from dashboard.stats import recount
+
+
+class BulkModerationTests(TestCase):
+    """adminpanel.views.bulk_moderate and blogs.moderation.moderate()."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = CustomUser.objects.create_user("moderator", "moderator@example.com", role="admin")
+        cls.author = CustomUser.objects.create_user("writer", "writer@example.com")
+        cls.other = CustomUser.objects.create_user("other", "other@example.com")
+        cls.blogs = [
+            Blog.objects.create(
+                title=f"Post {i}",
+                content="Hello",
+                author=author,
+                category=category,
+                status="published",
+                approved_by=cls.admin,
+            )
+            for i, (author, category) in enumerate(
+                [(cls.author, "Travel"), (cls.author, "Health"), (cls.other, "Travel")]
+            )
+        ]
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def _post(self, **data):
+        return self.client.post(
+            reverse("adminpanel:bulk_moderate"),
+            {"status": "published", **data},
+            headers={"accept": "application/json"},
+        )
+
+    def test_whole_tab_needs_confirmation(self):
+        response = self._post(action="reject", scope="filter")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Blog.objects.filter(status="published").count(), 3)
+
+        response = self._post(action="reject", scope="filter", confirm="all")
+        self.assertEqual(response.json()["updated"], 3)
+
+    def test_filters_narrow_the_scope(self):
+        response = self._post(action="reject", scope="filter", author="writer", category="Travel")
+        self.assertEqual(response.json()["updated"], 1)
+        self.assertEqual(
+            list(Blog.objects.filter(status="rejected").values_list("pk", flat=True)),
+            [self.blogs[0].pk],
+        )
+
+    def test_reject_keeps_approval_history(self):
+        self._post(action="reject", ids=[self.blogs[1].pk])
+        blog = Blog.objects.get(pk=self.blogs[1].pk)
+        self.assertEqual(blog.status, "rejected")
+        self.assertEqual(blog.approved_by, self.admin)
+        self.assertEqual(blog.rejected_by, self.admin)
+        self.assertIsNotNone(blog.rejected_at)
+
+    def test_admins_only(self):
+        staff = CustomUser.objects.create_user("staff", "staff@example.com", is_staff=True)
+        self.client.force_login(staff)
+        response = self._post(action="reject", ids=[self.blogs[0].pk])
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Blog.objects.filter(status="published").count(), 3)
+
+
+class ModerationQueueTests(TestCase):
+    """adminpanel.views.admin_dashboard."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = CustomUser.objects.create_user("moderator", "moderator@example.com", role="admin")
+        for status in ("pending", "pending", "published"):
+            Blog.objects.create(title="Post", content="Hello", author=cls.admin, status=status)
+        recount()
+
+    def test_tab_counts_come_from_the_counters(self):
+        self.client.force_login(self.admin)
+        url = reverse("adminpanel:admin_dashboard")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(
+            [(value, count) for value, _, count in response.context["tabs"]],
+            [("pending", 2), ("published", 1), ("rejected", 0)],
+        )
+        self.assertFalse([query for query in queries if "GROUP BY" in query["sql"]])
+        self.assertEqual(response.context["blogs"].total_count, 2)
+
+
+class UserListTests(TestCase):
+    """Bulk user updates in adminpanel.views.user_list."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = CustomUser.objects.create_user("moderator", "moderator@example.com", role="admin")
+        for username in ("alice", "bob"):
+            CustomUser.objects.create_user(username, f"{username}@example.com")
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_all_matching_needs_confirmation(self):
+        url = reverse("adminpanel:user_list")
+        self.client.post(url, {"action": "deactivate", "scope": "filter"})
+        self.assertEqual(CustomUser.objects.filter(is_active=True).count(), 3)
+
+        self.client.post(f"{url}?q=al", {"action": "deactivate", "scope": "filter", "confirm": "all"})
+        self.assertEqual(
+            sorted(CustomUser.objects.filter(is_active=True).values_list("username", flat=True)),
+            ["bob", "moderator"],
+        )
+
+
+class ExportTests(TestCase):
+    """adminpanel.views.export_data and adminpanel/export.py."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = CustomUser.objects.create_user(
+            "moderator", "moderator@example.com", role="admin"
+        )
+        for title, category, status in (
+            ("Trip", "Travel", "published"),
+            ("Gym", "Health", "published"),
+            ("Plans", "Travel", "pending"),
+        ):
+            Blog.objects.create(
+                title=title, content="Hello", author=cls.admin, category=category, status=status
+            )
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def _export(self, dataset, **params):
+        response = self.client.get(reverse("adminpanel:export_data", args=[dataset]), params)
+        return response, b"".join(response.streaming_content)
+
+    def test_blog_filters(self):
+        response, body = self._export("blogs", status="published", category="Travel")
+        rows = [json.loads(line) for line in body.decode().splitlines()]
+        self.assertEqual([row["title"] for row in rows], ["Trip"])
+        self.assertIn('filename="blogs-', response["Content-Disposition"])
+
+    def test_csv_gzip_and_user_filters(self):
+        _, body = self._export("users", format="csv", gzip="1", role="admin", active="1")
+        rows = list(csv.DictReader(io.StringIO(gzip.decompress(body).decode())))
+        self.assertEqual([row["username"] for row in rows], ["moderator"])
 
-# Create your tests here.
+    def test_invalid_filters_are_rejected(self):
+        for dataset, params in (
+            ("blogs", {"status": "archived"}),
+            ("blogs", {"role": "admin"}),
+            ("blogs", {"since": "yesterday"}),
+            ("blogs", {"format": "xml"}),
+            ("posts", {}),
+        ):
+            with self.subTest(dataset=dataset, params=params):
+                response = self.client.get(
+                    reverse("adminpanel:export_data", args=[dataset]), params
+                )
+                self.assertEqual(response.status_code, 400)
@@ -8,5 +8,7 @@ urlpatterns = [
     path("users/", views.user_list, name="user_list"),
     path('approve/<int:blog_id>/', views.approve_blog, name="approve_blog"),
     path('reject/<int:blog_id>/', views.reject_blog, name="reject_blog"),
+    path('moderate/', views.bulk_moderate, name="bulk_moderate"),
+    path("export/<str:dataset>/", views.export_data, name="export_data"),
     path('', views.admin_dashboard, name="admin_dashboard"),
 ]
\ No newline at end of file
@@ -1,114 +1,284 @@
 # adminpanel/views.py
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponseForbidden
+from django.http import (
+    HttpResponseBadRequest,
+    HttpResponseForbidden,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import render, redirect, get_object_or_404
 from django.shortcuts import render
 from django.contrib.admin.views.decorators import staff_member_required
-from django.utils import timezone
+from django.template.defaultfilters import pluralize
+from django.urls import reverse
+from django.views.decorators.http import require_GET, require_POST
 from blogs.models import Blog
+from blogs.moderation import ACTIONS, moderate
+from core.pagination import CursorPaginator
+from dashboard.stats import site_statistics
 
 from accounts.models import CustomUser
 
+from .export import FORMATS, ExportError, export_filename, stream_export
+
+
+def _filtered_users(params):
+    """
+    Users matching the list filters in `params`: `q` (username or email
+    prefix), `role` and `active` ("1"/"0").
+    """
+    users = CustomUser.objects.search(params.get("q", ""))
+    if params.get("role") in dict(CustomUser.ROLE_CHOICES):
+        users = users.filter(role=params["role"])
+    if params.get("active") in ("1", "0"):
+        users = users.filter(is_active=params["active"] == "1")
+    return users
+
+
+def _update_users(request, users, action):
+    """
+    Apply `action` ("activate", "deactivate" or "role:<role>") to `users`
+    with one UPDATE. Returns the message to show, or None if invalid.
+    """
+    # Prevent admin from deactivating or demoting themselves accidentally
+    if action in ("deactivate", "role:user"):
+        users = users.exclude(pk=request.user.pk)
+
+    role = action.removeprefix("role:")
+    if action == "activate":
+        updated, verb = users.activate(), "activated"
+    elif action == "deactivate":
+        updated, verb = users.deactivate(), "deactivated"
+    elif action.startswith("role:") and role in dict(CustomUser.ROLE_CHOICES):
+        updated, verb = users.set_role(role), f"changed to {role}"
+    else:
+        return None
+    return f"{updated} user{pluralize(updated)} {verb}."
+
 
 @login_required
 def user_list(request):
     """
-    Admin panel: list all users and allow:
-      - activate/deactivate users
-      - change user role
+    Admin panel: search and filter users, keyset paginated, and
+    activate/deactivate or change the role of one user, the selected
+    users or every user matching the filters — each as a single UPDATE.
+    Acting on every matching user needs `confirm=all`.
     """
     if request.user.role != "admin":
         return HttpResponseForbidden("Admins only.")
 
-    users = CustomUser.objects.all().order_by("-date_joined")
-
     if request.method == "POST":
-        user_id = request.POST.get("user_id")
-        action = request.POST.get("action")
-        target_user = get_object_or_404(CustomUser, id=user_id)
-
-        # Prevent admin from deactivating themselves accidentally
-        if target_user == request.user and action == "toggle_active":
-            messages.error(request, "You cannot deactivate your own account.")
-            return redirect("adminpanel:user_list")
-
-        if action == "toggle_active":
-            target_user.is_active = not target_user.is_active
-            target_user.save()
-            state = "activated" if target_user.is_active else "deactivated"
-            messages.success(request, f"User {target_user.username} {state}.")
-        elif action == "change_role":
-            new_role = request.POST.get("role")
-            valid_roles = [choice[0] for choice in CustomUser.ROLE_CHOICES]
-            if new_role in valid_roles:
-                target_user.role = new_role
-                target_user.save()
-                messages.success(
-                    request,
-                    f"Role for {target_user.username} changed to {new_role}.",
-                )
+        action = request.POST.get("action", "")
+
+        if action == "toggle_active" or action == "change_role":
+            target_user = get_object_or_404(
+                CustomUser.objects.only("username", "is_active"),
+                id=request.POST.get("user_id"),
+            )
+            if target_user == request.user and action == "toggle_active":
+                messages.error(request, "You cannot deactivate your own account.")
+                return redirect(request.get_full_path())
+            if action == "toggle_active":
+                action = "deactivate" if target_user.is_active else "activate"
             else:
-                messages.error(request, "Invalid role selected.")
+                action = f"role:{request.POST.get('role')}"
+            users = CustomUser.objects.filter(pk=target_user.pk)
+        elif request.POST.get("scope") == "filter":
+            if request.POST.get("confirm") != "all":
+                messages.error(request, "Confirm acting on every matching user.")
+                return redirect(request.get_full_path())
+            users = _filtered_users(request.GET)
+        else:
+            ids = [value for value in request.POST.getlist("ids") if value.isdigit()]
+            users = CustomUser.objects.filter(pk__in=ids)
 
-        return redirect("adminpanel:user_list")
+        message = _update_users(request, users, action)
+        if message is None:
+            messages.error(request, "Invalid action selected.")
+        else:
+            messages.success(request, message)
+        return redirect(request.get_full_path())
+
+    paginator = CursorPaginator(
+        _filtered_users(request.GET).for_admin_list(),
+        50,
+        ordering=("-date_joined", "-id"),
+    )
+    users = paginator.page_from_request(request)
 
     context = {
         "users": users,
+        "page_obj": users,
+        "query": request.GET.get("q", ""),
+        "role": request.GET.get("role", ""),
+        "active": request.GET.get("active", ""),
         "role_choices": CustomUser.ROLE_CHOICES,
     }
     return render(request, "user_list.html", context)
 
 
-@login_required
-def approve_blog(request, blog_id):
-    """
-    Admin approves a pending blog
-    """
+# Tabs of the moderation queue, in display order
+MODERATION_STATUSES = ("pending", "published", "rejected")
+
+
+def _moderation_url(status):
+    return f"{reverse('adminpanel:admin_dashboard')}?status={status}"
+
+
+def _moderate_one(request, blog_id, action):
     if request.user.role != "admin":
         return HttpResponseForbidden("Admins only.")
 
-    blog = get_object_or_404(Blog, id=blog_id)
+    blog = get_object_or_404(Blog.objects.only("title", "status"), id=blog_id)
+    result = moderate(Blog.objects.filter(pk=blog.pk), action, request.user)
 
-    blog.status = "published"
-    blog.approved_by = request.user
-    blog.approved_at = timezone.now()
-    blog.save()
+    if not result["updated"]:
+        messages.info(request, f"Blog '{blog.title}' is already {result['status']}.")
+    elif action == "approve":
+        messages.success(request, f"Blog '{blog.title}' approved successfully.")
+    else:
+        messages.warning(request, f"Blog '{blog.title}' rejected.")
+    return redirect(_moderation_url(blog.status))
 
-    messages.success(request, f"Blog '{blog.title}' approved successfully.")
-    return redirect("adminpanel:pending_blogs")
+
+@login_required
+@require_POST
+def approve_blog(request, blog_id):
+    """
+    Admin approves a pending blog
+    """
+    return _moderate_one(request, blog_id, "approve")
 
 
 @login_required
+@require_POST
 def reject_blog(request, blog_id):
     """
     Admin rejects a blog
     """
+    return _moderate_one(request, blog_id, "reject")
+
+
+@login_required
+@require_POST
+def bulk_moderate(request):
+    """
+    Approve or reject many blogs in one UPDATE.
+
+    POST `action` (approve/reject) and either the selected `ids`, or
+    `scope=filter` to act on every blog in `status` narrowed to one
+    `author` (username) and/or `category`. Acting on a whole tab needs
+    `confirm=all`. Browsers are redirected back to the tab; API clients
+    (Accept: application/json) get the counts.
+    """
     if request.user.role != "admin":
         return HttpResponseForbidden("Admins only.")
 
-    blog = get_object_or_404(Blog, id=blog_id)
+    action = request.POST.get("action")
+    status = request.POST.get("status")
+    if action not in ACTIONS or status not in MODERATION_STATUSES:
+        return HttpResponseBadRequest("Unknown action or status.")
+
+    if request.POST.get("scope") == "filter":
+        author = request.POST.get("author", "").strip()
+        category = request.POST.get("category")
+        if not (author or category or request.POST.get("confirm") == "all"):
+            error = f"Choose an author or category, or confirm acting on every {status} blog."
+            if not request.accepts("text/html"):
+                return JsonResponse({"error": error}, status=400)
+            messages.error(request, error)
+            return redirect(_moderation_url(status))
+
+        blogs = Blog.objects.filter(status=status)
+        if author:
+            blogs = blogs.filter(author__username=author)
+        if category:
+            blogs = blogs.filter(category=category)
+        requested = None
+    else:
+        ids = [value for value in request.POST.getlist("ids") if value.isdigit()]
+        blogs = Blog.objects.filter(pk__in=ids)
+        requested = len(ids)
 
-    blog.status = "rejected"
-    blog.save()
+    result = moderate(blogs, action, request.user)
+    updated = result["updated"]
+    if requested is not None:
+        result["skipped"] = requested - updated
 
-    messages.warning(request, f"Blog '{blog.title}' rejected.")
-    return redirect("adminpanel:pending_blogs")
+    if not request.accepts("text/html"):
+        return JsonResponse(result)
+
+    verb = "Approved" if action == "approve" else "Rejected"
+    message = f"{verb} {updated} blog{pluralize(updated)}."
+    if result.get("skipped"):
+        message += f" {result['skipped']} skipped (already {result['status']} or not found)."
+    if updated:
+        messages.success(request, message)
+    else:
+        messages.info(request, message)
+    return redirect(_moderation_url(status))
 
 
 @staff_member_required
 def admin_dashboard(request):
+    """
+    Moderation queue: one tab per status. Tab counts are read from the
+    materialized counters (dashboard/stats.py) rather than counted; only
+    the selected tab's page is loaded, keyset paginated, so the page costs
+    the same however large the archive is.
+    """
+    status = request.GET.get("status")
+    if status not in MODERATION_STATUSES:
+        status = "pending"
 
-    pending_blogs = Blog.objects.filter(status="pending").order_by("-created_at")
-
-    published_blogs = Blog.objects.filter(status="published").order_by("-created_at")
+    counts = site_statistics().get("blogs.status", {})
+    labels = dict(Blog.STATUS_CHOICES)
+    tabs = [(value, labels[value], counts.get(value, 0)) for value in MODERATION_STATUSES]
 
-    rejected_blogs = Blog.objects.filter(status="rejected").order_by("-created_at")
+    paginator = CursorPaginator(
+        Blog.objects.for_moderation(status),
+        20,
+        count=counts.get(status, 0),
+    )
+    blogs = paginator.page_from_request(request)
 
     context = {
-        "pending_blogs": pending_blogs,
-        "published_blogs": published_blogs,
-        "rejected_blogs": rejected_blogs,
+        "status": status,
+        "tabs": tabs,
+        "blogs": blogs,
+        "page_obj": blogs,
+        "category_choices": Blog.CATEGORY_CHOICES,
+    }
+
+    return render(request, "moderation_dashboard.html", context)
+
+
+@staff_member_required
+@require_GET
+def export_data(request, dataset):
+    """
+    Stream `dataset` ("blogs" or "users") as a download. GET parameters:
+    `format` (ndjson or csv), `gzip=1`, `since`/`until` (YYYY-MM-DD,
+    inclusive) and the dataset's filters: `status`/`category` for blogs,
+    `role`/`active` (1 or 0) for users.
+    """
+    fmt = request.GET.get("format", "ndjson")
+    gzip = request.GET.get("gzip") == "1"
+    filters = {
+        key: request.GET.get(key)
+        for key in ("since", "until", "status", "category", "role", "active")
+        if request.GET.get(key)
     }
+    try:
+        blocks = stream_export(dataset, fmt, gzip, **filters)
+    except ExportError as exc:
+        return HttpResponseBadRequest(str(exc))
 
-    return render(request, "admin_dashboard.html", context)
\ No newline at end of file
+    response = StreamingHttpResponse(
+        blocks,
+        content_type="application/gzip" if gzip else FORMATS[fmt],
+    )
+    filename = export_filename(dataset, fmt, gzip)
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
@@ -0,0 +1,122 @@
+# api/management/commands/benchmark_api.py
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+
+from accounts.models import CustomUser
+from api.serializers import BlogSerializer
+from blogs.models import Blog
+
+# (label, ?fields= value or None for every field)
+FIELDSETS = (
+    ("all fields", None),
+    ("listing", "id,title,excerpt,category,author,created_at"),
+    ("ids and titles", "id,title"),
+)
+
+
+def queryset_for(fields):
+    columns = BlogSerializer.columns(fields)
+    blogs = Blog.objects.filter(status="published").only(*columns, "created_at")
+    if fields is None or "author" in fields:
+        blogs = blogs.select_related("author")
+    return blogs.order_by("-created_at", "-id")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure API serialization throughput (objects per second, with and "
+        "without sparse fieldsets) and the cost of one page end to end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Insert this many synthetic published blogs first (rolled back afterwards).",
+        )
+        parser.add_argument(
+            "--content-size",
+            type=int,
+            default=5_000,
+            help="Characters of content per synthetic blog.",
+        )
+        parser.add_argument(
+            "--objects",
+            type=int,
+            default=1000,
+            help="Blogs serialized per run.",
+        )
+        parser.add_argument("--runs", type=int, default=5)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options["seed"]:
+                self._seed(options["seed"], options["content_size"])
+
+            self.stdout.write(
+                f"{'fieldset':<18}{'objects':>8}{'objects/s':>12}{'bytes/object':>14}"
+                f"{'page ms':>10}{'queries':>9}"
+            )
+            for label, fields in FIELDSETS:
+                self._report(label, fields, options["objects"], options["runs"])
+
+            transaction.set_rollback(True)
+
+    def _report(self, label, fields, count, runs):
+        parsed = BlogSerializer.parse_fields(fields)
+        blogs = list(queryset_for(parsed)[:count])
+        if not blogs:
+            self.stdout.write(self.style.WARNING("No published blogs to serialize."))
+            return
+
+        renderer = JSONRenderer()
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            data = BlogSerializer(blogs, many=True, context={"fields": parsed}).data
+            payload = renderer.render(data)
+            timings.append(time.perf_counter() - started)
+        per_second = len(blogs) / statistics.median(timings)
+
+        url = "/api/blogs/" + (f"?fields={fields}" if fields else "")
+        client = Client()
+        page_timings = []
+        for _ in range(runs):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                client.get(url, HTTP_ACCEPT="application/json", HTTP_HOST="localhost")
+                page_timings.append(time.perf_counter() - started)
+
+        self.stdout.write(
+            f"{label:<18}{len(blogs):>8}{per_second:>12,.0f}"
+            f"{len(payload) // len(blogs):>14,}"
+            f"{1000 * statistics.median(page_timings):>10.1f}"
+            f"{len(queries.captured_queries):>9}"
+        )
+
+    def _seed(self, count, content_size):
+        author, _ = CustomUser.objects.get_or_create(
+            username="benchmark-author",
+            defaults={"email": "benchmark-author@example.com"},
+        )
+        body = ("Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * (
+            content_size // 57 + 1
+        ))[:content_size]
+        Blog.objects.bulk_create(
+            Blog(
+                title=f"Benchmark post {i}",
+                content=body,
+                excerpt=body[:200],
+                content_html=f"<p>{body}</p>",
+                author=author,
+                status="published",
+            )
+            for i in range(count)
+        )
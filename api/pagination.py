@@ -0,0 +1,58 @@
+# api/pagination.py
+"""
+Keyset pagination for the API, built on core.pagination.CursorPaginator:
+pages are addressed by opaque `cursor` tokens over a unique ordering, so
+a page costs the same however deep a client reads, and no COUNT(*) is
+ever run.
+"""
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+
+from core.pagination import CursorPaginator
+
+
+class KeysetPagination(BasePagination):
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = "page_size"
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        paginator = CursorPaginator(
+            queryset,
+            self.get_page_size(request),
+            ordering=getattr(view, "ordering", self.ordering),
+            query_params=request.query_params,
+        )
+        self.page = paginator.page_from_request(request)
+        return list(self.page)
+
+    def _link(self, query):
+        if query is None:
+            return None
+        return self.request.build_absolute_uri(self.request.path + query)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self._link(self.page.next_query),
+            "previous": self._link(self.page.previous_query),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,109 @@
+# api/serializers.py
+"""
+Read-only serializers for the public API.
+
+Each serializer declares, per field, the model columns it reads. The views
+pass `?fields=` through the serializer context: unrequested fields are
+dropped from the output and their columns are never loaded (so a client
+that skips `content` never makes the database read it). Related authors
+are always joined in the same query, never fetched per object.
+"""
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from accounts.models import CustomUser
+from blogs.models import Blog
+
+
+class SparseFieldsetSerializer(serializers.ModelSerializer):
+    """
+    Base class for `?fields=` support. Subclasses list, in
+    Meta.columns, the columns (relative to the model) each field needs.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = self.context.get("fields")
+        if fields:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def parse_fields(cls, raw):
+        """
+        The field names in a comma-separated `?fields=` value, or None for
+        all fields. Unknown names are a 400, not silently ignored.
+        """
+        if not raw:
+            return None
+        fields = [name.strip() for name in raw.split(",") if name.strip()]
+        unknown = [name for name in fields if name not in cls.Meta.columns]
+        if unknown:
+            raise ValidationError(
+                {"fields": f"Unknown field(s): {', '.join(unknown)}."}
+            )
+        return fields
+
+    @classmethod
+    def columns(cls, fields=None):
+        """Columns to pass to only() for `fields` (None: every field)."""
+        columns = []
+        for name in fields or cls.Meta.fields:
+            for column in cls.Meta.columns[name]:
+                if column not in columns:
+                    columns.append(column)
+        return columns
+
+
+class AuthorSummarySerializer(serializers.ModelSerializer):
+    """An author as embedded in a blog."""
+
+    class Meta:
+        model = CustomUser
+        fields = ("id", "username", "profile_image")
+        read_only_fields = fields
+
+
+class AuthorSerializer(SparseFieldsetSerializer):
+    class Meta:
+        model = CustomUser
+        fields = ("id", "username", "profile_image", "date_joined")
+        read_only_fields = fields
+        columns = {
+            "id": ("id",),
+            "username": ("username",),
+            "profile_image": ("profile_image",),
+            "date_joined": ("date_joined",),
+        }
+
+
+class BlogSerializer(SparseFieldsetSerializer):
+    author = AuthorSummarySerializer(read_only=True)
+
+    class Meta:
+        model = Blog
+        fields = (
+            "id",
+            "title",
+            "excerpt",
+            "content",
+            "content_html",
+            "category",
+            "image",
+            "author",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = fields
+        columns = {
+            "id": ("id",),
+            "title": ("title",),
+            "excerpt": ("excerpt",),
+            "content": ("content",),
+            "content_html": ("content_html",),
+            "category": ("category",),
+            "image": ("image",),
+            "author": ("author", "author__username", "author__profile_image"),
+            "created_at": ("created_at",),
+            "updated_at": ("updated_at",),
+        }
@@ -0,0 +1,78 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from accounts.models import CustomUser
+from blogs.models import Blog
+
+
+class BlogApiTests(TestCase):
+    """/api/blogs/"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = CustomUser.objects.create_user("writer", "writer@example.com")
+        other = CustomUser.objects.create_user("other", "other@example.com")
+        for title, author, category, status in (
+            ("Trip", cls.author, "Travel", "published"),
+            ("Gym", cls.author, "Health", "published"),
+            ("Beach", other, "Travel", "published"),
+            ("Draft", cls.author, "Travel", "draft"),
+        ):
+            Blog.objects.create(
+                title=title, content="Hello", author=author, category=category, status=status
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def _titles(self, **params):
+        return [blog["title"] for blog in self.client.get("/api/blogs/", params).json()["results"]]
+
+    def test_only_published_blogs_newest_first(self):
+        self.assertEqual(self._titles(), ["Beach", "Gym", "Trip"])
+
+    def test_filters(self):
+        self.assertEqual(self._titles(author=self.author.pk), ["Gym", "Trip"])
+        self.assertEqual(self._titles(category="Travel"), ["Beach", "Trip"])
+        self.assertEqual(self._titles(author=self.author.pk, category="Travel"), ["Trip"])
+
+    def test_sparse_fields_and_cursor(self):
+        response = self.client.get("/api/blogs/", {"fields": "id,title", "page_size": 2})
+        body = response.json()
+        self.assertEqual(set(body["results"][0]), {"id", "title"})
+        self.assertIsNone(body["previous"])
+
+        rest = self.client.get(body["next"]).json()
+        self.assertEqual([blog["title"] for blog in rest["results"]], ["Trip"])
+        self.assertIsNone(rest["next"])
+
+
+class AuthorApiTests(TestCase):
+    """/api/authors/"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = CustomUser.objects.create_user("writer", "writer@example.com")
+        CustomUser.objects.create_user("reader", "reader@example.com")
+        Blog.objects.create(title="Post", content="Hello", author=cls.author, status="published")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_lists_authors_of_published_blogs(self):
+        response = self.client.get("/api/authors/")
+        self.assertEqual(
+            [author["username"] for author in response.json()["results"]], ["writer"]
+        )
+
+    def test_unchanged_list_is_revalidated_without_queries(self):
+        etag = self.client.get("/api/authors/")["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/authors/", headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+
+        self.author.username = "renamed"
+        self.author.save()
+        response = self.client.get("/api/authors/", headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"][0]["username"], "renamed")
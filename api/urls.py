@@ -0,0 +1,12 @@
+# api/urls.py
+from rest_framework.routers import DefaultRouter
+
+from . import views
+
+app_name = "api"
+
+router = DefaultRouter()
+router.register("blogs", views.BlogViewSet, basename="blog")
+router.register("authors", views.AuthorViewSet, basename="author")
+
+urlpatterns = router.urls
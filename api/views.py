@@ -0,0 +1,120 @@
+# api/views.py
+import hashlib
+from functools import cached_property
+
+from django.db.models import Exists, OuterRef
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition, etag
+from rest_framework import viewsets
+
+from accounts.cache import users_version
+from accounts.models import CustomUser
+from blogs.cache import published_last_modified, published_version
+from blogs.models import Blog
+
+from .pagination import KeysetPagination
+from .serializers import AuthorSerializer, BlogSerializer
+
+
+def _etag(request, *versions):
+    parts = (
+        "api",
+        request.path,
+        *versions,
+        request.GET.urlencode(),
+        request.headers.get("Accept", ""),
+    )
+    return hashlib.md5(":".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def blogs_etag(request, *args, **kwargs):
+    """
+    Every blog write bumps the published version (blogs/cache.py), so an
+    unchanged version means an unchanged response: clients revalidating
+    with If-None-Match get a 304 before any query runs.
+    """
+    return _etag(request, published_version())
+
+
+def authors_etag(request, *args, **kwargs):
+    """
+    Which users are listed depends on the published blogs, what is shown
+    about them on the users version (accounts/cache.py); both are counters
+    in the cache, so a 304 again costs no query.
+    """
+    return _etag(request, published_version(), users_version())
+
+
+def blogs_last_modified(request, *args, **kwargs):
+    return published_last_modified()
+
+
+class SparseFieldsetMixin:
+    """Read `?fields=` once and hand it to the serializer."""
+
+    @cached_property
+    def requested_fields(self):
+        return self.get_serializer_class().parse_fields(
+            self.request.query_params.get("fields")
+        )
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"] = self.requested_fields
+        return context
+
+    def get_columns(self):
+        # The cursor is built from the ordering columns, so always load them
+        columns = self.get_serializer_class().columns(self.requested_fields)
+        for name in self.ordering:
+            name = name.lstrip("-")
+            if name not in columns:
+                columns.append(name)
+        return columns
+
+
+@method_decorator(
+    condition(etag_func=blogs_etag, last_modified_func=blogs_last_modified),
+    name="dispatch",
+)
+class BlogViewSet(SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Published blogs, newest first. Filter with `?author=<id>` and
+    `?category=`; choose fields with `?fields=id,title,excerpt,...`.
+    """
+
+    serializer_class = BlogSerializer
+    pagination_class = KeysetPagination
+    ordering = ("-created_at", "-id")
+
+    def get_queryset(self):
+        blogs = Blog.objects.filter(status="published").only(*self.get_columns())
+        if self.requested_fields is None or "author" in self.requested_fields:
+            blogs = blogs.select_related("author")
+
+        params = self.request.query_params
+        if params.get("author", "").isdigit():
+            blogs = blogs.filter(author_id=params["author"])
+        if params.get("category"):
+            blogs = blogs.filter(category=params["category"])
+        return blogs.order_by(*self.ordering)
+
+
+@method_decorator(etag(authors_etag), name="dispatch")
+class AuthorViewSet(SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Users with at least one published blog, newest first. Their blogs are
+    at /api/blogs/?author=<id>.
+    """
+
+    serializer_class = AuthorSerializer
+    pagination_class = KeysetPagination
+    ordering = ("-date_joined", "-id")
+
+    def get_queryset(self):
+        published = Blog.objects.filter(author=OuterRef("pk"), status="published")
+        return (
+            CustomUser.objects.filter(Exists(published))
+            .only(*self.get_columns())
+            .order_by(*self.ordering)
+        )
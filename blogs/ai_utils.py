@@ -1,24 +1,347 @@
-from openai import OpenAI
+# blogs/ai_utils.py
+"""
+Blog category classification.
 
-client = OpenAI(api_key="YOUR_OPENAI_API_KEY")
+The backend is chosen with the BLOG_CATEGORY_BACKEND setting (a dotted
+path); the default calls the OpenAI API. HybridCategoryBackend answers
+from the local model in blogs/classifier.py and only sends posts it is
+unsure about to the remote backend. Results are memoized by a hash of
+title + content, and whatever a backend returns is validated against
+Blog.CATEGORY_CHOICES, falling back to DEFAULT_CATEGORY.
 
+Views never classify inline: they call schedule_category_detection(),
+which queues a job (blogs.tasks) and returns immediately. The a-prefixed
+functions are the async-safe equivalents for async code.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+from functools import lru_cache
 
-def detect_blog_category(title, content):
-    text = f"{title}\n{content}"
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from core.instrumentation import record_cache
+
+from .cache import bump_published_version
+from .models import Blog
+from .signals import blogs_recategorized
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATEGORY = "General"
+
+# Seconds to wait for a remote classification before giving up.
+DEFAULT_TIMEOUT = 10
+
+# How long a memoized classification is kept (seconds).
+MEMO_TIMEOUT = 60 * 60 * 24 * 30
+
+# Characters of content sent per post; the opening is enough to classify.
+MAX_CONTENT_CHARS = 4000
+
+# Local predictions below this probability go to the remote backend.
+DEFAULT_MIN_CONFIDENCE = 0.6
+
+
+def category_names():
+    return [value for value, _ in Blog.CATEGORY_CHOICES]
+
+
+def normalize_category(label):
+    """
+    Map a backend's answer onto a valid category (case-insensitively), or
+    None if it names none of them.
+    """
+    if not label:
+        return None
+    cleaned = label.strip().strip(".\"'").lower()
+    for name in category_names():
+        if name.lower() == cleaned:
+            return name
+    return None
+
+
+def content_key(title, content):
+    text = f"{title}\n{content}".encode("utf-8")
+    return f"blogs:category:{hashlib.sha256(text).hexdigest()}"
+
+
+class BaseCategoryBackend:
+    """
+    Backends implement classify_batch(); each item is a (title, content)
+    pair and the result is one label per item, in order. None (or any
+    label that is not a category) marks an item the backend could not
+    classify: it gets DEFAULT_CATEGORY for now but is not memoized, so
+    the next call tries again.
+    """
+
+    def classify_batch(self, items):
+        raise NotImplementedError
+
+
+class KeywordCategoryBackend(BaseCategoryBackend):
+    """
+    Local, offline stand-in for tests and development: picks the category
+    whose keywords occur most often. Never touches the network.
+    """
+
+    KEYWORDS = {
+        "Technology": ("software", "python", "django", "code", "computer", "ai", "app", "data"),
+        "Education": ("school", "student", "learn", "teacher", "course", "study", "exam"),
+        "Health": ("health", "doctor", "diet", "fitness", "exercise", "sleep", "medical"),
+        "Travel": ("travel", "trip", "flight", "hotel", "beach", "city", "tour"),
+        "Business": ("business", "market", "startup", "finance", "sales", "company", "money"),
+        "Lifestyle": ("lifestyle", "home", "fashion", "food", "recipe", "family", "hobby"),
+        "Sports": ("sport", "football", "cricket", "match", "team", "player", "score"),
+    }
+
+    _word_re = re.compile(r"[a-z]+")
+
+    def classify_batch(self, items):
+        labels = []
+        for title, content in items:
+            words = self._word_re.findall(f"{title} {content}".lower())
+            scores = {
+                category: sum(words.count(keyword) for keyword in keywords)
+                for category, keywords in self.KEYWORDS.items()
+            }
+            best = max(scores, key=scores.get)
+            labels.append(best if scores[best] else DEFAULT_CATEGORY)
+        return labels
+
+
+class OpenAICategoryBackend(BaseCategoryBackend):
+    """
+    Remote classification through the OpenAI Responses API. Several posts
+    go into one request; the model answers with a JSON list of labels.
+    """
+
+    model = "gpt-4.1-mini"
+
+    def __init__(self):
+        self.timeout = getattr(settings, "BLOG_CATEGORY_TIMEOUT", DEFAULT_TIMEOUT)
+
+    @property
+    def client(self):
+        # Imported lazily: the SDK is heavy and only needed when classifying
+        return _openai_client(self.timeout)
+
+    def classify_batch(self, items):
+        posts = "\n\n".join(
+            f"Blog {number}:\n{title}\n{content[:MAX_CONTENT_CHARS]}"
+            for number, (title, content) in enumerate(items, start=1)
+        )
+        prompt = f"""
+    Classify each blog into ONE category only:
+    {", ".join(category_names())}.
+
+    {posts}
+
+    Return only a JSON list of category names, one per blog, in order.
+    """
+
+        response = self.client.responses.create(model=self.model, input=prompt)
+        text = response.output[0].content[0].text.strip()
+        try:
+            labels = json.loads(text)
+        except ValueError:
+            labels = [line for line in text.splitlines() if line.strip()]
+        if not isinstance(labels, list) or len(labels) != len(items):
+            logger.warning("Unexpected classification response: %r", text[:200])
+            return [None] * len(items)
+        return [str(label) for label in labels]
+
+
+class LocalCategoryBackend(BaseCategoryBackend):
+    """
+    The local model trained by `manage.py train_category_model`. Every
+    post gets its most likely category; without a trained model nothing
+    is classified (every label is None).
+    """
+
+    def predict(self, items):
+        """(label, confidence) per item, or None if no model is trained."""
+        # Imported lazily: NumPy is only needed when classifying
+        from .classifier import get_model
 
-    prompt = f"""
-    Classify this blog into ONE category only:
-    Technology, Education, Health, Travel, Business, Lifestyle, Sports, General.
+        model = get_model()
+        if model is None:
+            return None
+        return model.predict_batch(items)
 
-    Blog:
-    {text}
+    def classify_batch(self, items):
+        predictions = self.predict(items)
+        if predictions is None:
+            logger.warning("No local category model; run manage.py train_category_model")
+            return [None] * len(items)
+        return [label for label, _ in predictions]
 
-    Return only category name.
+
+class HybridCategoryBackend(LocalCategoryBackend):
+    """
+    Local model first; posts predicted with less than
+    BLOG_CATEGORY_MIN_CONFIDENCE go to BLOG_CATEGORY_REMOTE_BACKEND in a
+    single batch. If the remote call fails, the local guesses stand.
     """
 
-    response = client.responses.create(
-        model="gpt-4.1-mini",
-        input=prompt
+    def __init__(self):
+        self.min_confidence = getattr(
+            settings, "BLOG_CATEGORY_MIN_CONFIDENCE", DEFAULT_MIN_CONFIDENCE
+        )
+        remote_path = getattr(
+            settings, "BLOG_CATEGORY_REMOTE_BACKEND", "blogs.ai_utils.OpenAICategoryBackend"
+        )
+        self.remote = import_string(remote_path)()
+
+    def classify_batch(self, items):
+        predictions = self.predict(items)
+        if predictions is None:
+            return self.remote.classify_batch(items)
+
+        labels = [label for label, _ in predictions]
+        unsure = [
+            index
+            for index, (_, confidence) in enumerate(predictions)
+            if confidence < self.min_confidence
+        ]
+        if unsure:
+            try:
+                remote_labels = self.remote.classify_batch([items[index] for index in unsure])
+            except Exception:
+                logger.exception("Remote classification failed; keeping local predictions")
+            else:
+                for index, label in zip(unsure, remote_labels):
+                    if normalize_category(label) is not None:
+                        labels[index] = label
+        return labels
+
+
+@lru_cache(maxsize=None)
+def _openai_client(timeout):
+    from openai import OpenAI
+
+    return OpenAI(api_key=os.environ.get("OPENAI_API_KEY"), timeout=timeout, max_retries=1)
+
+
+@lru_cache(maxsize=None)
+def get_category_backend():
+    backend_path = getattr(
+        settings, "BLOG_CATEGORY_BACKEND", "blogs.ai_utils.OpenAICategoryBackend"
     )
+    return import_string(backend_path)()
+
+
+def classify_batch(items, backend=None):
+    """
+    Classify (title, content) pairs, in order. Memoized results are reused
+    and only the remaining posts are sent to the backend, in one call.
+    Backend failures (including timeouts) yield DEFAULT_CATEGORY and are
+    retried on the next call.
+    """
+    items = list(items)
+    keys = [content_key(title, content) for title, content in items]
+    known = cache.get_many(keys)
+    record_cache(hits=len(known), misses=len(keys) - len(known))
+
+    fresh = _classify_missing(items, keys, known, backend)
+    if fresh:
+        cache.set_many(fresh, MEMO_TIMEOUT)
+    return [known[key] for key in keys]
+
+
+async def aclassify_batch(items, backend=None):
+    """
+    classify_batch() for async code. The memo is read and written with
+    the async cache API; the backend call (an HTTP request or model
+    inference, both blocking) runs in a thread of its own, so it stalls
+    neither the event loop nor the ORM's shared sync thread.
+    """
+    items = list(items)
+    keys = [content_key(title, content) for title, content in items]
+    known = await cache.aget_many(keys)
+    record_cache(hits=len(known), misses=len(keys) - len(known))
+
+    fresh = await sync_to_async(_classify_missing, thread_sensitive=False)(
+        items, keys, known, backend
+    )
+    if fresh:
+        await cache.aset_many(fresh, MEMO_TIMEOUT)
+    return [known[key] for key in keys]
+
+
+def _classify_missing(items, keys, known, backend=None):
+    """
+    Classify the items whose key is not in `known`, adding them to it.
+    Returns the new labels worth memoizing (not the failures).
+    """
+    missing = [index for index, key in enumerate(keys) if key not in known]
+    if not missing:
+        return {}
+    backend = backend or get_category_backend()
+    try:
+        labels = backend.classify_batch([items[index] for index in missing])
+    except Exception:
+        logger.exception("Category classification failed for %d posts", len(missing))
+        labels = [None] * len(missing)
+
+    fresh = {}
+    for index, label in zip(missing, labels):
+        category = normalize_category(label)
+        known[keys[index]] = category or DEFAULT_CATEGORY
+        if category is not None:
+            fresh[keys[index]] = category
+    return fresh
+
+
+def detect_blog_category(title, content):
+    return classify_batch([(title, content)])[0]
+
+
+async def adetect_blog_category(title, content):
+    return (await aclassify_batch([(title, content)]))[0]
+
+
+def classify_blogs(blog_ids, batch_size=10):
+    """
+    Fill in the category of the given blogs, `batch_size` posts per
+    backend call. Runs on the job queue worker.
+    """
+    blogs = list(Blog.objects.filter(pk__in=blog_ids).only("pk", "title", "content", "category"))
+    changes = {}
+    for start in range(0, len(blogs), batch_size):
+        batch = blogs[start:start + batch_size]
+        labels = classify_batch((blog.title, blog.content) for blog in batch)
+        for blog, label in zip(batch, labels):
+            if label != blog.category:
+                # update() so the save hooks (search index, derivatives) don't re-run
+                Blog.objects.filter(pk=blog.pk).update(
+                    category=label, updated_at=timezone.now()
+                )
+                key = (blog.category, label)
+                changes[key] = changes.get(key, 0) + 1
+    if changes:
+        bump_published_version()
+        blogs_recategorized.send(sender=Blog, changes=changes)
+    return sum(changes.values())
+
+
+def schedule_category_detection(blog):
+    """
+    Called from create_blog/blog_update after saving: the request returns
+    at once (the blog keeps its current category, "General" for new posts)
+    and the category is filled in later.
+    """
+    from .tasks import classify_blogs_task
+
+    classify_blogs_task.enqueue(blog_ids=[blog.pk], dedup_key=f"classify:{blog.pk}")
+
 
-    return response.output[0].content[0].text.strip()
+async def aschedule_category_detection(blog):
+    """schedule_category_detection() for async views (the enqueue is an INSERT)."""
+    await sync_to_async(schedule_category_detection)(blog)
@@ -0,0 +1,92 @@
+# blogs/async_views.py
+"""
+Native async versions of the read-only blog pages, served under ASGI
+(central_platform/urls_asgi.py); WSGI keeps blogs/views.py. Same
+behaviour, queries and templates as the sync views, but the ORM and the
+cache are used through their async APIs, so a request is not handed to
+a worker thread as a whole.
+
+request.user is resolved up front (conditional.aresolve_user), so the
+templates, which read it, never query.
+"""
+from django.http import Http404
+from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from core.pagination import CursorPaginator
+
+from .cache import aget_or_render
+from .conditional import (
+    adetail_etag,
+    adetail_last_modified,
+    alist_etag,
+    alist_last_modified,
+    aresolve_user,
+    async_condition,
+)
+from .models import Blog
+from .search import asearch_blogs
+
+
+@async_condition(etag_func=alist_etag, last_modified_func=alist_last_modified)
+async def blog_list(request):
+    """Async blogs.views.blog_list."""
+    query = request.GET.get("q")
+    user = await aresolve_user(request)
+
+    async def render_results():
+        blogs = Blog.objects.for_listing(user)
+        statuses = None
+        if not user.is_authenticated or not user.is_staff:
+            statuses = ["published"]
+
+        if query:
+            blogs = await asearch_blogs(blogs, query, statuses=statuses)
+            paginator = CursorPaginator(
+                blogs, 5, ordering=("search_rank", "-created_at", "-id")
+            )
+        else:
+            paginator = CursorPaginator(blogs, 5)
+        page_obj = await paginator.page_from_request(request).aload()
+        if page_obj.has_other_pages():
+            await paginator.aapproximate_count()
+
+        return render_to_string(
+            "blog_list_results.html",
+            {
+                "blogs": page_obj,
+                "page_obj": page_obj,
+                "query": query or "",
+            },
+            request=request,
+        )
+
+    results = await aget_or_render("blog_list", request, render_results)
+
+    return render(
+        request,
+        "blog_list.html",
+        {
+            "results": mark_safe(results),
+            "query": query or "",
+        },
+    )
+
+
+@async_condition(etag_func=adetail_etag, last_modified_func=adetail_last_modified)
+async def blog_detail(request, pk):
+    """Async blogs.views.blog_detail."""
+    user = await aresolve_user(request)
+    try:
+        blog = await Blog.objects.for_detail().aget(pk=pk)
+    except Blog.DoesNotExist:
+        raise Http404("Blog not found")
+
+    if blog.status != "published":
+        if not user.is_authenticated:
+            raise Http404("Blog not found")
+        if user.pk != blog.author_id and getattr(user, "role", "user") != "admin":
+            raise Http404("Blog not found")
+
+    return render(request, "blog_detail.html", {"blog": blog})
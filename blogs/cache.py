@@ -0,0 +1,215 @@
+# blogs/cache.py
+"""
+Versioned fragment cache for public blog pages.
+
+Every cached fragment key embeds a global "published blogs version". The
+Blog post_save/post_delete signals (blogs/signals.py) bump that counter,
+so one cache write invalidates every fragment at once: old keys are simply
+never read again and expire on their own TTL. No key scans are needed.
+
+Only anonymous requests are served from the cache; logged-in users see
+role-dependent markup and always get a fresh render.
+
+Per-author status summaries for the user dashboard are cached under one
+key per author, deleted by the same signals whenever that author's blogs
+change.
+
+The a-prefixed functions are the same for async views (blogs/async_views.py),
+using the async cache API.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils import timezone
+
+from core.instrumentation import record_cache
+
+from .models import Blog
+
+VERSION_KEY = "blogs:published:version"
+MODIFIED_KEY = "blogs:published:modified"
+STATS_KEY = "blogs:fragment:{name}:{outcome}"
+AUTHOR_SUMMARY_KEY = "blogs:author:{author_id}:summary"
+
+# Upper bound on how stale a summary can get if an invalidation is missed.
+AUTHOR_SUMMARY_TIMEOUT = 3600
+
+# Seconds each view's fragments live, overridable per view in settings.
+DEFAULT_TIMEOUTS = {
+    "blog_list": 60,
+    "home": 30,
+}
+
+
+def get_timeout(name):
+    timeouts = {**DEFAULT_TIMEOUTS, **getattr(settings, "BLOG_FRAGMENT_CACHE_TIMEOUTS", {})}
+    return timeouts.get(name, 60)
+
+
+def published_version():
+    version = cache.get(VERSION_KEY)
+    record_cache(hits=version is not None, misses=version is None)
+    if version is None:
+        # Seed from the clock so a version lost to eviction or a restart
+        # never repeats an old one.
+        cache.add(VERSION_KEY, int(time.time() * 1000), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+async def apublished_version(request=None):
+    """
+    Async published_version(). Every cache call is a thread hop with
+    Django's backends, so the version is memoized on `request`: the ETag
+    and the fragment lookup share one read.
+    """
+    version = getattr(request, "_published_version", None)
+    if version is not None:
+        return version
+    version = await cache.aget(VERSION_KEY)
+    record_cache(hits=version is not None, misses=version is None)
+    if version is None:
+        await cache.aadd(VERSION_KEY, int(time.time() * 1000), None)
+        version = await cache.aget(VERSION_KEY)
+    if request is not None:
+        request._published_version = version
+    return version
+
+
+def bump_published_version():
+    cache.set(MODIFIED_KEY, timezone.now(), None)
+    try:
+        return cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, int(time.time() * 1000), None)
+        return cache.get(VERSION_KEY)
+
+
+def published_last_modified():
+    """
+    When any blog last changed. Recorded on every version bump, so list
+    pages get a Last-Modified without scanning for MAX(updated_at); the
+    aggregate is only run once to seed an empty cache.
+    """
+    modified = cache.get(MODIFIED_KEY)
+    record_cache(hits=modified is not None, misses=modified is None)
+    if modified is None:
+        modified = Blog.objects.aggregate(latest=Max("updated_at"))["latest"]
+        if modified is None:
+            return None
+        cache.add(MODIFIED_KEY, modified, None)
+    return modified
+
+
+async def apublished_last_modified():
+    modified = await cache.aget(MODIFIED_KEY)
+    record_cache(hits=modified is not None, misses=modified is None)
+    if modified is None:
+        modified = (await Blog.objects.aaggregate(latest=Max("updated_at")))["latest"]
+        if modified is None:
+            return None
+        await cache.aadd(MODIFIED_KEY, modified, None)
+    return modified
+
+
+def fragment_key(name, request, version=None):
+    if version is None:
+        version = published_version()
+    params = "&".join(
+        f"{key}={value}" for key, value in sorted(request.GET.items())
+    )
+    digest = hashlib.md5(params.encode()).hexdigest()
+    return f"blogs:fragment:{name}:v{version}:{digest}"
+
+
+def _record(name, outcome):
+    key = STATS_KEY.format(name=name, outcome=outcome)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        pass
+
+
+async def _arecord(name, outcome):
+    # incr first: the counter nearly always exists, saving a cache call
+    key = STATS_KEY.format(name=name, outcome=outcome)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aadd(key, 1, None)
+
+
+def fragment_stats(names=None):
+    """{view name: {"hits": n, "misses": n}} for the given (or all) views."""
+    names = names or DEFAULT_TIMEOUTS.keys()
+    return {
+        name: {
+            outcome: cache.get(STATS_KEY.format(name=name, outcome=outcome), 0)
+            for outcome in ("hits", "misses")
+        }
+        for name in names
+    }
+
+
+def get_or_render(name, request, render):
+    """
+    Return the fragment for this view and query string, calling `render()`
+    (which must return something picklable, usually HTML) on a miss.
+    """
+    if request.user.is_authenticated:
+        return render()
+
+    key = fragment_key(name, request)
+    fragment = cache.get(key)
+    record_cache(hits=fragment is not None, misses=fragment is None)
+    if fragment is not None:
+        _record(name, "hits")
+        return fragment
+
+    _record(name, "misses")
+    fragment = render()
+    cache.set(key, fragment, get_timeout(name))
+    return fragment
+
+
+async def aget_or_render(name, request, render):
+    """get_or_render() for async views: `render` is a coroutine function."""
+    user = await request.auser()
+    if user.is_authenticated:
+        return await render()
+
+    key = fragment_key(name, request, await apublished_version(request))
+    fragment = await cache.aget(key)
+    record_cache(hits=fragment is not None, misses=fragment is None)
+    if fragment is not None:
+        await _arecord(name, "hits")
+        return fragment
+
+    await _arecord(name, "misses")
+    fragment = await render()
+    await cache.aset(key, fragment, get_timeout(name))
+    return fragment
+
+
+def author_summary(author_id):
+    """
+    {status: number of blogs} for one author, zero included: one GROUP BY
+    on a miss, then served from the cache until the author's blogs change.
+    """
+    key = AUTHOR_SUMMARY_KEY.format(author_id=author_id)
+    summary = cache.get(key)
+    record_cache(hits=summary is not None, misses=summary is None)
+    if summary is None:
+        summary = Blog.objects.filter(author_id=author_id).status_counts()
+        cache.set(key, summary, AUTHOR_SUMMARY_TIMEOUT)
+    return summary
+
+
+def invalidate_author_summaries(author_ids):
+    cache.delete_many(
+        [AUTHOR_SUMMARY_KEY.format(author_id=author_id) for author_id in author_ids]
+    )
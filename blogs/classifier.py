@@ -0,0 +1,252 @@
+# blogs/classifier.py
+"""
+Local blog category classifier: hashed TF-IDF features with a multinomial
+naive Bayes model, trained from published blogs and their categories.
+
+Tokens are hashed into a fixed number of buckets (no vocabulary to store),
+so the whole model is one float32 matrix saved as a .npy file:
+
+    row 0       inverse document frequency per bucket
+    rows 1..k   log P(bucket | category) per category
+
+plus a small JSON sidecar with the labels, priors and training metadata.
+The matrix is memory-mapped when loaded, so every worker process shares
+the same pages, and predicting one post only touches the columns of the
+buckets it contains.
+
+Train with ``manage.py train_category_model``; measure accuracy and
+latency with ``manage.py benchmark_category_model``.
+"""
+import json
+import os
+import re
+import zlib
+from datetime import datetime, timezone as dt_timezone
+
+import numpy as np
+from django.conf import settings
+
+from .models import Blog
+
+DEFAULT_FEATURES = 2 ** 16
+DEFAULT_ALPHA = 0.1
+
+# Characters of content used per post, for training and prediction alike.
+MAX_CONTENT_CHARS = 4000
+
+# Title tokens are counted this many times: titles are short and on topic.
+TITLE_WEIGHT = 2
+
+_token_re = re.compile(r"[a-z0-9]+")
+
+
+def default_model_path():
+    default = settings.BASE_DIR / "category_model" / "model.npy"
+    return str(getattr(settings, "BLOG_CATEGORY_MODEL", default))
+
+
+def _meta_path(path):
+    return os.path.splitext(path)[0] + ".json"
+
+
+def tokens(title, content):
+    title_tokens = _token_re.findall(title.lower())
+    return title_tokens * TITLE_WEIGHT + _token_re.findall(content[:MAX_CONTENT_CHARS].lower())
+
+
+def hashed_counts(title, content, n_features):
+    """(bucket indexes, counts) of the post's tokens, indexes sorted."""
+    buckets = np.fromiter(
+        (zlib.crc32(token.encode()) for token in tokens(title, content)),
+        dtype=np.uint32,
+    )
+    return np.unique(buckets % n_features, return_counts=True)
+
+
+def _tfidf(buckets, counts, idf):
+    """Sublinear TF times IDF, L2-normalized."""
+    values = (1 + np.log(counts, dtype=np.float32)) * idf[buckets]
+    norm = np.linalg.norm(values)
+    return values / norm if norm else values
+
+
+def _softmax(scores):
+    exp = np.exp(scores - scores.max(axis=-1, keepdims=True))
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def _fit_temperature(scores, targets):
+    """
+    Naive Bayes scores on normalized vectors are squashed together, so raw
+    probabilities are far too flat to threshold. Pick the multiplier that
+    maximizes the likelihood of the true labels.
+    """
+    best, best_loss = 1.0, np.inf
+    for temperature in np.geomspace(0.5, 500, 120):
+        proba = _softmax(scores * temperature)
+        loss = -np.log(proba[np.arange(len(targets)), targets] + 1e-12).mean()
+        if loss < best_loss:
+            best, best_loss = float(temperature), loss
+    return best
+
+
+class CategoryModel:
+    def __init__(self, labels, matrix, log_prior, meta=None):
+        self.labels = list(labels)
+        self.matrix = matrix
+        self.log_prior = np.asarray(log_prior, dtype=np.float32)
+        self.meta = meta or {}
+        self.temperature = self.meta.get("temperature", 1.0)
+
+    @property
+    def n_features(self):
+        return self.matrix.shape[1]
+
+    @property
+    def idf(self):
+        return self.matrix[0]
+
+    @property
+    def feature_log_prob(self):
+        return self.matrix[1:]
+
+    def scores(self, title, content):
+        buckets, counts = hashed_counts(title, content, self.n_features)
+        if not len(buckets):
+            return self.log_prior.copy()
+        values = _tfidf(buckets, counts, self.idf)
+        return self.log_prior + self.feature_log_prob[:, buckets] @ values
+
+    def predict_proba(self, title, content):
+        return _softmax(self.scores(title, content) * self.temperature)
+
+    def predict(self, title, content):
+        """(label, confidence) where confidence is the label's probability."""
+        proba = self.predict_proba(title, content)
+        best = int(proba.argmax())
+        return self.labels[best], float(proba[best])
+
+    def predict_batch(self, items):
+        return [self.predict(title, content) for title, content in items]
+
+    def save(self, path):
+        """
+        Write the matrix and sidecar next to each other. Both are written
+        to temporary files first and renamed, so a worker reading the old
+        model never sees a half-written one.
+        """
+        path = str(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        matrix_tmp = path + ".tmp"
+        with open(matrix_tmp, "wb") as handle:
+            np.save(handle, np.ascontiguousarray(self.matrix, dtype=np.float32))
+        meta_tmp = _meta_path(path) + ".tmp"
+        with open(meta_tmp, "w", encoding="utf-8") as handle:
+            json.dump(
+                {**self.meta, "labels": self.labels, "log_prior": self.log_prior.tolist()},
+                handle,
+                indent=2,
+            )
+        os.replace(matrix_tmp, path)
+        os.replace(meta_tmp, _meta_path(path))
+
+    @classmethod
+    def load(cls, path):
+        path = str(path)
+        with open(_meta_path(path), encoding="utf-8") as handle:
+            meta = json.load(handle)
+        matrix = np.load(path, mmap_mode="r")
+        labels = meta.pop("labels")
+        log_prior = meta.pop("log_prior")
+        return cls(labels, matrix, log_prior, meta)
+
+
+def train(samples, n_features=DEFAULT_FEATURES, alpha=DEFAULT_ALPHA):
+    """
+    Fit a model on (title, content, label) samples. Two passes over the
+    hashed posts: document frequencies first, then per-category sums of
+    the TF-IDF vectors.
+    """
+    documents = []
+    labels = []
+    for title, content, label in samples:
+        documents.append(hashed_counts(title, content, n_features))
+        labels.append(label)
+    if not documents:
+        raise ValueError("No training samples.")
+
+    classes = sorted(set(labels))
+    class_index = {label: index for index, label in enumerate(classes)}
+
+    document_frequency = np.zeros(n_features, dtype=np.float64)
+    for buckets, _ in documents:
+        document_frequency[buckets] += 1
+    n_documents = len(documents)
+    idf = (np.log((1 + n_documents) / (1 + document_frequency)) + 1).astype(np.float32)
+
+    totals = np.zeros((len(classes), n_features), dtype=np.float64)
+    class_counts = np.zeros(len(classes), dtype=np.float64)
+    for (buckets, counts), label in zip(documents, labels):
+        row = class_index[label]
+        totals[row, buckets] += _tfidf(buckets, counts, idf)
+        class_counts[row] += 1
+
+    smoothed = totals + alpha
+    feature_log_prob = np.log(smoothed / smoothed.sum(axis=1, keepdims=True))
+    log_prior = np.log(class_counts / class_counts.sum())
+
+    # Leave-one-out scores for calibration: each post is scored as if its
+    # own vector had not been added to its category's totals.
+    targets = np.array([class_index[label] for label in labels])
+    row_sums = smoothed.sum(axis=1)
+    scores = np.empty((n_documents, len(classes)))
+    for number, ((buckets, counts), target) in enumerate(zip(documents, targets)):
+        values = _tfidf(buckets, counts, idf)
+        scores[number] = log_prior + feature_log_prob[:, buckets] @ values
+        held_out = (smoothed[target, buckets] - values) / (row_sums[target] - values.sum())
+        scores[number, target] = log_prior[target] + np.log(held_out) @ values
+
+    matrix = np.vstack([idf, feature_log_prob]).astype(np.float32)
+    meta = {
+        "trained_at": datetime.now(dt_timezone.utc).isoformat(),
+        "samples": n_documents,
+        "samples_per_label": {label: int(class_counts[class_index[label]]) for label in classes},
+        "alpha": alpha,
+        "temperature": _fit_temperature(scores, targets),
+    }
+    return CategoryModel(classes, matrix, log_prior, meta)
+
+
+def training_samples(include_general=False):
+    """
+    (title, content, category) for published blogs. "General" is left out
+    by default: it is also what unclassified posts carry, so it is noise.
+    """
+    queryset = Blog.objects.filter(status="published").order_by()
+    if not include_general:
+        queryset = queryset.exclude(category="General")
+    return queryset.values_list("title", "content", "category").iterator(chunk_size=500)
+
+
+_loaded = {}
+
+
+def get_model(path=None):
+    """
+    The saved model, memory-mapped and reused across calls; reloaded when
+    the file changes (after retraining). None if no model is trained yet.
+    """
+    path = path or default_model_path()
+    try:
+        stamp = os.stat(_meta_path(path)).st_mtime_ns, os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _loaded.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = _loaded[path] = (stamp, CategoryModel.load(path))
+    return cached[1]
+
+
+def model_size(path=None):
+    path = path or default_model_path()
+    return os.path.getsize(path) + os.path.getsize(_meta_path(path))
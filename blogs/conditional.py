@@ -0,0 +1,189 @@
+# blogs/conditional.py
+"""
+ETag / Last-Modified functions for django.views.decorators.http.condition.
+
+They run before the view and only touch a few columns (or the cache), so
+an unchanged page is answered with 304 Not Modified without fetching the
+full blog or rendering a template. Returning None disables the
+conditional check and lets the view respond normally (e.g. with a 404).
+
+Async views use async_condition() with the a-prefixed functions, which
+run the same checks through the async ORM and cache.
+"""
+import hashlib
+from functools import wraps
+
+from django.contrib.messages import get_messages
+from django.views.decorators.http import condition
+
+from .cache import (
+    apublished_last_modified,
+    apublished_version,
+    published_last_modified,
+    published_version,
+)
+from .models import Blog
+
+
+def _viewer(request):
+    """Pages differ per viewer (nav bar, admin badges, edit buttons)."""
+    user = request.user
+    if not user.is_authenticated:
+        return "anon"
+    return f"{user.pk}:{getattr(user, 'role', 'user')}:{int(user.is_staff)}"
+
+
+def _has_pending_messages(request):
+    # A 304 would leave flash messages unshown until the next full render.
+    return len(get_messages(request)) > 0
+
+
+def _etag(*parts):
+    return hashlib.md5(":".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def _detail_state(request, pk):
+    """
+    (updated_at, author_id, status) for the blog if this viewer may see it,
+    else None. Memoized on the request; both condition functions use it.
+    """
+    cache_attr = f"_blog_state_{pk}"
+    if not hasattr(request, cache_attr):
+        state = (
+            Blog.objects.filter(pk=pk)
+            .values_list("updated_at", "author_id", "status")
+            .first()
+        )
+        setattr(request, cache_attr, _visible(state, request.user))
+    return getattr(request, cache_attr)
+
+
+def _visible(state, user):
+    if state is not None and state[2] != "published":
+        if not user.is_authenticated or (
+            user.pk != state[1] and getattr(user, "role", "user") != "admin"
+        ):
+            return None
+    return state
+
+
+def detail_etag(request, pk):
+    if _has_pending_messages(request):
+        return None
+    return _detail_etag(request, pk, _detail_state(request, pk))
+
+
+def _detail_etag(request, pk, state):
+    if state is None:
+        return None
+    updated_at, author_id, status = state
+    return _etag("blog", pk, updated_at.isoformat(), author_id, status, _viewer(request))
+
+
+def detail_last_modified(request, pk):
+    if _has_pending_messages(request):
+        return None
+    state = _detail_state(request, pk)
+    if state is None:
+        return None
+    return state[0]
+
+
+def list_etag(request, *args, **kwargs):
+    """
+    The published version changes on every blog write or delete, so it
+    covers both edits and removals from the visible set.
+    """
+    if _has_pending_messages(request):
+        return None
+    return _list_etag(request, published_version())
+
+
+def _list_etag(request, version):
+    return _etag("list", request.path, version, request.GET.urlencode(), _viewer(request))
+
+
+def list_last_modified(request, *args, **kwargs):
+    if _has_pending_messages(request):
+        return None
+    return published_last_modified()
+
+
+async def aresolve_user(request):
+    """
+    Load request.user with the async ORM and keep it on the request.
+    Everything after (viewer keys, flash messages, templates) then reads
+    the user and the session from memory instead of querying.
+    """
+    request.user = await request.auser()
+    return request.user
+
+
+async def _adetail_state(request, pk):
+    cache_attr = f"_blog_state_{pk}"
+    if not hasattr(request, cache_attr):
+        state = await (
+            Blog.objects.filter(pk=pk)
+            .values_list("updated_at", "author_id", "status")
+            .afirst()
+        )
+        setattr(request, cache_attr, _visible(state, await aresolve_user(request)))
+    return getattr(request, cache_attr)
+
+
+async def adetail_etag(request, pk):
+    await aresolve_user(request)
+    if _has_pending_messages(request):
+        return None
+    return _detail_etag(request, pk, await _adetail_state(request, pk))
+
+
+async def adetail_last_modified(request, pk):
+    await aresolve_user(request)
+    if _has_pending_messages(request):
+        return None
+    state = await _adetail_state(request, pk)
+    if state is None:
+        return None
+    return state[0]
+
+
+async def alist_etag(request, *args, **kwargs):
+    await aresolve_user(request)
+    if _has_pending_messages(request):
+        return None
+    return _list_etag(request, await apublished_version(request))
+
+
+async def alist_last_modified(request, *args, **kwargs):
+    await aresolve_user(request)
+    if _has_pending_messages(request):
+        return None
+    return await apublished_last_modified()
+
+
+def async_condition(etag_func=None, last_modified_func=None):
+    """
+    condition() for async views, with coroutine ETag / Last-Modified
+    functions: they are awaited first and Django's condition() does the
+    rest (304/412 responses and headers).
+    """
+
+    def decorator(view):
+        @wraps(view)
+        async def inner(request, *args, **kwargs):
+            etag = await etag_func(request, *args, **kwargs) if etag_func else None
+            last_modified = (
+                await last_modified_func(request, *args, **kwargs)
+                if last_modified_func
+                else None
+            )
+            conditional = condition(
+                etag_func=lambda *args, **kwargs: etag,
+                last_modified_func=lambda *args, **kwargs: last_modified,
+            )(view)
+            return await conditional(request, *args, **kwargs)
+
+        return inner
+
+    return decorator
@@ -0,0 +1,80 @@
+# blogs/management/commands/benchmark_category_model.py
+import random
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from blogs.ai_utils import DEFAULT_MIN_CONFIDENCE
+from blogs.classifier import DEFAULT_ALPHA, DEFAULT_FEATURES, train, training_samples
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(int(len(ordered) * fraction + 0.5) - 1, 0))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Hold out part of the published blogs, train the local classifier on "
+        "the rest and report accuracy, how many posts clear the confidence "
+        "threshold (and would skip the remote call), and prediction latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--test-size", type=float, default=0.2, help="Held-out fraction.")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--features", type=int, default=DEFAULT_FEATURES)
+        parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+        parser.add_argument(
+            "--min-confidence",
+            type=float,
+            default=getattr(settings, "BLOG_CATEGORY_MIN_CONFIDENCE", DEFAULT_MIN_CONFIDENCE),
+        )
+        parser.add_argument("--include-general", action="store_true")
+
+    def handle(self, *args, **options):
+        samples = list(training_samples(include_general=options["include_general"]))
+        random.Random(options["seed"]).shuffle(samples)
+        held_out = int(len(samples) * options["test_size"])
+        test, training = samples[:held_out], samples[held_out:]
+        if not test or not training:
+            raise CommandError(f"Need more published, categorized blogs (found {len(samples)}).")
+
+        started = time.perf_counter()
+        model = train(training, n_features=options["features"], alpha=options["alpha"])
+        training_time = time.perf_counter() - started
+
+        timings = []
+        correct = confident = confident_correct = 0
+        for title, content, label in test:
+            started = time.perf_counter()
+            predicted, confidence = model.predict(title, content)
+            timings.append(time.perf_counter() - started)
+            correct += predicted == label
+            if confidence >= options["min_confidence"]:
+                confident += 1
+                confident_correct += predicted == label
+
+        total = len(test)
+        self.stdout.write(
+            f"Trained on {len(training):,} posts in {training_time:.2f} s; "
+            f"tested on {total:,} ({len(model.labels)} categories)."
+        )
+        self.stdout.write(f"  accuracy               {correct / total:7.1%}")
+        self.stdout.write(
+            f"  confidence >= {options['min_confidence']:.2f}     {confident / total:7.1%} of posts"
+            f" (accuracy {confident_correct / confident if confident else 0:.1%})"
+        )
+        self.stdout.write(
+            f"  remote calls needed    {total - confident:>7,} of {total:,}"
+        )
+        self.stdout.write(
+            f"  latency per post       median {statistics.median(timings) * 1e6:7.1f} us"
+            f"   p95 {percentile(timings, 0.95) * 1e6:7.1f} us"
+            f"   p99 {percentile(timings, 0.99) * 1e6:7.1f} us"
+        )
+        self.stdout.write(
+            f"  model size             {model.matrix.nbytes / 1024:7,.0f} KiB"
+        )
@@ -0,0 +1,70 @@
+# blogs/management/commands/benchmark_detail_render.py
+import statistics
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+
+from accounts.models import CustomUser
+from blogs.models import Blog
+from blogs.rendering import content_digest, render_content
+
+
+def make_blog(size):
+    """An unsaved blog with roughly `size` characters of multi-paragraph content."""
+    paragraph = (
+        "Django's template engine escapes & wraps every paragraph <again>.\n"
+        "Line breaks inside a paragraph become <br> tags.\n\n"
+    )
+    content = (paragraph * (size // len(paragraph) + 1))[:size]
+    author = CustomUser(pk=1, username="benchmark-author")
+    return Blog(
+        pk=1,
+        title="Benchmark post",
+        content=content,
+        author=author,
+        status="published",
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare blog_detail render time using the `linebreaks` filter on "
+        "every request versus the stored, pre-rendered content_html."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", type=int, default=50_000, help="Content length in characters.")
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get("/blogs/1/")
+        request.user = AnonymousUser()
+
+        live = make_blog(options["size"])
+        stored = make_blog(options["size"])
+        stored.content_html = render_content(stored.content)
+        stored.content_hash = content_digest(stored.content)
+
+        results = {}
+        for label, blog in (("linebreaks filter", live), ("stored content_html", stored)):
+            timings = []
+            for _ in range(options["iterations"]):
+                started = time.perf_counter()
+                render_to_string("blog_detail.html", {"blog": blog}, request=request)
+                timings.append(time.perf_counter() - started)
+            results[label] = timings
+
+        self.stdout.write(
+            f"{options['size']:,}-character post, {options['iterations']} renders each"
+        )
+        for label, timings in results.items():
+            self.stdout.write(
+                f"  {label:<22} median {statistics.median(timings) * 1000:8.3f} ms"
+                f"   p95 {sorted(timings)[int(len(timings) * 0.95) - 1] * 1000:8.3f} ms"
+            )
+        before = statistics.median(results["linebreaks filter"])
+        after = statistics.median(results["stored content_html"])
+        self.stdout.write(self.style.SUCCESS(f"  speedup x{before / after:.1f}"))
@@ -0,0 +1,120 @@
+# blogs/management/commands/benchmark_list_payload.py
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from accounts.models import CustomUser
+from blogs.models import Blog
+from core.pagination import CursorPaginator
+
+
+def fetched_bytes(queryset):
+    """
+    Run the queryset's SQL directly and add up the size of every value the
+    database returned. Returns (rows, bytes, seconds).
+    """
+    sql, params = queryset.query.sql_with_params()
+    started = time.perf_counter()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    elapsed = time.perf_counter() - started
+
+    total = 0
+    for row in rows:
+        for value in row:
+            if value is None:
+                continue
+            if isinstance(value, str):
+                total += len(value.encode("utf-8"))
+            elif isinstance(value, (bytes, memoryview)):
+                total += len(value)
+            else:
+                total += len(str(value))
+    return len(rows), total, elapsed
+
+
+def list_querysets(full):
+    """
+    The list page querysets: full rows (as the views used to load them) or
+    the BlogQuerySet presets the views use now.
+    """
+    author_id = Blog.objects.values_list("author_id", flat=True).first() or 0
+    if full:
+        blogs = Blog.objects.all()
+        home = blogs.filter(status="published")
+        public = blogs.filter(status="published")
+        own = blogs.filter(author_id=author_id)
+        pending = blogs.filter(status="pending")
+    else:
+        home = public = Blog.objects.for_listing()
+        own = Blog.objects.for_author(author_id)
+        pending = Blog.objects.for_moderation("pending")
+
+    yield "home", home.order_by("-created_at")[:5]
+    yield "blog_list", CursorPaginator(public, 5).page_queryset(number=1)
+    yield "dashboard_view (user)", CursorPaginator(own, 10).page_queryset(number=1)
+    yield "admin_dashboard (pending)", CursorPaginator(pending, 20).page_queryset(number=1)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare bytes fetched per list page when loading full blog rows "
+        "versus the listing presets, which skip `content` for the excerpt."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Insert this many synthetic blogs first (rolled back afterwards).",
+        )
+        parser.add_argument(
+            "--content-size",
+            type=int,
+            default=50_000,
+            help="Characters of content per synthetic blog.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options["seed"]:
+                self._seed(options["seed"], options["content_size"])
+
+            self.stdout.write(
+                f"{'page':<28}{'rows':>6}{'full bytes':>14}{'preset bytes':>16}{'saved':>8}"
+            )
+            deferred = dict(
+                (label, fetched_bytes(qs)) for label, qs in list_querysets(full=False)
+            )
+            for label, queryset in list_querysets(full=True):
+                rows, before, _ = fetched_bytes(queryset)
+                _, after, _ = deferred[label]
+                saved = 100 * (before - after) / before if before else 0
+                self.stdout.write(
+                    f"{label:<28}{rows:>6}{before:>14,}{after:>16,}{saved:>7.1f}%"
+                )
+
+            transaction.set_rollback(True)
+
+    def _seed(self, count, content_size):
+        author, _ = CustomUser.objects.get_or_create(
+            username="benchmark-author",
+            defaults={"email": "benchmark-author@example.com"},
+        )
+        body = ("Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * (
+            content_size // 57 + 1
+        ))[:content_size]
+        statuses = ["published", "published", "pending", "draft"]
+        Blog.objects.bulk_create(
+            Blog(
+                title=f"Benchmark post {i}",
+                content=body,
+                excerpt=body[:200],
+                author=author,
+                status=statuses[i % len(statuses)],
+            )
+            for i in range(count)
+        )
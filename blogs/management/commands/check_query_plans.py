@@ -0,0 +1,90 @@
+# blogs/management/commands/check_query_plans.py
+import re
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from blogs.models import Blog
+from core.pagination import CursorPaginator
+
+# Plan fragments that mean a query is reading the whole table or sorting
+# rows outside an index. Keyed by connection.vendor.
+BAD_PLAN_PATTERNS = {
+    "sqlite": [
+        re.compile(r"\bSCAN blogs_blog\b(?! USING (COVERING )?INDEX)"),
+        re.compile(r"USE TEMP B-TREE"),
+    ],
+    "postgresql": [
+        re.compile(r"Seq Scan on blogs_blog\b"),
+        re.compile(r"^\s*(->\s*)?Sort\b", re.MULTILINE),
+    ],
+}
+
+
+def view_querysets():
+    """
+    (label, queryset) pairs for the queries the list views run: the first
+    page and a cursor page of every paginated list.
+    """
+    now = timezone.now()
+    cursor = [now, 0]
+    staff = SimpleNamespace(is_authenticated=True, is_staff=True)
+
+    def pages(label, queryset, per_page):
+        paginator = CursorPaginator(queryset, per_page)
+        yield f"{label} (first page)", paginator.page_queryset(number=1)
+        yield f"{label} (next page)", paginator.page_queryset(after=cursor)
+        yield f"{label} (previous page)", paginator.page_queryset(before=cursor)
+
+    yield "home", Blog.objects.for_listing()[:5]
+    yield from pages("blog_list (public)", Blog.objects.for_listing(), 5)
+    yield from pages("blog_list (staff)", Blog.objects.for_listing(staff), 5)
+    yield "dashboard_view (admin)", Blog.objects.for_listing(staff)[:5]
+    yield from pages("dashboard_view (user)", Blog.objects.for_author(0), 10)
+    yield "admin_dashboard (status counts)", Blog.objects.status_totals()
+    for status in ("pending", "published", "rejected"):
+        yield from pages(
+            f"admin_dashboard ({status})", Blog.objects.for_moderation(status), 20
+        )
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN on the queryset of every blog list view and fail if any "
+        "of them falls back to a full table scan or a temporary sort. "
+        "On PostgreSQL run it against representative data: the planner "
+        "prefers sequential scans on tiny tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print the full plan for every query.",
+        )
+
+    def handle(self, *args, **options):
+        patterns = BAD_PLAN_PATTERNS.get(connection.vendor)
+        if patterns is None:
+            raise CommandError(f"No plan checks defined for {connection.vendor}.")
+
+        failures = []
+        for label, queryset in view_querysets():
+            plan = queryset.explain()
+            bad = [p.pattern for p in patterns if p.search(plan)]
+            if bad:
+                failures.append(label)
+                self.stdout.write(self.style.ERROR(f"FAIL {label}"))
+                self.stdout.write(plan)
+            else:
+                self.stdout.write(self.style.SUCCESS(f"ok   {label}"))
+                if options["verbose_plans"]:
+                    self.stdout.write(plan)
+
+        if failures:
+            raise CommandError(
+                f"{len(failures)} queries use a full scan or temp sort: "
+                + ", ".join(failures)
+            )
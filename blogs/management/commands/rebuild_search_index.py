@@ -0,0 +1,26 @@
+# blogs/management/commands/rebuild_search_index.py
+from django.core.management.base import BaseCommand
+
+from blogs.models import Blog
+from blogs.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for all blogs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of blogs read and indexed per batch.",
+        )
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        total = backend.rebuild(Blog.objects.all(), chunk_size=options["chunk_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Indexed {total} blogs with {backend.__class__.__name__}."
+            )
+        )
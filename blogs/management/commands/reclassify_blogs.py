@@ -0,0 +1,179 @@
+# blogs/management/commands/reclassify_blogs.py
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from blogs.ai_utils import DEFAULT_CATEGORY, classify_batch
+from blogs.cache import bump_published_version
+from blogs.models import Blog
+from blogs.signals import blogs_recategorized
+
+
+def read_checkpoint(path):
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        raise CommandError(f"Checkpoint {path} is not valid JSON.")
+
+
+def write_checkpoint(path, state):
+    """Replace the checkpoint atomically so a crash never leaves half a file."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as handle:
+        json.dump(state, handle)
+    os.replace(tmp, path)
+
+
+class Command(BaseCommand):
+    help = (
+        "Classify existing blogs and store their category. Blogs are streamed "
+        "in primary-key order, classified by a bounded thread pool and written "
+        "back with bulk_update, one chunk at a time, so memory stays flat. "
+        "After each chunk the last primary key is saved to a checkpoint file, "
+        "and --resume continues from there."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help=f'Reclassify every blog, not only those still in "{DEFAULT_CATEGORY}".',
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Blogs read, classified and written per transaction.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10,
+            help="Blogs per classification backend call.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Classification threads.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default="reclassify_blogs.checkpoint.json",
+            help="File recording the last processed primary key.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue after the primary key stored in the checkpoint file.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Classify and report, but write neither blogs nor the checkpoint.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = max(options["chunk_size"], 1)
+        batch_size = max(options["batch_size"], 1)
+        checkpoint = options["checkpoint"]
+        dry_run = options["dry_run"]
+
+        state = {"last_pk": 0, "processed": 0, "changed": 0}
+        if options["resume"]:
+            saved = read_checkpoint(checkpoint)
+            if saved is None:
+                raise CommandError(f"No checkpoint at {checkpoint}; run without --resume.")
+            state.update(saved)
+            self.stdout.write(f"Resuming after pk {state['last_pk']}.")
+
+        queryset = Blog.objects.filter(pk__gt=state["last_pk"])
+        if not options["all"]:
+            queryset = queryset.filter(category=DEFAULT_CATEGORY)
+        remaining = queryset.count()
+        blogs = (
+            queryset.order_by("pk")
+            .only("pk", "title", "content", "category")
+            .iterator(chunk_size=chunk_size)
+        )
+
+        self.stdout.write(
+            f"{remaining:,} blogs to classify with {options['workers']} thread(s)"
+            f"{' (dry run)' if dry_run else ''}."
+        )
+        started = time.monotonic()
+        processed = changed = 0
+        counts = {}
+
+        with ThreadPoolExecutor(max_workers=max(options["workers"], 1)) as pool:
+            while True:
+                chunk = list(islice(blogs, chunk_size))
+                if not chunk:
+                    break
+
+                batches = [
+                    chunk[start:start + batch_size] for start in range(0, len(chunk), batch_size)
+                ]
+                labels = [
+                    label
+                    for batch_labels in pool.map(
+                        lambda batch: classify_batch((blog.title, blog.content) for blog in batch),
+                        batches,
+                    )
+                    for label in batch_labels
+                ]
+
+                now = timezone.now()
+                updated = []
+                changes = {}
+                for blog, label in zip(chunk, labels):
+                    counts[label] = counts.get(label, 0) + 1
+                    if label != blog.category:
+                        key = (blog.category, label)
+                        changes[key] = changes.get(key, 0) + 1
+                        blog.category = label
+                        blog.updated_at = now
+                        updated.append(blog)
+
+                processed += len(chunk)
+                changed += len(updated)
+                state["last_pk"] = chunk[-1].pk
+                state["processed"] += len(chunk)
+                state["changed"] += len(updated)
+                if not dry_run:
+                    if updated:
+                        with transaction.atomic():
+                            Blog.objects.bulk_update(updated, ["category", "updated_at"])
+                        blogs_recategorized.send(sender=Blog, changes=changes)
+                    write_checkpoint(checkpoint, state)
+
+                elapsed = time.monotonic() - started
+                rate = processed / elapsed if elapsed else 0
+                eta = (remaining - processed) / rate if rate else 0
+                self.stdout.write(
+                    f"  {processed:,}/{remaining:,} classified, {changed:,} changed, "
+                    f"{rate:,.1f} blogs/s, ETA {eta:,.0f} s, last pk {state['last_pk']}"
+                )
+
+        if changed and not dry_run:
+            bump_published_version()
+
+        elapsed = time.monotonic() - started
+        for label, count in sorted(counts.items(), key=lambda item: -item[1]):
+            self.stdout.write(f"  {label:<12} {count:>9,}")
+        verb = "Would change" if dry_run else "Changed"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {changed:,} of {processed:,} blogs in {elapsed:,.1f} s "
+                f"({processed / elapsed if elapsed else 0:,.1f} blogs/s)."
+            )
+        )
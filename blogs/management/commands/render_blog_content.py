@@ -0,0 +1,62 @@
+# blogs/management/commands/render_blog_content.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from blogs.models import Blog
+from blogs.rendering import content_digest, render_content
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill the pre-rendered HTML body (content_html) of existing blogs, "
+        "in chunks. Only rows whose content hash is missing or stale are "
+        "written unless --force is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of blogs rendered and written per transaction.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-render every blog, even if its hash is current.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        rendered = scanned = 0
+        last_pk = 0
+
+        while True:
+            chunk = list(
+                Blog.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .only("pk", "content", "content_hash")[:chunk_size]
+            )
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+            scanned += len(chunk)
+
+            stale = []
+            for blog in chunk:
+                digest = content_digest(blog.content)
+                if options["force"] or digest != blog.content_hash:
+                    blog.content_html = render_content(blog.content)
+                    blog.content_hash = digest
+                    stale.append(blog)
+
+            if stale:
+                with transaction.atomic():
+                    Blog.objects.bulk_update(stale, ["content_html", "content_hash"])
+                rendered += len(stale)
+            self.stdout.write(f"  scanned {scanned}, rendered {rendered}", ending="\r")
+
+        self.stdout.write("")
+        self.stdout.write(
+            self.style.SUCCESS(f"Rendered {rendered} of {scanned} blogs.")
+        )
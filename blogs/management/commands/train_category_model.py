@@ -0,0 +1,58 @@
+# blogs/management/commands/train_category_model.py
+from django.core.management.base import BaseCommand, CommandError
+
+from blogs.classifier import (
+    DEFAULT_ALPHA,
+    DEFAULT_FEATURES,
+    default_model_path,
+    model_size,
+    train,
+    training_samples,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Train the local category classifier on published blogs and save it "
+        "(see blogs/classifier.py). Running workers pick up the new model on "
+        "their next classification."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--features",
+            type=int,
+            default=DEFAULT_FEATURES,
+            help="Number of hash buckets (model columns).",
+        )
+        parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="Smoothing.")
+        parser.add_argument(
+            "--include-general",
+            action="store_true",
+            help='Also train on posts labelled "General".',
+        )
+        parser.add_argument("--output", help="Model path (defaults to BLOG_CATEGORY_MODEL).")
+
+    def handle(self, *args, **options):
+        samples = training_samples(include_general=options["include_general"])
+        try:
+            model = train(samples, n_features=options["features"], alpha=options["alpha"])
+        except ValueError as exc:
+            raise CommandError(f"{exc} Publish some categorized blogs first.")
+        if len(model.labels) < 2:
+            raise CommandError(
+                f"Only one category ({model.labels[0]}) in the training data; "
+                "a classifier needs at least two."
+            )
+
+        path = options["output"] or default_model_path()
+        model.save(path)
+
+        for label, count in model.meta["samples_per_label"].items():
+            self.stdout.write(f"  {label:<12} {count:>7,} posts")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Trained on {model.meta['samples']:,} posts; wrote {path} "
+                f"({model_size(path) / 1024:,.0f} KiB)."
+            )
+        )
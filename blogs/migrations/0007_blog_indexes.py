@@ -0,0 +1,35 @@
+# Generated by Django 6.0.2 on 2026-10-18 17:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0006_blog_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='blog',
+            options={'ordering': ['-created_at', '-id']},
+        ),
+        migrations.AddIndex(
+            model_name='blog',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='blog_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blog',
+            index=models.Index(fields=['author', '-created_at', '-id'], name='blog_author_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blog',
+            index=models.Index(fields=['-created_at', '-id'], name='blog_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blog',
+            index=models.Index(condition=models.Q(('status', 'published')), fields=['-created_at', '-id'], name='blog_published_created_idx'),
+        ),
+    ]
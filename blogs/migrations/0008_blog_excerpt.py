@@ -0,0 +1,52 @@
+# Generated by Django 6.0.2 on 2026-10-18 18:00
+
+from django.db import migrations, models, transaction
+from django.db.models.functions import Substr
+
+EXCERPT_LENGTH = 200
+CHUNK_SIZE = 5000
+
+
+def backfill_excerpts(apps, schema_editor):
+    """
+    Fill `excerpt` in primary-key ranges, one short transaction per chunk,
+    so large tables are never locked for the whole backfill.
+    """
+    Blog = apps.get_model("blogs", "Blog")
+    db_alias = schema_editor.connection.alias
+    blogs = Blog.objects.using(db_alias)
+
+    last_pk = 0
+    while True:
+        chunk_end = (
+            blogs.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[CHUNK_SIZE - 1:CHUNK_SIZE]
+            .first()
+        )
+        chunk = blogs.filter(pk__gt=last_pk)
+        if chunk_end is not None:
+            chunk = chunk.filter(pk__lte=chunk_end)
+        with transaction.atomic(using=db_alias):
+            chunk.update(excerpt=Substr("content", 1, EXCERPT_LENGTH))
+        if chunk_end is None:
+            break
+        last_pk = chunk_end
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('blogs', '0007_blog_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blog',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.RunPython(backfill_excerpts, migrations.RunPython.noop),
+    ]
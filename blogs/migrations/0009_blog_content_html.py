@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-18 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0008_blog_excerpt'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blog',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='blog',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 6.0.2 on 2026-10-18 19:40
+
+import hashlib
+
+from django.db import migrations, transaction
+from django.utils.html import linebreaks
+
+CHUNK_SIZE = 500
+
+
+def backfill_content_html(apps, schema_editor):
+    """
+    Render `content_html` for every blog saved before 0009, so blog_detail
+    never falls back to the deferred `content`. Same output as
+    blogs.rendering (frozen here, as migrations must be); one short
+    transaction per primary-key chunk, and rows that already have a hash
+    are skipped, so an interrupted run can simply be repeated.
+    """
+    Blog = apps.get_model("blogs", "Blog")
+    db_alias = schema_editor.connection.alias
+    blogs = Blog.objects.using(db_alias).filter(content_hash="")
+
+    last_pk = 0
+    while True:
+        chunk = list(
+            blogs.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .only("pk", "content")[:CHUNK_SIZE]
+        )
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+        for blog in chunk:
+            blog.content_html = linebreaks(blog.content, autoescape=True)
+            blog.content_hash = hashlib.sha256(blog.content.encode("utf-8")).hexdigest()
+        with transaction.atomic(using=db_alias):
+            Blog.objects.using(db_alias).bulk_update(chunk, ["content_html", "content_hash"])
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('blogs', '0010_blog_rejected_by'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_content_html, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,85 @@
 from django.conf import settings
 from django.db import models
 
+from .rendering import content_digest, render_content
+
+
+# Longest prefix any list template shows (truncatechars:180 in blog_list).
+# Storing a few more characters than that keeps `excerpt|truncatechars:N`
+# identical to `content|truncatechars:N` for every N used.
+EXCERPT_LENGTH = 200
+
+
+class BlogQuerySet(models.QuerySet):
+    """
+    Named querysets for each kind of page, so every view loads the same
+    columns, joins the author up front and pages on (created_at, id).
+    """
+
+    # Columns the list templates render; `content` is never loaded here.
+    LISTING_FIELDS = (
+        "title",
+        "excerpt",
+        "category",
+        "status",
+        "image",
+        "created_at",
+        "author__username",
+    )
+
+    def visible_to(self, user=None):
+        """
+        Public users see only published blogs;
+        staff/admin users see all blogs.
+        """
+        if user is None or not user.is_authenticated or not user.is_staff:
+            return self.filter(status="published")
+        return self
+
+    def for_listing(self, user=None):
+        return (
+            self.visible_to(user)
+            .select_related("author")
+            .only(*self.LISTING_FIELDS)
+            .order_by("-created_at", "-id")
+        )
+
+    def for_author(self, user):
+        """A user's own blogs, for their dashboard (author is implied)."""
+        return (
+            self.filter(author=user)
+            .only("title", "excerpt", "category", "status", "created_at", "author_id")
+            .order_by("-created_at", "-id")
+        )
+
+    def for_moderation(self, status):
+        return (
+            self.filter(status=status)
+            .select_related("author", "approved_by", "rejected_by")
+            .only(
+                *self.LISTING_FIELDS,
+                "approved_at",
+                "approved_by__username",
+                "rejected_at",
+                "rejected_by__username",
+            )
+            .order_by("-created_at", "-id")
+        )
+
+    def status_totals(self):
+        """One GROUP BY over the (status, created_at, id) index."""
+        return self.order_by().values("status").annotate(total=models.Count("pk"))
+
+    def status_counts(self):
+        """{status: number of blogs} for every status, zero included."""
+        counts = dict.fromkeys((value for value, _ in self.model.STATUS_CHOICES), 0)
+        counts.update((row["status"], row["total"]) for row in self.status_totals())
+        return counts
+
+    def for_detail(self):
+        # The template renders the stored content_html, not content
+        return self.select_related("author", "approved_by").defer("content")
+
 
 class Blog(models.Model):
 
@@ -25,6 +104,17 @@ class Blog(models.Model):
     title = models.CharField(max_length=255)
     content = models.TextField()
 
+    # Precomputed prefix of `content` so list pages can defer("content")
+    excerpt = models.CharField(
+        max_length=EXCERPT_LENGTH,
+        blank=True,
+        editable=False,
+    )
+
+    # Sanitized HTML of `content`, regenerated only when its hash changes
+    content_html = models.TextField(blank=True, editable=False)
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
+
     # ✅ AI Category
     category = models.CharField(
         max_length=50,
@@ -66,11 +156,103 @@ class Blog(models.Model):
         blank=True
     )
 
+    # Last rejection; approved_by/approved_at are kept as history
+    rejected_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="rejected_blogs"
+    )
+
+    rejected_at = models.DateTimeField(
+        null=True,
+        blank=True
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BlogQuerySet.as_manager()
+
     class Meta:
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "-id"]
+        # Every list view filters by status or author and pages on
+        # (created_at, id); see core.pagination and check_query_plans.
+        indexes = [
+            models.Index(
+                fields=["status", "-created_at", "-id"],
+                name="blog_status_created_idx",
+            ),
+            models.Index(
+                fields=["author", "-created_at", "-id"],
+                name="blog_author_created_idx",
+            ),
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="blog_created_idx",
+            ),
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(status="published"),
+                name="blog_published_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Column values as loaded, so save hooks (dashboard/signals.py) can
+        # tell what changed without reading the row again
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        deferred = self.get_deferred_fields()
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if field.attname not in deferred
+        }
+
+    def loaded_values(self, fields):
+        """
+        The values `fields` had when this blog was loaded or last saved, as
+        a tuple, or None if any of them was not loaded (deferred, or the
+        instance was never read from the database).
+        """
+        loaded = getattr(self, "_loaded_values", {})
+        if not all(field in loaded for field in fields):
+            return None
+        return tuple(loaded[field] for field in fields)
+
+    def refresh_derived_fields(self):
+        """
+        Recompute the fields derived from `content` (excerpt, rendered HTML)
+        and return the names of those that changed.
+        """
+        changed = []
+        excerpt = self.content[:EXCERPT_LENGTH]
+        if excerpt != self.excerpt:
+            self.excerpt = excerpt
+            changed.append("excerpt")
+        digest = content_digest(self.content)
+        if digest != self.content_hash:
+            self.content_html = render_content(self.content)
+            self.content_hash = digest
+            changed += ["content_html", "content_hash"]
+        return changed
+
+    def save(self, *args, **kwargs):
+        # Keep the stored excerpt and rendered body in sync with the content
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.refresh_derived_fields()
+        elif "content" in update_fields:
+            changed = self.refresh_derived_fields()
+            kwargs["update_fields"] = {*update_fields, *changed}
+        super().save(*args, **kwargs)
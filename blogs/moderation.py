@@ -0,0 +1,71 @@
+# blogs/moderation.py
+"""
+Set-based moderation: approve or reject any number of blogs with one
+UPDATE inside a transaction.
+
+Bulk updates bypass Blog.save() and its post_save receivers, so instead
+of one search re-index and one cache bump per row, a single
+`blogs_moderated` signal (blogs/signals.py) carries every changed id.
+"""
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Blog
+from .signals import blogs_moderated
+
+# action -> resulting status
+ACTIONS = {
+    "approve": "published",
+    "reject": "rejected",
+}
+
+# Statuses moderation may move a blog between; drafts are never touched.
+MODERATED_STATUSES = ("pending", "published", "rejected")
+
+
+def moderate(queryset, action, moderator):
+    """
+    Apply `action` to every blog in `queryset` that is not already in the
+    target status. Returns {"status", "updated", "previous": {status: n}}.
+    """
+    status = ACTIONS[action]
+    now = timezone.now()
+    # Each decision records its moderator; the other pair stays as history
+    if status == "published":
+        decision = {"approved_by": moderator, "approved_at": now}
+    else:
+        decision = {"rejected_by": moderator, "rejected_at": now}
+
+    with transaction.atomic():
+        targets = queryset.filter(
+            status__in=[value for value in MODERATED_STATUSES if value != status]
+        ).order_by()
+        if connection.features.has_select_for_update:
+            targets = targets.select_for_update()
+        # Read before writing: receivers need the ids and previous statuses
+        rows = list(targets.values_list("pk", "status", "approved_at"))
+        if not rows:
+            return {"status": status, "updated": 0, "previous": {}}
+
+        blog_ids = [pk for pk, _, _ in rows]
+        # The rows are locked where the database supports it; on SQLite a
+        # write committed since the read makes this UPDATE fail instead.
+        updated = targets.update(status=status, updated_at=now, **decision)
+
+        previous = {}
+        previous_approvals = []
+        for _, old_status, approved_at in rows:
+            previous[old_status] = previous.get(old_status, 0) + 1
+            if old_status == "published" and approved_at:
+                previous_approvals.append(approved_at)
+
+        blogs_moderated.send(
+            sender=Blog,
+            blog_ids=blog_ids,
+            status=status,
+            previous=previous,
+            previous_approvals=previous_approvals,
+            moderator=moderator,
+        )
+
+    return {"status": status, "updated": updated, "previous": previous}
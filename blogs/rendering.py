@@ -0,0 +1,23 @@
+# blogs/rendering.py
+"""
+Pre-rendered blog bodies.
+
+blog_detail used to run `{{ blog.content|linebreaks }}` on every request.
+The same filter now runs once per content change and its output is stored
+on the row (Blog.content_html), keyed by a hash of the source content.
+"""
+import hashlib
+
+from django.utils.html import linebreaks
+
+
+def content_digest(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def render_content(content):
+    """
+    Same output as the `linebreaks` template filter under autoescape:
+    all markup in the content is escaped, so the result is safe to emit.
+    """
+    return linebreaks(content, autoescape=True)
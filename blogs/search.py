@@ -0,0 +1,238 @@
+# blogs/search.py
+"""
+Full-text search for blogs.
+
+The search backend is chosen with the BLOG_SEARCH_BACKEND setting (a dotted
+path). When it is not set, SQLite databases use the FTS5 shadow table
+``blogs_blog_fts`` and every other database falls back to a simple
+``icontains`` search over title and content.
+
+The shadow table is kept in sync by the signal handlers in blogs/signals.py
+and can be rebuilt with ``manage.py rebuild_search_index``.
+"""
+import re
+from functools import lru_cache
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Case, FloatField, IntegerField, Q, Value, When
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+FTS_TABLE = "blogs_blog_fts"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class BaseSearchBackend:
+    """
+    Interface every search backend implements.
+    Backends that do not keep an index only need to implement search().
+    """
+
+    def setup(self):
+        """Create whatever storage the backend needs."""
+
+    def index(self, blog):
+        """Add or refresh a single blog in the index."""
+
+    def remove(self, blog_id):
+        """Drop a single blog from the index."""
+
+    def set_status(self, blog_ids, status):
+        """Record a new status for many blogs at once (after a bulk update)."""
+
+    def rebuild(self, queryset, chunk_size=1000):
+        """Recreate the whole index from the given queryset."""
+        return 0
+
+    def index_many(self, queryset, chunk_size=1000):
+        """
+        Add blogs that are not in the index yet (e.g. rows inserted with
+        bulk_create, which sends no post_save). Returns how many.
+        """
+        return 0
+
+    def search(self, queryset, query, statuses=None):
+        """
+        Return `queryset` narrowed to blogs matching `query`,
+        ordered by relevance (best match first) and annotated with
+        `search_rank` (lower is better), even when nothing matches, so
+        callers can always order or paginate on it.
+        """
+        raise NotImplementedError
+
+
+class BasicSearchBackend(BaseSearchBackend):
+    """
+    Portable fallback: substring match on title and content.
+    Titles that match are ranked above content-only matches.
+    """
+
+    def search(self, queryset, query, statuses=None):
+        if statuses is not None:
+            queryset = queryset.filter(status__in=statuses)
+        return (
+            queryset.filter(Q(title__icontains=query) | Q(content__icontains=query))
+            .annotate(
+                search_rank=Case(
+                    When(title__icontains=query, then=0),
+                    default=1,
+                    output_field=IntegerField(),
+                )
+            )
+            .order_by("search_rank", "-created_at")
+        )
+
+
+class SQLiteFTS5Backend(BaseSearchBackend):
+    """
+    SQLite FTS5 virtual table keyed by the blog id (rowid).
+
+    `status` is stored unindexed so visibility filtering happens inside
+    the full-text query instead of on the whole match set. Searches join
+    the table on rowid and rank with bm25() (lower is better).
+    """
+
+    # bm25() column weights: title, content
+    TITLE_WEIGHT = 10.0
+    CONTENT_WEIGHT = 1.0
+
+    def setup(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                "title, content, status UNINDEXED, tokenize='porter unicode61')"
+            )
+
+    def index(self, blog):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [blog.pk])
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, content, status) "
+                "VALUES (%s, %s, %s, %s)",
+                [blog.pk, blog.title, blog.content, blog.status],
+            )
+
+    def remove(self, blog_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [blog_id])
+
+    # Ids per UPDATE, well under SQLite's bound-parameter limit
+    STATUS_CHUNK = 500
+
+    def set_status(self, blog_ids, status):
+        blog_ids = list(blog_ids)
+        with connection.cursor() as cursor:
+            for start in range(0, len(blog_ids), self.STATUS_CHUNK):
+                chunk = blog_ids[start:start + self.STATUS_CHUNK]
+                placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(
+                    f"UPDATE {FTS_TABLE} SET status = %s WHERE rowid IN ({placeholders})",
+                    [status, *chunk],
+                )
+
+    def rebuild(self, queryset, chunk_size=1000):
+        self.setup()
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        return self.index_many(queryset, chunk_size)
+
+    def index_many(self, queryset, chunk_size=1000):
+        total = 0
+        last_pk = 0
+        while True:
+            rows = list(
+                queryset.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", "title", "content", "status")[:chunk_size]
+            )
+            if not rows:
+                break
+            # One transaction per chunk: committing FTS5 inserts one
+            # statement at a time is an order of magnitude slower.
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.executemany(
+                    f"INSERT INTO {FTS_TABLE} (rowid, title, content, status) "
+                    "VALUES (%s, %s, %s, %s)",
+                    rows,
+                )
+            total += len(rows)
+            last_pk = rows[-1][0]
+        return total
+
+    def search(self, queryset, query, statuses=None):
+        # The full-text table is joined on rowid and bm25() becomes
+        # search_rank, so ranking, filtering and pagination (including
+        # keyset conditions on search_rank) all happen in one LIMITed query.
+        match = build_match_expression(query)
+        if not match:
+            return queryset.none().annotate(
+                search_rank=Value(0.0, output_field=FloatField())
+            )
+
+        opts = queryset.model._meta
+        where = [
+            f"{FTS_TABLE}.rowid = {opts.db_table}.{opts.pk.column}",
+            f"{FTS_TABLE} MATCH %s",
+        ]
+        params = [match]
+        if statuses is not None:
+            statuses = list(statuses)
+            placeholders = ", ".join(["%s"] * len(statuses))
+            where.append(f"{FTS_TABLE}.status IN ({placeholders})")
+            params.extend(statuses)
+        ranking = RawSQL(
+            f"bm25({FTS_TABLE}, {self.TITLE_WEIGHT}, {self.CONTENT_WEIGHT})",
+            [],
+            output_field=FloatField(),
+        )
+        return (
+            queryset.extra(tables=[FTS_TABLE], where=where, params=params)
+            .annotate(search_rank=ranking)
+            .order_by("search_rank", "-created_at")
+        )
+
+
+def build_match_expression(query):
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+    Every word is quoted (so FTS5 operators in user input are inert),
+    all words must match, and the last word is treated as a prefix.
+    """
+    tokens = _TOKEN_RE.findall(query or "")
+    if not tokens:
+        return ""
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+@lru_cache(maxsize=None)
+def get_search_backend():
+    backend_path = getattr(settings, "BLOG_SEARCH_BACKEND", None)
+    if backend_path is None:
+        if connection.vendor == "sqlite":
+            backend_path = "blogs.search.SQLiteFTS5Backend"
+        else:
+            backend_path = "blogs.search.BasicSearchBackend"
+    return import_string(backend_path)()
+
+
+def search_blogs(queryset, query, statuses=None):
+    """
+    Search `queryset` for `query` using the configured backend.
+    Pass `statuses` to restrict matches (e.g. ["published"] for the public).
+    """
+    return get_search_backend().search(queryset, query, statuses=statuses)
+
+
+async def asearch_blogs(queryset, query, statuses=None):
+    """
+    search_blogs() for async views. The built-in backends only build a
+    queryset, but a custom one may query while doing so and Django has no
+    async cursor, so the search runs on the ORM's sync thread; the
+    returned queryset can be iterated with the async ORM.
+    """
+    return await sync_to_async(search_blogs)(queryset, query, statuses=statuses)
@@ -0,0 +1,70 @@
+# blogs/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from core.images import schedule_derivatives
+
+from .cache import bump_published_version, invalidate_author_summaries
+from .models import Blog
+from .search import get_search_backend
+
+# Sent once per bulk moderation (blogs/moderation.py) with blog_ids, the new
+# status, previous ({old status: count}), previous_approvals (approved_at of
+# the blogs that were published before) and moderator. The rows were
+# changed with QuerySet.update(), so post_save did not fire for them.
+blogs_moderated = Signal()
+
+# Sent after categories are rewritten in bulk (blogs.ai_utils.classify_blogs,
+# manage.py reclassify_blogs) with changes: {(old category, new): count}.
+blogs_recategorized = Signal()
+
+
+@receiver(post_save, sender=Blog)
+def index_blog(sender, instance, raw=False, **kwargs):
+    """
+    Keep the full-text index in sync with the saved blog.
+    """
+    if raw:
+        return
+    get_search_backend().index(instance)
+
+
+@receiver(post_save, sender=Blog)
+@receiver(post_delete, sender=Blog)
+def invalidate_blog_fragments(sender, instance, **kwargs):
+    """
+    Any blog write may change what the public lists show; bumping the
+    version retires every cached fragment in O(1).
+    """
+    bump_published_version()
+
+
+@receiver(post_save, sender=Blog)
+@receiver(post_delete, sender=Blog)
+def invalidate_author_summary(sender, instance, **kwargs):
+    invalidate_author_summaries([instance.author_id])
+
+
+@receiver(post_delete, sender=Blog)
+def unindex_blog(sender, instance, **kwargs):
+    get_search_backend().remove(instance.pk)
+
+
+@receiver(post_save, sender=Blog)
+def generate_blog_image_derivatives(sender, instance, raw=False, **kwargs):
+    if raw or "image" in instance.get_deferred_fields():
+        return
+    schedule_derivatives(instance.image, "blog")
+
+
+@receiver(blogs_moderated, sender=Blog)
+def sync_moderated_blogs(sender, blog_ids, status, **kwargs):
+    """One index update and one cache bump for the whole batch."""
+    get_search_backend().set_status(blog_ids, status)
+    bump_published_version()
+    invalidate_author_summaries(
+        Blog.objects.filter(pk__in=blog_ids)
+        .order_by()
+        .values_list("author_id", flat=True)
+        .distinct()
+    )
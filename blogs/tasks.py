@@ -0,0 +1,9 @@
+# blogs/tasks.py
+from jobs.queue import task
+
+from .ai_utils import classify_blogs
+
+
+@task("blogs.classify_blogs", priority=5)
+def classify_blogs_task(blog_ids):
+    classify_blogs(blog_ids)
@@ -1,3 +1,225 @@
-from django.test import TestCase
+import re
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from accounts.models import CustomUser
+from core.pagination import CursorPaginator
+
+from .ai_utils import (
+    KeywordCategoryBackend,
+    OpenAICategoryBackend,
+    aclassify_batch,
+    classify_batch,
+)
+from .models import Blog
+from .moderation import moderate
+from .search import search_blogs
+
+
+def _titles(blogs):
+    return [blog.title for blog in blogs]
+
+
+class SearchTests(TestCase):
+    """blogs/search.py and the index sync in blogs/signals.py."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = CustomUser.objects.create_user("writer", "writer@example.com")
+        cls.in_title = Blog.objects.create(
+            title="Travel notes", content="A week away", author=cls.author, status="published"
+        )
+        cls.in_content = Blog.objects.create(
+            title="Diary", content="Notes on travel and food", author=cls.author, status="published"
+        )
+        cls.pending = Blog.objects.create(
+            title="Travel plans", content="Soon", author=cls.author, status="pending"
+        )
+
+    def test_title_matches_rank_first(self):
+        results = search_blogs(Blog.objects.all(), "travel", statuses=["published"])
+        self.assertEqual(_titles(results), ["Travel notes", "Diary"])
+        # The last word is a prefix
+        results = search_blogs(Blog.objects.all(), "trav", statuses=["published"])
+        self.assertEqual(_titles(results), ["Travel notes", "Diary"])
+
+    def test_no_hits(self):
+        for query in ("zzzz", "!!!", ""):
+            with self.subTest(query=query):
+                results = search_blogs(Blog.objects.all(), query)
+                self.assertEqual(list(results.order_by("search_rank")), [])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.in_content.content = "Nothing about it"
+        self.in_content.save()
+        self.in_title.delete()
+        results = search_blogs(Blog.objects.all(), "travel", statuses=["published"])
+        self.assertEqual(_titles(results), [])
+
+    def test_index_follows_bulk_moderation(self):
+        moderate(Blog.objects.filter(pk=self.pending.pk), "approve", None)
+        moderate(Blog.objects.filter(pk=self.in_title.pk), "reject", None)
+        results = search_blogs(Blog.objects.all(), "travel", statuses=["published"])
+        self.assertEqual(_titles(results), ["Travel plans", "Diary"])
+
+
+    def test_pages_of_results_are_single_queries(self):
+        for i in range(4):
+            Blog.objects.create(
+                title=f"Travel {i}", content="Away", author=self.author, status="published"
+            )
+        results = search_blogs(Blog.objects.all(), "travel", statuses=["published"])
+        paginator = CursorPaginator(results, 2, ordering=("search_rank", "-created_at", "-id"))
+        titles, page = [], paginator.page()
+        while True:
+            with self.assertNumQueries(1):
+                titles.extend(_titles(page))
+            if not page.has_next:
+                break
+            page = paginator.page(page.next_cursor)
+        self.assertEqual(titles, _titles(results))
+        self.assertEqual(len(titles), 6)
+
+
+class BlogListSearchTests(TestCase):
+    """blog_list with ?q=, sync and async (central_platform/urls_asgi.py)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = CustomUser.objects.create_user("writer", "writer@example.com")
+        cls.blog = Blog.objects.create(
+            title="Python tips", content="Hello", author=cls.author, status="published"
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_query_with_hits(self):
+        response = self.client.get("/blogs/", {"q": "python"})
+        self.assertContains(response, "Python tips")
+
+    def test_queries_without_hits(self):
+        # No match, and a query with no words at all
+        for query in ("zzzz", "!!!"):
+            with self.subTest(query=query):
+                response = self.client.get("/blogs/", {"q": query})
+                self.assertEqual(response.status_code, 200)
+                self.assertNotContains(response, "Python tips")
+
+    @override_settings(ROOT_URLCONF="central_platform.urls_asgi")
+    async def test_async_queries_without_hits(self):
+        for query in ("zzzz", "!!!"):
+            with self.subTest(query=query):
+                response = await self.async_client.get("/blogs/", {"q": query})
+                self.assertEqual(response.status_code, 200)
+                self.assertNotContains(response, "Python tips")
+
+
+class ConditionalGetTests(TestCase):
+    """blogs/conditional.py: unchanged pages are answered with 304."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = CustomUser.objects.create_user("writer", "writer@example.com")
+        cls.blog = Blog.objects.create(
+            title="Post", content="Hello", author=cls.author, status="published"
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_detail_and_list_revalidate_until_a_write(self):
+        for path in (f"/blogs/{self.blog.pk}/", "/blogs/"):
+            with self.subTest(path=path):
+                etag = self.client.get(path)["ETag"]
+                response = self.client.get(path, headers={"if-none-match": etag})
+                self.assertEqual(response.status_code, 304)
+
+                self.blog.title = f"Edited for {path}"
+                self.blog.save()
+                response = self.client.get(path, headers={"if-none-match": etag})
+                self.assertContains(response, self.blog.title)
+
+    def test_detail_renders_stored_html(self):
+        self.blog.content = "First <b>\n\nSecond"
+        self.blog.save()
+        response = self.client.get(f"/blogs/{self.blog.pk}/")
+        self.assertContains(response, "<p>First &lt;b&gt;</p>", html=False)
+
+
+@override_settings(ROOT_URLCONF="central_platform.urls_asgi")
+class AsyncViewTests(TestCase):
+    """The async pages served under ASGI match their sync versions."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = CustomUser.objects.create_user("writer", "writer@example.com")
+        cls.published = Blog.objects.create(
+            title="Async python", content="Hello", author=cls.author, status="published"
+        )
+        cls.draft = Blog.objects.create(
+            title="Draft", content="Not yet", author=cls.author, status="draft"
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def _strip_csrf(self, content):
+        return re.sub(rb'value="[A-Za-z0-9]{64}"', b"", content)
+
+    async def test_pages_match_sync_views(self):
+        for path in ("/", "/blogs/", "/blogs/?q=python", f"/blogs/{self.published.pk}/"):
+            with self.subTest(path=path):
+                response = await self.async_client.get(path)
+                with override_settings(ROOT_URLCONF="central_platform.urls"):
+                    expected = await sync_to_async(self.client.get)(path)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    self._strip_csrf(response.content), self._strip_csrf(expected.content)
+                )
+
+                cached = await self.async_client.get(path, headers={"if-none-match": response["ETag"]})
+                self.assertEqual(cached.status_code, 304)
+
+    async def test_drafts_are_hidden(self):
+        response = await self.async_client.get(f"/blogs/{self.draft.pk}/")
+        self.assertEqual(response.status_code, 404)
+
+        await self.async_client.aforce_login(self.author)
+        response = await self.async_client.get(f"/blogs/{self.draft.pk}/")
+        self.assertEqual(response.status_code, 200)
+
+
+class ClassificationTests(TestCase):
+    """blogs/ai_utils.py with the offline keyword backend."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_classify_batch(self):
+        backend = KeywordCategoryBackend()
+        items = [("Python tips", "code and software"), ("Hello", "nothing to go on")]
+        self.assertEqual(classify_batch(items, backend=backend), ["Technology", "General"])
+
+    async def test_async_classification(self):
+        backend = KeywordCategoryBackend()
+        items = [("Python tips", "code and software"), ("Marathon", "training for a race")]
+        labels = await aclassify_batch(items, backend=backend)
+        self.assertEqual(labels, await sync_to_async(classify_batch)(items, backend=backend))
+
+    def test_failed_classifications_are_retried(self):
+        def reply(text):
+            return mock.Mock(output=[mock.Mock(content=[mock.Mock(text=text)])])
+
+        client = mock.Mock()
+        client.responses.create.side_effect = [reply("Sorry, I can't help"), reply('["Travel"]')]
+        items = [("Beach trip", "a week away")]
+        with mock.patch("blogs.ai_utils._openai_client", return_value=client):
+            backend = OpenAICategoryBackend()
+            self.assertEqual(classify_batch(items, backend=backend), ["General"])
+            self.assertEqual(classify_batch(items, backend=backend), ["Travel"])
+            self.assertEqual(classify_batch(items, backend=backend), ["Travel"])
+        self.assertEqual(client.responses.create.call_count, 2)
@@ -0,0 +1,13 @@
+# blogs/urls_asgi.py
+from django.urls import path
+from . import async_views, views
+
+app_name = "blogs"
+# blogs/urls.py with the async read-only views (see central_platform/urls_asgi.py)
+urlpatterns = [
+    path("", async_views.blog_list, name="blog_list"),
+    path("create/", views.create_blog, name="blog_create"),
+    path("<int:pk>/", async_views.blog_detail, name="blog_detail"),
+    path("<int:pk>/edit/", views.blog_update, name="blog_update"),
+    path("<int:pk>/delete/", views.blog_delete, name="blog_delete"),
+]
@@ -1,61 +1,90 @@
 # blogs/views.py
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
 from django.http import Http404, HttpResponseForbidden
 from django.shortcuts import get_object_or_404, render, redirect
-from .ai_utils import detect_blog_category
-
-
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+from django.views.decorators.http import condition
+
+from core.pagination import CursorPaginator
+
+from .ai_utils import schedule_category_detection
+from .cache import get_or_render
+from .conditional import (
+    detail_etag,
+    detail_last_modified,
+    list_etag,
+    list_last_modified,
+)
 from .forms import BlogForm
 from .models import Blog
+from .search import search_blogs
 
 
+@condition(etag_func=list_etag, last_modified_func=list_last_modified)
 def blog_list(request):
     """
-    List blogs with pagination and search on title.
+    List blogs with pagination and full-text search on title and content.
 
     - Public users see only published blogs
     - Staff/Admin users see all blogs
+    - Anonymous pages are served from the fragment cache (blogs/cache.py)
     """
-
-    blogs = Blog.objects.all().order_by("-created_at")
-
-    # Role Based Visibility
-    if not request.user.is_authenticated or not request.user.is_staff:
-        blogs = blogs.filter(status="published")
-
-    # Search
     query = request.GET.get("q")
-    if query:
-        blogs = blogs.filter(title__icontains=query)
 
-    paginator = Paginator(blogs, 5)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
+    def render_results():
+        # Role Based Visibility
+        blogs = Blog.objects.for_listing(request.user)
+        statuses = None
+        if not request.user.is_authenticated or not request.user.is_staff:
+            statuses = ["published"]
+
+        # Search (ranked by relevance across title and content)
+        if query:
+            blogs = search_blogs(blogs, query, statuses=statuses)
+            paginator = CursorPaginator(
+                blogs, 5, ordering=("search_rank", "-created_at", "-id")
+            )
+        else:
+            paginator = CursorPaginator(blogs, 5)
+        page_obj = paginator.page_from_request(request)
+
+        return render_to_string(
+            "blog_list_results.html",
+            {
+                "blogs": page_obj,
+                "page_obj": page_obj,
+                "query": query or "",
+            },
+            request=request,
+        )
+
+    results = get_or_render("blog_list", request, render_results)
 
     return render(
         request,
         "blog_list.html",
         {
-            "blogs": page_obj,
-            "page_obj": page_obj,
+            "results": mark_safe(results),
             "query": query or "",
         },
     )
 
 
+@condition(etag_func=detail_etag, last_modified_func=detail_last_modified)
 def blog_detail(request, pk):
     """
     Show a single blog.
     Draft blogs are only visible to the author or admin.
+    Repeat visits get 304 Not Modified while the blog is unchanged.
     """
-    blog = get_object_or_404(Blog, pk=pk)
+    blog = get_object_or_404(Blog.objects.for_detail(), pk=pk)
 
     if blog.status != "published":
         if not request.user.is_authenticated:
             raise Http404("Blog not found")
-        if request.user != blog.author and getattr(request.user, "role", "user") != "admin":
+        if request.user.pk != blog.author_id and getattr(request.user, "role", "user") != "admin":
             raise Http404("Blog not found")
 
     context = {
@@ -77,6 +106,7 @@ def create_blog(request):
             else:
                 blog.status = "pending"
             blog.save()
+            schedule_category_detection(blog)
             messages.success(request, "Blog created successfully.")
             return redirect("blogs:blog_detail", pk=blog.pk)
     else:
@@ -94,7 +124,7 @@ def blog_update(request, pk):
     blog = get_object_or_404(Blog, pk=pk)
 
     # Permission check
-    if request.user != blog.author and not request.user.is_staff:
+    if request.user.pk != blog.author_id and not request.user.is_staff:
         return HttpResponseForbidden("You are not allowed to edit this blog.")
 
     if request.method == "POST":
@@ -122,8 +152,8 @@ def blog_update(request, pk):
 
                 elif action == "reject":
                     blog.status = "rejected"
-                    blog.approved_by = request.user
-                    blog.approved_at = timezone.now()
+                    blog.rejected_by = request.user
+                    blog.rejected_at = timezone.now()
 
                 elif action == "draft":
                     blog.status = "draft"
@@ -142,6 +172,8 @@ def blog_update(request, pk):
                     blog.status = "pending"
 
             blog.save()
+            if {"title", "content"} & set(form.changed_data):
+                schedule_category_detection(blog)
 
             messages.success(request, "Blog updated successfully.")
             return redirect("blogs:blog_detail", pk=blog.pk)
@@ -170,7 +202,7 @@ def blog_delete(request, pk):
     """
     blog = get_object_or_404(Blog, pk=pk)
 
-    if request.user != blog.author and getattr(request.user, "role", "user") != "admin":
+    if request.user.pk != blog.author_id and getattr(request.user, "role", "user") != "admin":
         return HttpResponseForbidden("You are not allowed to delete this blog.")
 
     if request.method == "POST":
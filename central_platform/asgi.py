@@ -2,6 +2,8 @@
 ASGI config for central_platform project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Requests are routed through central_platform.urls_asgi, which serves the
+read-heavy pages with native async views.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
@@ -9,8 +11,21 @@ https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler, ASGIRequest
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'central_platform.settings')
 
-application = get_asgi_application()
+
+class AsyncURLConfRequest(ASGIRequest):
+    # BaseHandler resolves with request.urlconf when a request has one
+    urlconf = "central_platform.urls_asgi"
+
+
+class AsyncURLConfHandler(ASGIHandler):
+    request_class = AsyncURLConfRequest
+
+
+# What get_asgi_application() does, with the handler above
+django.setup(set_prefix=False)
+application = AsyncURLConfHandler()
@@ -42,12 +42,16 @@ INSTALLED_APPS = [
     'dashboard',
     'adminpanel',
     'core',
+    'jobs',
+    'rest_framework',
+    'api',
 ]
 
 AUTH_USER_MODEL = 'accounts.CustomUser'
 
 
 MIDDLEWARE = [
+    'core.middleware.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -61,7 +65,8 @@ ROOT_URLCONF = 'central_platform.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates, timing renders for core.middleware
+        'BACKEND': 'core.instrumentation.TimedDjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -135,3 +140,72 @@ LOGIN_URL = "accounts:login"
 LOGIN_REDIRECT_URL = "dashboard:dashboard"
 LOGOUT_REDIRECT_URL = "home"
 
+
+# Blog search
+# Defaults to SQLite FTS5 on SQLite and a simple icontains search elsewhere.
+# BLOG_SEARCH_BACKEND = "blogs.search.SQLiteFTS5Backend"
+
+# Cache
+# Local memory is per process; use a shared backend (Redis/Memcached) in
+# production so every worker sees the same fragment cache version.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Fragment cache lifetime per view, in seconds (see blogs/cache.py)
+BLOG_FRAGMENT_CACHE_TIMEOUTS = {
+    "blog_list": 60,
+    "home": 30,
+}
+
+# Blog category classification (see blogs/ai_utils.py)
+# The OpenAI backend reads its key from the OPENAI_API_KEY environment
+# variable; use "blogs.ai_utils.KeywordCategoryBackend" for offline runs.
+# "blogs.ai_utils.HybridCategoryBackend" uses the local model (trained with
+# `manage.py train_category_model`) and only asks the remote backend about
+# posts it predicts with less than BLOG_CATEGORY_MIN_CONFIDENCE.
+BLOG_CATEGORY_BACKEND = "blogs.ai_utils.OpenAICategoryBackend"
+BLOG_CATEGORY_REMOTE_BACKEND = "blogs.ai_utils.OpenAICategoryBackend"
+BLOG_CATEGORY_MIN_CONFIDENCE = 0.6
+BLOG_CATEGORY_MODEL = BASE_DIR / "category_model" / "model.npy"
+BLOG_CATEGORY_TIMEOUT = 10
+
+# Web worker cold-start budget, checked by `manage.py profile_startup --check`
+# and core/tests.py. Heavy SDKs must be imported lazily, where they are used.
+STARTUP_BUDGET = {
+    "seconds": 2.0,
+    "rss_mb": 150,
+    "max_modules": 1000,
+    "forbidden_modules": ["openai", "httpx", "pydantic", "numpy", "PIL"],
+}
+
+# Per-URL latency baseline, written by `manage.py benchmark_urls
+# --save-baseline`; `--check` fails when a route's p95 grows by more than
+# BENCHMARK_TOLERANCE. Query budgets live with the routes (core/benchmarking.py).
+BENCHMARK_BASELINE = BASE_DIR / "benchmark_baseline.json"
+BENCHMARK_TOLERANCE = 0.25
+
+# Per-request instrumentation (core/middleware.py): Server-Timing header,
+# one log line per request on the "core.middleware" logger at INFO, and
+# requests slower than slow_request_ms logged at WARNING with their
+# queries. "enabled": False removes the middleware entirely.
+REQUEST_TIMING = {
+    "enabled": True,
+    # Staff only (everyone when DEBUG is on); True for all, False for none
+    "server_timing": "staff",
+    "slow_request_ms": 500,
+}
+
+# Read-only JSON API (api/). Public and anonymous: no authentication
+# classes, so requests never touch the session or user tables.
+REST_FRAMEWORK = {
+    "DEFAULT_AUTHENTICATION_CLASSES": [],
+    "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.AllowAny"],
+    "DEFAULT_RENDERER_CLASSES": [
+        "rest_framework.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "UNAUTHENTICATED_USER": None,
+}
@@ -17,6 +17,10 @@ urlpatterns = [
     path("blogs/", include("blogs.urls", namespace="blogs")),
     path("dashboard/", include("dashboard.urls", namespace="dashboard")),
     path("adminpanel/", include("adminpanel.urls", namespace="adminpanel")),
+    path("jobs/", include("jobs.urls", namespace="jobs")),
+
+    # Read-only JSON API
+    path("api/", include("api.urls", namespace="api")),
 ]
 
 # Media files during development
@@ -0,0 +1,25 @@
+# central_platform/urls_asgi.py
+"""
+URLconf for requests served through central_platform.asgi: the routes of
+central_platform.urls, with native async views for the read-heavy pages
+(home, blog list, blog detail) so they run on the event loop instead of
+a worker thread. Names and namespaces are unchanged, so reverse() and
+{% url %} work the same under both servers.
+"""
+from django.urls import include, path
+
+from core.async_views import home
+
+from .urls import urlpatterns as wsgi_urlpatterns
+
+ASYNC_ROUTES = ("", "blogs/")
+
+urlpatterns = [
+    path("", home, name="home"),
+    path("blogs/", include("blogs.urls_asgi", namespace="blogs")),
+    *(
+        pattern
+        for pattern in wsgi_urlpatterns
+        if str(pattern.pattern) not in ASYNC_ROUTES
+    ),
+]
@@ -0,0 +1,38 @@
+# core/async_views.py
+from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from blogs.cache import aget_or_render
+from blogs.conditional import (
+    alist_etag,
+    alist_last_modified,
+    aresolve_user,
+    async_condition,
+)
+from blogs.models import Blog
+
+
+@async_condition(etag_func=alist_etag, last_modified_func=alist_last_modified)
+async def home(request):
+    """
+    Async core.views.home, served under ASGI (central_platform/urls_asgi.py).
+    """
+    await aresolve_user(request)
+
+    async def render_lists():
+        context = {"latest_blogs": [blog async for blog in Blog.objects.for_listing()[:5]]}
+        return (
+            render_to_string("home_activity.html", context, request=request),
+            render_to_string("home_recent.html", context, request=request),
+        )
+
+    latest_activity, recent_blogs = await aget_or_render("home", request, render_lists)
+    return render(
+        request,
+        "home.html",
+        {
+            "latest_activity": mark_safe(latest_activity),
+            "recent_blogs": mark_safe(recent_blogs),
+        },
+    )
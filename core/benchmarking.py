@@ -0,0 +1,233 @@
+# core/benchmarking.py
+"""
+URL benchmarks and query budgets.
+
+ROUTES lists every page in central_platform.urls with the most SQL
+queries each role may cost it. run() seeds nothing itself: callers load
+a fixed dataset with seed_fixture() first (`manage.py benchmark_urls`
+does, inside a rolled-back transaction; core/tests.py does in its test
+database), then every route is requested as each role, timing each
+request and counting its queries.
+
+check() turns the results into failures: a request over its query
+budget, or a p95 latency more than the tolerance above the stored
+baseline (BENCHMARK_BASELINE, written by `benchmark_urls
+--save-baseline`).
+"""
+import json
+import statistics
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import CustomUser
+from blogs.models import Blog
+from core.seeding import finish, generate_blogs, generate_users
+
+ROLES = ("anonymous", "user", "admin")
+
+# name -> (path, {role: maximum queries per request}). A role missing from
+# the budgets is not requested. Paths are formatted with the fixture ids
+# (see seed_fixture()). Budgets are per request whatever the page size or
+# dataset: lists are keyset-paginated, their counts are cached or
+# materialized, and related rows are joined, never fetched per row.
+ROUTES = {
+    "home": ("/", {"anonymous": 2, "user": 3, "admin": 3}),
+    "blog_list": ("/blogs/", {"anonymous": 2, "user": 3, "admin": 4}),
+    "blog_list_page_2": ("/blogs/?page=2", {"anonymous": 2, "user": 3, "admin": 4}),
+    "blog_search": ("/blogs/?q=python", {"anonymous": 3, "user": 4, "admin": 5}),
+    "blog_detail": ("/blogs/{published}/", {"anonymous": 2, "user": 4, "admin": 4}),
+    "blog_create": ("/blogs/create/", {"anonymous": 0, "user": 2, "admin": 2}),
+    "blog_update": ("/blogs/{own}/edit/", {"user": 3}),
+    "dashboard": ("/dashboard/", {"anonymous": 0, "user": 4, "admin": 4}),
+    "dashboard_series": ("/dashboard/?days=30", {"admin": 5}),
+    "moderation": ("/adminpanel/", {"anonymous": 0, "user": 2, "admin": 4}),
+    "moderation_published": ("/adminpanel/?status=published", {"admin": 4}),
+    "user_admin": ("/adminpanel/users/", {"user": 2, "admin": 4}),
+    "user_admin_search": ("/adminpanel/users/?q=bench", {"admin": 4}),
+    "export_users": ("/adminpanel/export/users/?format=csv", {"admin": 3}),
+    "queue_metrics": ("/jobs/metrics/", {"admin": 6}),
+    "login": ("/accounts/login/", {"anonymous": 0, "user": 2}),
+    "register": ("/accounts/register/", {"anonymous": 0}),
+    "profile": ("/accounts/profile/", {"user": 2, "admin": 2}),
+    "api_blogs": ("/api/blogs/", {"anonymous": 1}),
+    "api_blogs_sparse": ("/api/blogs/?fields=id,title,excerpt", {"anonymous": 1}),
+    "api_blog": ("/api/blogs/{published}/", {"anonymous": 1}),
+    "api_authors": ("/api/authors/", {"anonymous": 1}),
+    "django_admin": ("/admin/", {"admin": 5}),
+}
+
+DEFAULT_TOLERANCE = 0.25
+
+# Latency differences below this are noise, whatever the percentage.
+DEFAULT_SLACK_MS = 2.0
+
+ADMIN_USERNAME = "bench-admin"
+USER_USERNAME = "bench-user"
+
+
+def seed_fixture(blogs=300, users=50, seed=2024):
+    """
+    The fixed benchmark dataset: a "bench-admin" and a prolific
+    "bench-user" among `users` generated authors, and `blogs` blogs from
+    core.seeding with a fixed random seed. Returns the ids the ROUTES
+    paths are formatted with.
+    """
+    joined = timezone.now() - timedelta(days=3 * 365)
+    admin = CustomUser.objects.create_user(
+        ADMIN_USERNAME, f"{ADMIN_USERNAME}@example.com", role="admin", date_joined=joined
+    )
+    user = CustomUser.objects.create_user(
+        USER_USERNAME, f"{USER_USERNAME}@example.com", date_joined=joined
+    )
+    since = Blog.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+
+    authors = generate_users(users, seed=seed)
+    authors[user.pk] = joined
+    generate_blogs(blogs, authors, seed=seed)
+    new = Blog.objects.filter(pk__gt=since)
+    # Something for the search route to find
+    searchable = list(new.order_by("pk").values_list("pk", flat=True))[::10]
+    Blog.objects.filter(pk__in=searchable).update(title="Learning python")
+    finish(since)
+
+    return {
+        "admin": admin,
+        "user": user,
+        "published": new.filter(status="published").values_list("pk", flat=True).first(),
+        "own": new.filter(author=user).values_list("pk", flat=True).first(),
+    }
+
+
+def _client(role, fixture, host):
+    client = Client(SERVER_NAME=host)
+    if role != "anonymous":
+        client.force_login(fixture[role])
+    return client
+
+
+def measure(client, path):
+    """(status, queries, seconds) for one GET, streamed bodies included."""
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        response = client.get(path)
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+        elapsed = time.perf_counter() - started
+    return response.status_code, len(queries.captured_queries), elapsed
+
+
+def _percentile(timings, fraction):
+    timings = sorted(timings)
+    index = min(int(round(fraction * (len(timings) - 1))), len(timings) - 1)
+    return timings[index]
+
+
+def run(fixture, iterations=20, warmup=2, routes=None, roles=ROLES, host="localhost"):
+    """
+    Request every route as every role it has a budget for. Warm-up
+    requests count towards the query maximum (a cold cache must stay
+    within budget too) but not towards latency. Returns a list of
+    {"route", "role", "path", "status", "queries", "budget", "p50",
+    "p95", "p99", "mean"} with latencies in milliseconds. `host` must be
+    allowed by ALLOWED_HOSTS ("testserver" under the test runner).
+    """
+    results = []
+    clients = {role: _client(role, fixture, host) for role in roles}
+    for name, (template, budgets) in ROUTES.items():
+        if routes and name not in routes:
+            continue
+        path = template.format(**fixture)
+        for role in roles:
+            if role not in budgets:
+                continue
+            timings = []
+            most = 0
+            status = None
+            for i in range(warmup + iterations):
+                status, queries, elapsed = measure(clients[role], path)
+                most = max(most, queries)
+                if i >= warmup:
+                    timings.append(elapsed * 1000)
+            results.append({
+                "route": name,
+                "role": role,
+                "path": path,
+                "status": status,
+                "queries": most,
+                "budget": budgets[role],
+                "p50": _percentile(timings, 0.50),
+                "p95": _percentile(timings, 0.95),
+                "p99": _percentile(timings, 0.99),
+                "mean": statistics.fmean(timings),
+            })
+    return results
+
+
+def _key(result):
+    return f"{result['route']}:{result['role']}"
+
+
+def baseline_path():
+    return Path(getattr(
+        settings, "BENCHMARK_BASELINE", Path(settings.BASE_DIR) / "benchmark_baseline.json"
+    ))
+
+
+def load_baseline(path=None):
+    path = Path(path or baseline_path())
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(results, path=None):
+    path = Path(path or baseline_path())
+    baseline = {
+        _key(result): {
+            "p50": round(result["p50"], 3),
+            "p95": round(result["p95"], 3),
+            "queries": result["queries"],
+        }
+        for result in results
+    }
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def get_tolerance():
+    return getattr(settings, "BENCHMARK_TOLERANCE", DEFAULT_TOLERANCE)
+
+
+def check(results, baseline=None, tolerance=None, slack_ms=DEFAULT_SLACK_MS):
+    """
+    Human-readable failures: server errors, requests over their query
+    budget and p95 latencies above baseline * (1 + tolerance) + slack.
+    """
+    if tolerance is None:
+        tolerance = get_tolerance()
+    failures = []
+    for result in results:
+        label = f"{result['route']} as {result['role']} ({result['path']})"
+        if result["status"] >= 500:
+            failures.append(f"{label}: HTTP {result['status']}")
+        if result["queries"] > result["budget"]:
+            failures.append(
+                f"{label}: {result['queries']} queries, budget {result['budget']}"
+            )
+        previous = (baseline or {}).get(_key(result))
+        if previous:
+            limit = previous["p95"] * (1 + tolerance) + slack_ms
+            if result["p95"] > limit:
+                failures.append(
+                    f"{label}: p95 {result['p95']:.1f} ms, baseline "
+                    f"{previous['p95']:.1f} ms (limit {limit:.1f} ms)"
+                )
+    return failures
@@ -0,0 +1,159 @@
+# core/images.py
+"""
+Image derivatives for uploaded media.
+
+Every uploaded image gets a fixed set of resized copies, each written as
+WebP plus a JPEG fallback, under ``derivatives/<original path>/``:
+
+    blog_images/cat.png  ->  derivatives/blog_images/cat.png/card.webp
+                             derivatives/blog_images/cat.png/card.jpg
+                             derivatives/blog_images/cat.png/w960.webp ...
+
+Derivatives are generated off the request path by the job queue
+(core.tasks, run by ``manage.py runworker``) after an upload, or in bulk
+with ``manage.py generate_image_derivatives``. Templates use the tags in
+core/templatetags/image_tags.py, which fall back to the original file
+until the derivatives exist. Whether they exist is cached (see
+has_derivatives()), so rendering a page of cards never asks the storage.
+"""
+import hashlib
+from io import BytesIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from .instrumentation import record_cache
+
+DERIVATIVE_ROOT = "derivatives"
+
+EXISTS_KEY = "images:derivatives:{digest}"
+# Seconds a known state is trusted; missing ones are rechecked sooner.
+EXISTS_TIMEOUT = 24 * 3600
+MISSING_TIMEOUT = 60
+
+# (format extension, Pillow format, save options); first entry is preferred
+FORMATS = (
+    ("webp", "WEBP", {"quality": 80, "method": 4}),
+    ("jpg", "JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+)
+
+# Named sizes per kind of image: (name, width, height). With a height the
+# image is cropped to fill the box; without one it is scaled to the width.
+SPECS = {
+    "blog": (
+        ("card", 640, 360),
+        ("w480", 480, None),
+        ("w960", 960, None),
+        ("w1600", 1600, None),
+    ),
+    "avatar": (
+        ("avatar", 160, 160),
+        ("avatar2x", 320, 320),
+    ),
+}
+
+# Width-only specs become `srcset` candidates
+RESPONSIVE = {
+    kind: tuple((name, width) for name, width, height in specs if height is None)
+    for kind, specs in SPECS.items()
+}
+
+
+def derivative_name(source_name, spec_name, extension):
+    # The whole source name, extension included: cat.png and cat.jpg
+    # must not share derivatives
+    return f"{DERIVATIVE_ROOT}/{source_name}/{spec_name}.{extension}"
+
+
+def _exists_key(source_name, kind):
+    digest = hashlib.md5(f"{kind}:{source_name}".encode()).hexdigest()
+    return EXISTS_KEY.format(digest=digest)
+
+
+def _resize(image, width, height):
+    from PIL import Image, ImageOps
+
+    if height is not None:
+        return ImageOps.fit(image, (width, height), Image.Resampling.LANCZOS)
+    if image.width <= width:
+        return image.copy()
+    ratio = width / image.width
+    return image.resize((width, max(1, round(image.height * ratio))), Image.Resampling.LANCZOS)
+
+
+def _flatten(image):
+    """JPEG has no alpha channel: composite onto white."""
+    from PIL import Image
+
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def render_derivatives(source_name, kind, storage=None):
+    """
+    Write every derivative of `source_name` for `kind` to storage,
+    replacing old copies. Returns the list of names written.
+    Pure storage + Pillow work: safe to call from any thread or process.
+    """
+    # Imported lazily: only workers resize images, web processes never do
+    from PIL import Image, ImageOps
+
+    storage = storage or default_storage
+    with storage.open(source_name, "rb") as handle:
+        original = Image.open(handle)
+        original.load()
+    original = ImageOps.exif_transpose(original)
+
+    written = []
+    for spec_name, width, height in SPECS[kind]:
+        resized = _resize(original, width, height)
+        for extension, pil_format, options in FORMATS:
+            image = resized if pil_format == "WEBP" else _flatten(resized)
+            if pil_format == "WEBP" and image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+            buffer = BytesIO()
+            image.save(buffer, pil_format, **options)
+            name = derivative_name(source_name, spec_name, extension)
+            if storage.exists(name):
+                storage.delete(name)
+            written.append(storage.save(name, ContentFile(buffer.getvalue())))
+    cache.set(_exists_key(source_name, kind), True, EXISTS_TIMEOUT)
+    return written
+
+
+def has_derivatives(source_name, kind, storage=None):
+    """
+    Whether render_derivatives() has run for `source_name`. Answered from
+    the cache; on a miss, checks that the last file it writes exists (one
+    storage round trip) and caches the answer.
+    """
+    key = _exists_key(source_name, kind)
+    exists = cache.get(key)
+    record_cache(hits=exists is not None, misses=exists is None)
+    if exists is None:
+        storage = storage or default_storage
+        spec_name = SPECS[kind][-1][0]
+        exists = storage.exists(derivative_name(source_name, spec_name, FORMATS[-1][0]))
+        cache.set(key, exists, EXISTS_TIMEOUT if exists else MISSING_TIMEOUT)
+    return exists
+
+
+def schedule_derivatives(fieldfile, kind):
+    """
+    Queue derivative generation for a just-saved image field, unless
+    they already exist. Returns immediately.
+    """
+    from .tasks import render_image_derivatives
+
+    if not fieldfile or has_derivatives(fieldfile.name, kind, fieldfile.storage):
+        return
+    render_image_derivatives.enqueue(
+        source_name=fieldfile.name,
+        kind=kind,
+        dedup_key=f"derivatives:{fieldfile.name}",
+    )
@@ -0,0 +1,158 @@
+# core/instrumentation.py
+"""
+Per-request timings for core.middleware.RequestTimingMiddleware: SQL
+queries (query_wrapper, installed on every database connection as it
+connects, see install()), template rendering
+(TimedDjangoTemplates, the configured template backend) and cache hits
+and misses (record_cache(), called where the code reads the cache).
+
+The collector for the current request lives in a context variable, so
+it follows the request into sync_to_async threads, where the async ORM
+runs its queries. Outside a measured request every hook costs one
+ContextVar.get().
+"""
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template import TemplateDoesNotExist
+from django.template.backends.django import DjangoTemplates, Template, reraise
+
+_current = ContextVar("request_timings", default=None)
+
+
+class RequestTimings:
+    """What one request spent, and where."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.total_seconds = None
+        self.queries = []  # (sql, params, seconds)
+        self.template_seconds = 0.0
+        self.template_depth = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def finish(self):
+        self.total_seconds = time.perf_counter() - self.started
+
+    @property
+    def db_seconds(self):
+        return sum(seconds for _, _, seconds in self.queries)
+
+    def duplicates(self):
+        """
+        [(sql, times run, times with identical parameters)] for every
+        statement run more than once, most repeated first. Many runs of
+        the same SQL with different parameters is the N+1 signature.
+        """
+        similar = Counter(sql for sql, _, _ in self.queries)
+        exact = Counter((sql, repr(params)) for sql, params, _ in self.queries)
+        repeated = {sql: count for sql, count in similar.items() if count > 1}
+        identical = Counter()
+        for (sql, _), count in exact.items():
+            if sql in repeated and count > 1:
+                identical[sql] += count
+        return sorted(
+            ((sql, count, identical[sql]) for sql, count in repeated.items()),
+            key=lambda item: -item[1],
+        )
+
+    def summary(self):
+        return {
+            "total_ms": round(1000 * (self.total_seconds or 0), 2),
+            "db_ms": round(1000 * self.db_seconds, 2),
+            "queries": len(self.queries),
+            "template_ms": round(1000 * self.template_seconds, 2),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+    def server_timing(self):
+        """The Server-Timing header value."""
+        summary = self.summary()
+        return ", ".join((
+            f'db;dur={summary["db_ms"]};desc="{summary["queries"]} queries"',
+            f'tpl;dur={summary["template_ms"]}',
+            f'cache;desc="{summary["cache_hits"]} hits, {summary["cache_misses"]} misses"',
+            f'total;dur={summary["total_ms"]}',
+        ))
+
+
+def start():
+    """Collect timings for the current context. Returns (timings, token)."""
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def stop(token):
+    _current.reset(token)
+
+
+def current():
+    return _current.get()
+
+
+def query_wrapper(execute, sql, params, many, context):
+    """A connection.execute_wrapper recording into the current request."""
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        # executemany parameters can be huge and never repeat a query
+        timings.queries.append((sql, None if many else params, time.perf_counter() - started))
+
+
+def _install_wrapper(sender, connection, **kwargs):
+    if query_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_wrapper)
+
+
+def install():
+    """
+    Time queries on every connection: those open in this thread now and,
+    through connection_created, every one opened later in any thread.
+    """
+    connection_created.connect(_install_wrapper, dispatch_uid="core.instrumentation")
+    for connection in connections.all(initialized_only=True):
+        _install_wrapper(None, connection)
+
+
+def record_cache(hits=0, misses=0):
+    timings = _current.get()
+    if timings is not None:
+        timings.cache_hits += hits
+        timings.cache_misses += misses
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        timings = _current.get()
+        if timings is None or timings.template_depth:
+            # Not measured, or inside an outer render that already is
+            return super().render(context, request)
+        timings.template_depth += 1
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timings.template_depth -= 1
+            timings.template_seconds += time.perf_counter() - started
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """The Django template backend, timing renders for RequestTimings."""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return TimedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
@@ -0,0 +1,225 @@
+# core/management/commands/benchmark_concurrency.py
+import asyncio
+import io
+import logging
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+from blogs.models import Blog
+
+DEFAULT_CLIENTS = (100, 250, 500, 1000)
+
+SERVERS = ("wsgi", "asgi", "asgi-sync")
+
+
+def wsgi_get(application, path):
+    """One GET through a WSGI application; returns the status code."""
+    path, _, query = path.partition("?")
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": "localhost",
+        "REMOTE_ADDR": "127.0.0.1",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": "http",
+        "wsgi.input": io.BytesIO(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    statuses = []
+
+    def start_response(status, headers, exc_info=None):
+        statuses.append(status)
+
+    body = application(environ, start_response)
+    try:
+        for _ in body:
+            pass
+    finally:
+        if hasattr(body, "close"):
+            body.close()
+    return int(statuses[0][:3])
+
+
+async def asgi_get(application, path):
+    """One GET through an ASGI application; returns the status code."""
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"localhost")],
+        "server": ("localhost", 80),
+        "client": ("127.0.0.1", 50000),
+    }
+    finished = asyncio.Event()
+    requested = False
+    status = None
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and not message.get("more_body"):
+            finished.set()
+
+    await application(scope, receive, send)
+    return status
+
+
+async def load(fetch, paths, clients, seconds):
+    """
+    `clients` concurrent clients, each requesting `paths` in turn for
+    `seconds`. Returns (requests/s, [latency seconds], server errors).
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + seconds
+    latencies = []
+    errors = 0
+
+    async def client(offset):
+        nonlocal errors
+        count = offset
+        while loop.time() < deadline:
+            path = paths[count % len(paths)]
+            count += 1
+            started = time.perf_counter()
+            status = await fetch(path)
+            latencies.append(time.perf_counter() - started)
+            if status is None or status >= 500:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(offset) for offset in range(clients)))
+    return len(latencies) / (time.perf_counter() - started), latencies, errors
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare WSGI and ASGI throughput and latency of the read-heavy "
+        "pages (home, blog list, blog detail) at 100-1000 concurrent "
+        "clients. Both applications run in this process: WSGI requests "
+        "go to a thread pool, as in a threaded WSGI server, ASGI requests "
+        "to the event loop (asgi-sync: ASGI with the sync views, for "
+        "comparison). Network and server overhead is not included. "
+        "Run it against the current database (seed it with `manage.py "
+        "seed_data` first)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--clients",
+            type=int,
+            nargs="+",
+            default=list(DEFAULT_CLIENTS),
+            help="Concurrency levels to measure.",
+        )
+        parser.add_argument("--seconds", type=float, default=5.0, help="Duration of each run.")
+        parser.add_argument(
+            "--wsgi-threads",
+            type=int,
+            default=8,
+            help="Worker threads serving WSGI requests.",
+        )
+        parser.add_argument(
+            "--server",
+            action="append",
+            choices=SERVERS,
+            help="Server to measure (repeatable; default: wsgi and asgi).",
+        )
+        parser.add_argument(
+            "--path",
+            action="append",
+            help="Request this path instead of the default pages (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        paths = options["path"] or self._default_paths()
+        servers = options["server"] or ("wsgi", "asgi")
+        # Under this load nearly every request is "slow"; keep the log quiet
+        logging.getLogger("core.middleware").setLevel(logging.ERROR)
+
+        self.stdout.write(f"Paths: {', '.join(paths)}")
+        self.stdout.write(
+            f"{'server':<10}{'clients':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+            f"{'p99 ms':>10}{'errors':>8}"
+        )
+        for server in servers:
+            fetch, close = self._fetcher(server, options["wsgi_threads"])
+            try:
+                asyncio.run(self._warm_up(fetch, paths))
+                for clients in options["clients"]:
+                    rate, latencies, errors = asyncio.run(
+                        load(fetch, paths, clients, options["seconds"])
+                    )
+                    self._report(server, clients, rate, latencies, errors)
+            finally:
+                close()
+
+    def _default_paths(self):
+        detail = list(
+            Blog.objects.filter(status="published").values_list("pk", flat=True)[:20]
+        )
+        if not detail:
+            raise CommandError("No published blogs; run `manage.py seed_data` first.")
+        return ["/", "/blogs/", *(f"/blogs/{pk}/" for pk in detail)]
+
+    def _fetcher(self, server, threads):
+        if server == "asgi":
+            from central_platform.asgi import application
+
+            return (lambda path: asgi_get(application, path)), (lambda: None)
+        if server == "asgi-sync":
+            from django.core.asgi import get_asgi_application
+
+            application = get_asgi_application()
+            return (lambda path: asgi_get(application, path)), (lambda: None)
+
+        from django.core.wsgi import get_wsgi_application
+
+        application = get_wsgi_application()
+        pool = ThreadPoolExecutor(max_workers=threads)
+
+        def fetch(path):
+            loop = asyncio.get_running_loop()
+            return loop.run_in_executor(pool, wsgi_get, application, path)
+
+        return fetch, pool.shutdown
+
+    async def _warm_up(self, fetch, paths):
+        for path in paths:
+            await fetch(path)
+
+    def _report(self, server, clients, rate, latencies, errors):
+        if len(latencies) < 2:
+            self.stdout.write(f"{server:<10}{clients:>8}  too few requests; use more --seconds")
+            return
+        cuts = statistics.quantiles(latencies, n=100)
+        self.stdout.write(
+            f"{server:<10}{clients:>8}{rate:>10.1f}{1000 * cuts[49]:>10.1f}"
+            f"{1000 * cuts[94]:>10.1f}{1000 * cuts[98]:>10.1f}{errors:>8}"
+        )
@@ -0,0 +1,117 @@
+# core/management/commands/benchmark_urls.py
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from blogs.cache import bump_published_version
+from core.benchmarking import (
+    ROLES,
+    ROUTES,
+    baseline_path,
+    check,
+    get_tolerance,
+    load_baseline,
+    run,
+    save_baseline,
+    seed_fixture,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a fixed dataset (rolled back afterwards), request every URL as "
+        "an anonymous visitor, a user and an admin, and report latency "
+        "percentiles and SQL queries. With --check, fail if a URL goes over "
+        "its query budget or its p95 regresses past BENCHMARK_BASELINE."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20, help="Timed requests per URL and role.")
+        parser.add_argument("--warmup", type=int, default=2, help="Untimed requests first.")
+        parser.add_argument("--blogs", type=int, default=300, help="Blogs in the dataset.")
+        parser.add_argument("--users", type=int, default=50, help="Authors in the dataset.")
+        parser.add_argument(
+            "--route",
+            action="append",
+            choices=sorted(ROUTES),
+            help="Only this route (repeatable).",
+        )
+        parser.add_argument(
+            "--role",
+            action="append",
+            choices=ROLES,
+            help="Only this role (repeatable).",
+        )
+        parser.add_argument(
+            "--baseline",
+            help="Baseline file (default: BENCHMARK_BASELINE).",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            help="Allowed p95 growth over the baseline, e.g. 0.25 (default: BENCHMARK_TOLERANCE).",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Write this run's latencies as the new baseline.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Exit with an error on a query budget or latency regression.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            fixture = seed_fixture(options["blogs"], options["users"])
+            results = run(
+                fixture,
+                iterations=max(options["iterations"], 1),
+                warmup=max(options["warmup"], 0),
+                routes=options["route"],
+                roles=options["role"] or ROLES,
+            )
+            transaction.set_rollback(True)
+        # Cached pages may reference the rolled-back rows
+        bump_published_version()
+
+        baseline = load_baseline(options["baseline"])
+        self.stdout.write(
+            f"{'route':<22}{'role':<11}{'status':>6}{'queries':>9}{'budget':>8}"
+            f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'base p95':>10}"
+        )
+        for result in results:
+            previous = baseline.get(f"{result['route']}:{result['role']}")
+            base = f"{previous['p95']:.1f}" if previous else "-"
+            queries = f"{result['queries']:>9}"
+            if result["queries"] > result["budget"]:
+                queries = self.style.ERROR(queries)
+            self.stdout.write(
+                f"{result['route']:<22}{result['role']:<11}{result['status']:>6}{queries}"
+                f"{result['budget']:>8}{result['p50']:>9.1f}{result['p95']:>9.1f}"
+                f"{result['p99']:>9.1f}{base:>10}"
+            )
+
+        if options["save_baseline"]:
+            path = save_baseline(results, options["baseline"])
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {path}."))
+            baseline = {}
+        elif not baseline:
+            self.stdout.write(self.style.WARNING(
+                f"No baseline at {options['baseline'] or baseline_path()}; "
+                "only query budgets are checked. Record one with --save-baseline."
+            ))
+
+        tolerance = options["tolerance"]
+        if tolerance is None:
+            tolerance = get_tolerance()
+        failures = check(results, baseline, tolerance)
+        if failures:
+            message = "Benchmark regressions:\n  " + "\n  ".join(failures)
+            if options["check"]:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"All {len(results)} URL/role pairs within budget."
+            ))
@@ -0,0 +1,85 @@
+# core/management/commands/generate_image_derivatives.py
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from accounts.models import CustomUser
+from blogs.models import Blog
+from core.images import has_derivatives, render_derivatives
+
+
+def _render(job):
+    name, kind = job
+    try:
+        render_derivatives(name, kind)
+    except Exception as exc:  # reported by the parent process
+        return name, f"{exc.__class__.__name__}: {exc}"
+    return name, None
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate thumbnails and responsive WebP/JPEG variants for every "
+        "uploaded blog image and profile image, using a process pool."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Worker processes (defaults to the number of CPUs).",
+        )
+        parser.add_argument(
+            "--kind",
+            choices=["all", "blog", "avatar"],
+            default="all",
+        )
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Skip images whose derivatives already exist.",
+        )
+
+    def _jobs(self, kind, missing_only):
+        sources = []
+        if kind in ("all", "blog"):
+            sources.append(
+                ("blog", Blog.objects.exclude(image="").exclude(image__isnull=True)
+                 .values_list("image", flat=True))
+            )
+        if kind in ("all", "avatar"):
+            sources.append(
+                ("avatar", CustomUser.objects.exclude(profile_image="")
+                 .exclude(profile_image__isnull=True)
+                 .values_list("profile_image", flat=True))
+            )
+        for image_kind, names in sources:
+            for name in names.iterator(chunk_size=2000):
+                if missing_only and has_derivatives(name, image_kind):
+                    continue
+                yield name, image_kind
+
+    def handle(self, *args, **options):
+        jobs = list(self._jobs(options["kind"], options["missing_only"]))
+        if not jobs:
+            self.stdout.write("No images to process.")
+            return
+
+        # Forked workers must not share the parent's database connections
+        connections.close_all()
+
+        failures = 0
+        with ProcessPoolExecutor(max_workers=options["workers"]) as pool:
+            futures = [pool.submit(_render, job) for job in jobs]
+            for done, future in enumerate(as_completed(futures), start=1):
+                name, error = future.result()
+                if error:
+                    failures += 1
+                    self.stderr.write(f"{name}: {error}")
+                self.stdout.write(f"  {done}/{len(jobs)}", ending="\r")
+
+        self.stdout.write("")
+        style = self.style.WARNING if failures else self.style.SUCCESS
+        self.stdout.write(style(f"Processed {len(jobs) - failures} images, {failures} failed."))
@@ -0,0 +1,74 @@
+# core/management/commands/profile_startup.py
+import statistics
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.startup import check_budget, get_budget, package_totals, profile_startup
+
+
+class Command(BaseCommand):
+    help = (
+        "Boot the project the way a web worker does, under `python -X "
+        "importtime`, and report cold-start time, RSS and the slowest "
+        "imports. With --check, fail if STARTUP_BUDGET is exceeded."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=15, help="Rows per table.")
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=3,
+            help="Boots to time; the median is reported and checked.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Exit with an error if the startup budget is exceeded.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            profiles = [profile_startup() for _ in range(max(options["runs"], 1))]
+        except RuntimeError as exc:
+            raise CommandError(str(exc))
+        profile = sorted(profiles, key=lambda item: item["seconds"])[len(profiles) // 2]
+        top = options["top"]
+
+        self.stdout.write("Slowest packages (self import time):")
+        totals = sorted(package_totals(profile["imports"]).items(), key=lambda item: -item[1])
+        for package, micros in totals[:top]:
+            self.stdout.write(f"  {micros / 1000:9.1f} ms  {package}")
+
+        self.stdout.write("Slowest top-level imports (cumulative):")
+        outermost = [entry for entry in profile["imports"] if entry[3] == 0]
+        for name, _, cumulative, _ in sorted(outermost, key=lambda entry: -entry[2])[:top]:
+            self.stdout.write(f"  {cumulative / 1000:9.1f} ms  {name}")
+
+        budget = get_budget()
+        rss = profile["rss_bytes"]
+        timings = ", ".join(format(item["seconds"], ".3f") for item in profiles)
+        self.stdout.write(
+            f"Cold start   {profile['seconds']:.3f} s median of {len(profiles)} "
+            f"({timings}; budget {budget['seconds']:.2f} s)"
+        )
+        self.stdout.write(f"Import time  {profile['import_seconds']:.3f} s")
+        self.stdout.write(
+            f"RSS          {'n/a' if rss is None else f'{rss / 2 ** 20:.1f} MiB'}"
+            f" (budget {budget['rss_mb']} MiB)"
+        )
+        self.stdout.write(
+            f"Modules      {len(profile['modules'])} (budget {budget['max_modules']})"
+        )
+        spread = statistics.pstdev(item["seconds"] for item in profiles)
+        if spread > profile["seconds"] / 4:
+            self.stdout.write(self.style.WARNING("Timings vary a lot; use more --runs."))
+
+        problems = check_budget(profile, budget)
+        if problems:
+            message = "Startup budget exceeded:\n  " + "\n  ".join(problems)
+            if options["check"]:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS("Within the startup budget."))
@@ -0,0 +1,118 @@
+# core/management/commands/seed_data.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max
+
+from accounts.models import CustomUser
+from blogs.models import Blog
+from core.seeding import (
+    DEFAULT_BATCH_SIZE,
+    finish,
+    generate_blogs,
+    generate_users,
+    import_ndjson,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate synthetic users and blogs with realistic distributions "
+        "(status mix, categories, content lengths, author skew, timestamps "
+        "over several years) and/or import NDJSON files written by "
+        "export_data, using batched bulk_create. Then re-index the new "
+        "blogs and recount the dashboard statistics."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=0, help="Users to generate.")
+        parser.add_argument("--blogs", type=int, default=0, help="Blogs to generate.")
+        parser.add_argument(
+            "--import",
+            dest="imports",
+            action="append",
+            default=[],
+            metavar="PATH",
+            help="NDJSON (or .ndjson.gz) file of users or blogs; repeatable. "
+                 "Import users before the blogs that reference them.",
+        )
+        parser.add_argument("--years", type=int, default=3, help="Span of the timestamps.")
+        parser.add_argument(
+            "--content-median",
+            type=int,
+            default=1500,
+            help="Median content length in characters.",
+        )
+        parser.add_argument("--seed", type=int, help="Random seed, for repeatable data.")
+        parser.add_argument(
+            "--password",
+            help="Password for every new user (default: unusable).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Rows per bulk_create and per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        if not (options["users"] or options["blogs"] or options["imports"]):
+            raise CommandError("Nothing to do: pass --users, --blogs and/or --import.")
+
+        started = time.perf_counter()
+        since_pk = Blog.objects.aggregate(last=Max("pk"))["last"] or 0
+        batch_size = options["batch_size"]
+
+        for path in options["imports"]:
+            try:
+                dataset, inserted, skipped = import_ndjson(
+                    path, batch_size, options["password"]
+                )
+            except (OSError, ValueError, KeyError) as exc:
+                raise CommandError(f"Could not import {path}: {exc!r}")
+            reason = "unknown author" if dataset == "blogs" else "already exist"
+            note = f" ({skipped:,} skipped: {reason})" if skipped else ""
+            self.stdout.write(
+                f"Imported {inserted:,} {dataset or 'records'} from {path}{note}."
+            )
+
+        authors = {}
+        if options["users"]:
+            authors = generate_users(
+                options["users"],
+                years=options["years"],
+                seed=options["seed"],
+                password=options["password"],
+                batch_size=batch_size,
+            )
+            self.stdout.write(f"Created {len(authors):,} users ({self._elapsed(started)}).")
+
+        if options["blogs"]:
+            if not authors:
+                authors = dict(CustomUser.objects.values_list("pk", "date_joined"))
+            if not authors:
+                raise CommandError("No users to write the blogs; pass --users.")
+            created = generate_blogs(
+                options["blogs"],
+                authors,
+                years=options["years"],
+                seed=options["seed"],
+                content_median=options["content_median"],
+                batch_size=batch_size,
+                progress=lambda done: self.stdout.write(
+                    f"  {done:,} blogs ({self._elapsed(started)})"
+                ),
+            )
+            self.stdout.write(f"Created {created:,} blogs ({self._elapsed(started)}).")
+
+        indexed = finish(since_pk)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Indexed {indexed:,} new blogs and recounted statistics "
+                f"({self._elapsed(started)} total)."
+            )
+        )
+
+    @staticmethod
+    def _elapsed(started):
+        return f"{time.perf_counter() - started:.1f} s"
@@ -0,0 +1,116 @@
+# core/middleware.py
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from . import instrumentation
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OPTIONS = {
+    "enabled": True,
+    # Who gets the Server-Timing header: "staff" (staff users, everyone
+    # when DEBUG is on), True (everyone) or False (nobody). It shows query
+    # counts and cache behaviour, so it is not for every visitor.
+    "server_timing": "staff",
+    "slow_request_ms": 500,
+    # Slowest queries listed in a slow request's log entry
+    "slow_query_limit": 20,
+}
+
+
+def get_options():
+    return {**DEFAULT_OPTIONS, **getattr(settings, "REQUEST_TIMING", {})}
+
+
+def _logfmt(fields):
+    return " ".join(f"{key}={value}" for key, value in fields.items())
+
+
+class RequestTimingMiddleware:
+    """
+    Time every request: SQL queries, template rendering, cache hits and
+    misses and the total (see core/instrumentation.py). Adds a
+    Server-Timing header for staff (see DEFAULT_OPTIONS) and logs one
+    structured line per request to
+    "core.middleware" at INFO (the fields are also in the record's
+    `request_timing` attribute for JSON formatters). Requests slower
+    than slow_request_ms are logged at WARNING with their slowest
+    queries and any repeated statements, so N+1 patterns stand out.
+
+    Works under WSGI and ASGI (async views are not pushed to a thread).
+    Streaming bodies are produced after the middleware returns; their
+    queries are not counted. Disabled, the middleware is removed from
+    the stack entirely (MiddlewareNotUsed) and no query hook is installed.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        options = get_options()
+        if not options["enabled"]:
+            raise MiddlewareNotUsed
+        instrumentation.install()
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        self.server_timing = options["server_timing"]
+        self.slow_seconds = options["slow_request_ms"] / 1000
+        self.slow_query_limit = options["slow_query_limit"]
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings, token = instrumentation.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            instrumentation.stop(token)
+        user = getattr(request, "user", None) if self.staff_only() else None
+        return self.finish(request, response, timings, user)
+
+    async def __acall__(self, request):
+        timings, token = instrumentation.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            instrumentation.stop(token)
+        user = await request.auser() if self.staff_only() and hasattr(request, "auser") else None
+        return self.finish(request, response, timings, user)
+
+    def staff_only(self):
+        return self.server_timing == "staff" and not settings.DEBUG
+
+    def finish(self, request, response, timings, user=None):
+        timings.finish()
+        if self.server_timing is True or (
+            self.server_timing == "staff" and (settings.DEBUG or getattr(user, "is_staff", False))
+        ):
+            response["Server-Timing"] = timings.server_timing()
+        self.log(request, response, timings)
+        return response
+
+    def log(self, request, response, timings):
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            **timings.summary(),
+        }
+        if timings.total_seconds < self.slow_seconds:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(_logfmt(fields), extra={"request_timing": fields})
+            return
+
+        lines = [f"slow request {_logfmt(fields)}"]
+        slowest = sorted(timings.queries, key=lambda query: -query[2])
+        for sql, _, seconds in slowest[:self.slow_query_limit]:
+            lines.append(f"  {1000 * seconds:8.2f} ms  {sql}")
+        duplicates = timings.duplicates()
+        for sql, count, identical in duplicates:
+            lines.append(f"  repeated {count}x ({identical} identical): {sql}")
+        fields["repeated_queries"] = len(duplicates)
+        logger.warning("\n".join(lines), extra={"request_timing": fields})
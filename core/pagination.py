@@ -0,0 +1,361 @@
+# core/pagination.py
+"""
+Keyset (cursor) pagination.
+
+Django's Paginator runs a COUNT(*) on every request and uses OFFSET, which
+gets slower the deeper a visitor pages. CursorPaginator instead filters on
+the last row it showed, e.g. for the default ordering:
+
+    WHERE (created_at < c) OR (created_at = c AND id < i)
+    ORDER BY created_at DESC, id DESC
+    LIMIT per_page + 1
+
+and hands out opaque next/previous tokens. It never counts the full set;
+templates that want a total can use `page.total_count`, which is cached.
+
+Old ``?page=N`` links still work: they are served with a single OFFSET
+query and every link on the resulting page is a cursor again.
+"""
+import base64
+import binascii
+import hashlib
+import json
+from collections.abc import Sequence
+from functools import cached_property
+
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from django.http import QueryDict
+
+from .instrumentation import record_cache
+
+DEFAULT_ORDERING = ("-created_at", "-id")
+
+# How long an approximate total count stays cached (seconds).
+COUNT_CACHE_TIMEOUT = 300
+
+# Databases store LIMIT/OFFSET as signed 64-bit integers; legacy page
+# numbers that would go past it are served as page 1.
+MAX_OFFSET = 2**63 - 1
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorPage(Sequence):
+    """
+    One page of results. Rows are fetched lazily on first access, so a page
+    that a template never renders never hits the database.
+    """
+
+    def __init__(self, paginator, *, after=None, before=None, number=None):
+        self.paginator = paginator
+        self.number = number
+        self._after = after
+        self._before = before
+
+    @cached_property
+    def _window(self):
+        return self.paginator._fetch(
+            after=self._after, before=self._before, number=self.number
+        )
+
+    async def aload(self):
+        """
+        Fetch the rows with the async ORM, for async views: later access
+        (templates included) then needs no query.
+        """
+        if "_window" not in self.__dict__:
+            self.__dict__["_window"] = await self.paginator._afetch(
+                after=self._after, before=self._before, number=self.number
+            )
+        return self
+
+    @property
+    def object_list(self):
+        return self._window[0]
+
+    @property
+    def has_next(self):
+        return self._window[1]
+
+    @property
+    def has_previous(self):
+        return self._window[2]
+
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+    @property
+    def next_cursor(self):
+        if not self.has_next or not self.object_list:
+            return None
+        return self.paginator.encode_cursor(self.object_list[-1])
+
+    @property
+    def previous_cursor(self):
+        if not self.has_previous or not self.object_list:
+            return None
+        return self.paginator.encode_cursor(self.object_list[0], reverse=True)
+
+    @property
+    def next_query(self):
+        """Query string (with leading '?') linking to the next page."""
+        return self.paginator.build_query(self.next_cursor)
+
+    @property
+    def previous_query(self):
+        """Query string (with leading '?') linking to the previous page."""
+        return self.paginator.build_query(self.previous_cursor)
+
+    @property
+    def total_count(self):
+        return self.paginator.approximate_count()
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __repr__(self):
+        return f"<CursorPage of {self.paginator.queryset.model.__name__}>"
+
+
+class CursorPaginator:
+    """
+    Paginate `queryset` by the unique `ordering` (field names, optionally
+    prefixed with '-'). The last ordering field must make rows unique,
+    which is why the default ends with "-id". Pass `count` when the total
+    is already known, so `page.total_count` doesn't run its own COUNT.
+    """
+
+    def __init__(
+        self,
+        queryset,
+        per_page,
+        ordering=DEFAULT_ORDERING,
+        cursor_param="cursor",
+        page_param="page",
+        query_params=None,
+        count=None,
+    ):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self.cursor_param = cursor_param
+        self.page_param = page_param
+        self.query_params = query_params
+        self.count = count
+
+    # -- public API ---------------------------------------------------------
+
+    def page(self, cursor=None):
+        """Return the page addressed by an opaque cursor (first page if None)."""
+        if not cursor:
+            return CursorPage(self, number=1)
+        try:
+            values, reverse = self.decode_cursor(cursor)
+        except InvalidCursor:
+            return CursorPage(self, number=1)
+        if reverse:
+            return CursorPage(self, before=values)
+        return CursorPage(self, after=values)
+
+    def page_number(self, number):
+        """Return a page addressed by legacy page number (1-based)."""
+        try:
+            number = max(int(number), 1)
+        except (TypeError, ValueError):
+            number = 1
+        if number * self.per_page + 1 > MAX_OFFSET:
+            number = 1
+        return CursorPage(self, number=number)
+
+    def page_from_request(self, request):
+        """
+        Resolve the page for a request. A cursor wins over a page number;
+        links built by the returned page keep the other GET parameters.
+        """
+        if self.query_params is None:
+            self.query_params = request.GET
+        cursor = request.GET.get(self.cursor_param)
+        if cursor:
+            return self.page(cursor)
+        return self.page_number(request.GET.get(self.page_param))
+
+    def approximate_count(self):
+        """
+        Total number of rows, cached for COUNT_CACHE_TIMEOUT seconds.
+        Good enough for "about N results"; never exact under writes.
+        """
+        if self.count is not None:
+            return self.count
+        key = self._count_key()
+        count = cache.get(key)
+        record_cache(hits=count is not None, misses=count is None)
+        if count is None:
+            count = self.queryset.count()
+            cache.set(key, count, COUNT_CACHE_TIMEOUT)
+        return count
+
+    async def aapproximate_count(self):
+        """approximate_count() for async views; also sets self.count."""
+        if self.count is None:
+            key = self._count_key()
+            count = await cache.aget(key)
+            record_cache(hits=count is not None, misses=count is None)
+            if count is None:
+                count = await self.queryset.acount()
+                await cache.aset(key, count, COUNT_CACHE_TIMEOUT)
+            self.count = count
+        return self.count
+
+    def build_query(self, cursor):
+        if cursor is None:
+            return None
+        params = (self.query_params or QueryDict()).copy()
+        params[self.cursor_param] = cursor
+        params.pop(self.page_param, None)
+        return f"?{params.urlencode()}"
+
+    # -- cursors ------------------------------------------------------------
+
+    def encode_cursor(self, obj, reverse=False):
+        values = [self._value_for(obj, name) for name, _ in self._fields]
+        payload = {"v": [self._dump(value) for value in values]}
+        if reverse:
+            payload["r"] = 1
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            raw_values = payload["v"]
+            reverse = bool(payload.get("r"))
+        except (ValueError, KeyError, TypeError, AttributeError, binascii.Error):
+            raise InvalidCursor(cursor)
+        if not isinstance(raw_values, list) or len(raw_values) != len(self._fields):
+            raise InvalidCursor(cursor)
+        try:
+            values = [
+                self._load(name, value)
+                for (name, _), value in zip(self._fields, raw_values)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise InvalidCursor(cursor)
+        return values, reverse
+
+    # -- internals ----------------------------------------------------------
+
+    @cached_property
+    def _fields(self):
+        """[(field_name, descending), ...] for the ordering."""
+        return [
+            (name.lstrip("-"), name.startswith("-")) for name in self.ordering
+        ]
+
+    def _order_by(self, reverse=False):
+        order = []
+        for name, descending in self._fields:
+            if descending != reverse:
+                order.append(f"-{name}")
+            else:
+                order.append(name)
+        return order
+
+    def _keyset_filter(self, values, reverse=False):
+        """
+        Rows strictly after `values` in the ordering (or before, if reverse).
+        """
+        condition = Q()
+        equal_prefix = Q()
+        for (name, descending), value in zip(self._fields, values):
+            lookup = "lt" if descending != reverse else "gt"
+            condition |= equal_prefix & Q(**{f"{name}__{lookup}": value})
+            equal_prefix &= Q(**{name: value})
+        return condition
+
+    def page_queryset(self, *, after=None, before=None, number=None):
+        """
+        The LIMITed queryset a page runs (one row more than per_page, to
+        detect a following page). Exposed for EXPLAIN checks.
+        """
+        limit = self.per_page + 1
+        if before is not None:
+            queryset = self.queryset.filter(self._keyset_filter(before, reverse=True))
+            return queryset.order_by(*self._order_by(reverse=True))[:limit]
+
+        queryset = self.queryset.order_by(*self._order_by())
+        if after is not None:
+            return queryset.filter(self._keyset_filter(after))[:limit]
+        offset = ((number or 1) - 1) * self.per_page
+        return queryset[offset:offset + limit]
+
+    def _count_key(self):
+        sql, params = self.queryset.query.sql_with_params()
+        digest = hashlib.md5(f"{sql}|{params!r}".encode()).hexdigest()
+        return f"pagination:count:{digest}"
+
+    def _fetch(self, after=None, before=None, number=None):
+        """Return (rows, has_next, has_previous)."""
+        rows = list(self.page_queryset(after=after, before=before, number=number))
+        return self._split(rows, after, before, number)
+
+    async def _afetch(self, after=None, before=None, number=None):
+        queryset = self.page_queryset(after=after, before=before, number=number)
+        rows = [row async for row in queryset]
+        return self._split(rows, after, before, number)
+
+    def _split(self, rows, after, before, number):
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if before is not None:
+            rows.reverse()
+            return rows, True, has_more
+        if after is not None:
+            return rows, has_more, True
+        return rows, has_more, (number or 1) > 1
+
+    def _value_for(self, obj, name):
+        if name in ("pk", "id"):
+            return obj.pk
+        try:
+            field = self.queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return getattr(obj, name)
+        return getattr(obj, field.attname)
+
+    def _load(self, name, value):
+        """
+        Turn a decoded cursor value back into a query value. Only non-null
+        scalars are accepted; annotations (e.g. search_rank) go through
+        their output field like model fields do.
+        """
+        if value is None or not isinstance(value, (str, int, float)):
+            raise ValueError(f"Invalid cursor value for {name!r}")
+        opts = self.queryset.model._meta
+        if name in self.queryset.query.annotations:
+            field = self.queryset.query.annotations[name].output_field
+        elif name == "pk":
+            field = opts.pk
+        else:
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                return value
+        value = field.to_python(value)
+        if value is None:
+            raise ValueError(f"Invalid cursor value for {name!r}")
+        return value
+
+    @staticmethod
+    def _dump(value):
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return value
@@ -0,0 +1,369 @@
+# core/seeding.py
+"""
+Synthetic data and bulk import for load testing (`manage.py seed_data`).
+
+Rows are built in memory a batch at a time and written with bulk_create,
+one transaction per batch, so a million blogs take minutes rather than
+the hours a save() per row would. bulk_create skips save() and the model
+signals, so everything they would have done is done here instead:
+
+- blogs get excerpt / content_html / content_hash computed up front;
+- admins get is_staff (CustomUser.save() normally does that);
+- created_at / updated_at keep the given values (auto_now fields are
+  switched off while inserting, see explicit_timestamps());
+- afterwards the caller re-indexes the new blogs, recounts the dashboard
+  statistics and bumps the cache version (see finish()).
+"""
+import bisect
+import gzip
+import json
+import random
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+from itertools import accumulate, chain, islice
+
+from django.contrib.auth.hashers import make_password
+from django.db import reset_queries, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from accounts.models import CustomUser
+from blogs.cache import bump_published_version, invalidate_author_summaries
+from blogs.models import EXCERPT_LENGTH, Blog
+from blogs.rendering import content_digest, render_content
+from blogs.search import get_search_backend
+from dashboard.stats import recount
+
+DEFAULT_BATCH_SIZE = 5000
+
+# Relative frequencies of the generated data.
+STATUS_WEIGHTS = {"published": 70, "pending": 10, "draft": 12, "rejected": 8}
+CATEGORY_WEIGHTS = {
+    "Technology": 22,
+    "Lifestyle": 15,
+    "Education": 12,
+    "Business": 12,
+    "Health": 10,
+    "Travel": 10,
+    "Sports": 9,
+    "General": 10,
+}
+ADMIN_SHARE = 0.01
+INACTIVE_SHARE = 0.04
+
+# Author skew: the k-th most prolific author writes ~1/k**AUTHOR_SKEW as
+# much as the first (Zipf), so a few authors own most of the posts.
+AUTHOR_SKEW = 1.1
+
+# Content lengths are log-normal around `content_median` characters.
+CONTENT_SIGMA = 0.9
+MIN_CONTENT = 80
+MAX_CONTENT = 40_000
+
+# Distinct bodies generated (and rendered) per run; blogs draw from them.
+BODY_POOL = 400
+
+WORDS = (
+    "the of and to in is for on with that this from by at as are be it an "
+    "or we can how your new more about our not what all have will one you "
+    "data time team work build guide best way day life plan trip health "
+    "learn school market money travel city game match training food home "
+    "design code python django cloud security design growth habit study "
+    "student teacher coffee morning mountain beach season coach player "
+    "budget startup product customer sleep doctor running recipe garden"
+).split()
+
+
+def _sentence(rng, low=6, high=18):
+    words = rng.choices(WORDS, k=rng.randint(low, high))
+    return " ".join(words).capitalize() + "."
+
+
+def _body(rng, length):
+    paragraphs = []
+    size = 0
+    while size < length:
+        paragraph = " ".join(_sentence(rng) for _ in range(rng.randint(2, 6)))
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(paragraphs)[:length].rstrip()
+
+
+def body_pool(rng, median, size=BODY_POOL):
+    """
+    [(content, excerpt, content_html, content_hash)] with log-normal
+    lengths; rendering each body once keeps generation cheap.
+    """
+    pool = []
+    for _ in range(size):
+        length = int(rng.lognormvariate(0, CONTENT_SIGMA) * median)
+        content = _body(rng, min(max(length, MIN_CONTENT), MAX_CONTENT))
+        pool.append(derived_fields(content))
+    return pool
+
+
+def derived_fields(content):
+    """What Blog.save() would compute from `content`."""
+    return (
+        content,
+        content[:EXCERPT_LENGTH],
+        render_content(content),
+        content_digest(content),
+    )
+
+
+def _growth(rng, start, end):
+    """
+    A moment between `start` and `end`, denser towards `end` (linear
+    growth in activity over time).
+    """
+    return start + (end - start) * rng.random() ** 0.5
+
+
+def _between(rng, start, end):
+    return start + (end - start) * rng.random()
+
+
+def _weighted(weights):
+    return list(weights), list(accumulate(weights.values()))
+
+
+@contextmanager
+def explicit_timestamps(model):
+    """Let bulk_create keep given values for auto_now/auto_now_add fields."""
+    fields = [
+        field for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now = auto_now
+            field.auto_now_add = auto_now_add
+
+
+def _insert(model, objects, batch_size, **kwargs):
+    """bulk_create `objects` one batch per transaction; returns the count."""
+    total = 0
+    objects = iter(objects)
+    with explicit_timestamps(model):
+        while batch := list(islice(objects, batch_size)):
+            with transaction.atomic():
+                model.objects.bulk_create(batch, batch_size=batch_size, **kwargs)
+            # With DEBUG on, every batch's SQL (content included) is logged
+            reset_queries()
+            total += len(batch)
+    return total
+
+
+def generate_users(count, years=3, seed=None, password=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Insert `count` users joined over the last `years` years. Returns the
+    new users' {pk: date_joined}.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    start = now - timedelta(days=365 * years)
+    tag = uuid.uuid4().hex[:6]
+    password = make_password(password)
+
+    def users():
+        for i in range(count):
+            role = "admin" if rng.random() < ADMIN_SHARE else "user"
+            username = f"seed_{tag}_{i:07d}"
+            yield CustomUser(
+                username=username,
+                email=f"{username}@example.com",
+                password=password,
+                role=role,
+                is_staff=role == "admin",
+                is_active=rng.random() >= INACTIVE_SHARE,
+                date_joined=_growth(rng, start, now),
+            )
+
+    _insert(CustomUser, users(), batch_size)
+    return dict(
+        CustomUser.objects.filter(username__startswith=f"seed_{tag}_")
+        .values_list("pk", "date_joined")
+    )
+
+
+def generate_blogs(count, authors, years=3, seed=None, content_median=1500,
+                   batch_size=DEFAULT_BATCH_SIZE, progress=None):
+    """
+    Insert `count` blogs by `authors` ({pk: date_joined}), each created
+    after its author joined. Returns the number inserted.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    floor = now - timedelta(days=365 * years)
+    pool = body_pool(rng, content_median)
+
+    # Longest-standing authors are the most prolific
+    author_ids = sorted(authors, key=authors.get)
+    author_weights = list(accumulate(
+        1 / (rank + 1) ** AUTHOR_SKEW for rank in range(len(author_ids))
+    ))
+    statuses, status_weights = _weighted(STATUS_WEIGHTS)
+    categories, category_weights = _weighted(CATEGORY_WEIGHTS)
+    moderators = list(
+        CustomUser.objects.filter(role="admin").values_list("pk", flat=True)[:50]
+    )
+
+    def blogs():
+        for i in range(count):
+            author_id = author_ids[
+                bisect.bisect(author_weights, rng.random() * author_weights[-1])
+            ]
+            # Joins already grow over time; uniform after joining keeps
+            # activity growing without piling it all up at the end
+            created_at = _between(rng, max(authors[author_id], floor), now)
+            updated_at = min(created_at + timedelta(hours=rng.expovariate(1 / 48)), now)
+            status = rng.choices(statuses, cum_weights=status_weights)[0]
+            content, excerpt, content_html, content_hash = rng.choice(pool)
+            approved_at = approved_by_id = None
+            if status == "published":
+                approved_at = min(created_at + timedelta(hours=rng.expovariate(1 / 36)), now)
+                approved_by_id = rng.choice(moderators) if moderators else None
+            yield Blog(
+                title=_sentence(rng, 3, 9).rstrip("."),
+                content=content,
+                excerpt=excerpt,
+                content_html=content_html,
+                content_hash=content_hash,
+                category=rng.choices(categories, cum_weights=category_weights)[0],
+                status=status,
+                author_id=author_id,
+                approved_by_id=approved_by_id,
+                approved_at=approved_at,
+                created_at=created_at,
+                updated_at=updated_at,
+            )
+            if progress and (i + 1) % 100_000 == 0:
+                progress(i + 1)
+
+    return _insert(Blog, blogs(), batch_size)
+
+
+def read_ndjson(path):
+    """Records of an NDJSON file (gzipped if the name ends in .gz), lazily."""
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as lines:
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _datetime(value, default=None):
+    parsed = parse_datetime(value) if value else None
+    if parsed is not None and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed or default
+
+
+def _user_from_record(record, password):
+    role = record.get("role") or "user"
+    return CustomUser(
+        username=record["username"],
+        email=record.get("email") or f"{record['username']}@example.com",
+        password=password,
+        role=role,
+        is_staff=bool(record.get("is_staff")) or role == "admin",
+        is_active=record.get("is_active", True),
+        date_joined=_datetime(record.get("date_joined"), timezone.now()),
+        last_login=_datetime(record.get("last_login")),
+    )
+
+
+def _blogs_from_records(records):
+    """
+    Blogs for a batch of records. Authors are matched by
+    `author__username` (or `author_id`); records whose author does not
+    exist are left out. Moderators are not carried over:
+    their ids belong to the exporting database.
+    """
+    usernames = {r["author__username"] for r in records if r.get("author__username")}
+    by_username = dict(
+        CustomUser.objects.filter(username__in=usernames).values_list("username", "pk")
+    )
+    ids = {r["author_id"] for r in records if not r.get("author__username") and r.get("author_id")}
+    known_ids = set(CustomUser.objects.filter(pk__in=ids).values_list("pk", flat=True))
+
+    now = timezone.now()
+    for record in records:
+        author_id = by_username.get(record.get("author__username"))
+        if author_id is None and record.get("author_id") in known_ids:
+            author_id = record["author_id"]
+        if author_id is None:
+            continue
+        content, excerpt, content_html, content_hash = derived_fields(record.get("content") or "")
+        created_at = _datetime(record.get("created_at"), now)
+        yield Blog(
+            title=record.get("title") or "",
+            content=content,
+            excerpt=excerpt,
+            content_html=content_html,
+            content_hash=content_hash,
+            category=record.get("category") or "General",
+            status=record.get("status") or "draft",
+            author_id=author_id,
+            approved_at=_datetime(record.get("approved_at")),
+            created_at=created_at,
+            updated_at=_datetime(record.get("updated_at"), created_at),
+        )
+
+
+def import_ndjson(path, batch_size=DEFAULT_BATCH_SIZE, password=None):
+    """
+    Stream an NDJSON file as written by `manage.py export_data` into the
+    database. The dataset (blogs or users) is recognised from the first
+    record. Users whose username or email already exists are skipped.
+    Returns (dataset, rows inserted, rows skipped).
+    """
+    records = read_ndjson(path)
+    first = next(records, None)
+    if first is None:
+        return None, 0, 0
+    dataset = "blogs" if "title" in first else "users"
+    records = chain([first], records)
+
+    model = Blog if dataset == "blogs" else CustomUser
+    before = model.objects.count()
+    read = 0
+    hashed = make_password(password)
+    with explicit_timestamps(model):
+        while batch := list(islice(records, batch_size)):
+            read += len(batch)
+            with transaction.atomic():
+                if dataset == "blogs":
+                    Blog.objects.bulk_create(_blogs_from_records(batch), batch_size=batch_size)
+                else:
+                    CustomUser.objects.bulk_create(
+                        (_user_from_record(record, hashed) for record in batch),
+                        batch_size=batch_size,
+                        ignore_conflicts=True,
+                    )
+            reset_queries()
+    inserted = model.objects.count() - before
+    return dataset, inserted, read - inserted
+
+
+def finish(since_blog_pk):
+    """
+    Do what the skipped signals would have: index blogs inserted after
+    `since_blog_pk`, recount the dashboard statistics and retire cached
+    pages and author summaries. Returns the number of blogs indexed.
+    """
+    new_blogs = Blog.objects.filter(pk__gt=since_blog_pk)
+    indexed = get_search_backend().index_many(new_blogs)
+    recount()
+    bump_published_version()
+    invalidate_author_summaries(
+        new_blogs.order_by().values_list("author_id", flat=True).distinct()
+    )
+    return indexed
@@ -0,0 +1,129 @@
+# core/startup.py
+"""
+Cold-start profiling for web worker processes.
+
+profile_startup() boots the project in a fresh interpreter run with
+``python -X importtime`` exactly as a gunicorn/uvicorn worker would (load
+the WSGI application, then the URLconf and with it every view module) and
+reports how long that took, the resident memory afterwards and which
+modules were imported, with per-module import times.
+
+check_budget() compares a profile against the STARTUP_BUDGET setting.
+Heavy integrations (the OpenAI SDK, NumPy, Pillow) must be imported
+lazily, inside the functions that use them, so they stay out of the
+web process; list them under "forbidden_modules" to keep it that way.
+"""
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+
+DEFAULT_BUDGET = {
+    "seconds": 2.0,
+    "rss_mb": 150,
+    "max_modules": 1000,
+    "forbidden_modules": [],
+}
+
+# Runs in the child interpreter; the last stdout line is the JSON result.
+BOOT_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+from django.urls import get_resolver
+get_resolver().url_patterns
+seconds = time.perf_counter() - started
+
+rss = None
+try:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                rss = int(line.split()[1]) * 1024
+except OSError:
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != "darwin":
+            rss *= 1024
+    except ImportError:
+        pass
+print(json.dumps({"seconds": seconds, "rss_bytes": rss, "modules": sorted(sys.modules)}))
+"""
+
+
+def get_budget():
+    return {**DEFAULT_BUDGET, **getattr(settings, "STARTUP_BUDGET", {})}
+
+
+def parse_importtime(output):
+    """
+    Parse ``-X importtime`` stderr into (module, self_us, cumulative_us,
+    depth) tuples, in the order the imports finished.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), int(fields[0]), int(fields[1]), depth))
+    return imports
+
+
+def profile_startup():
+    """Boot the project in a child interpreter and return its profile dict."""
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=str(settings.BASE_DIR),
+    )
+    if result.returncode:
+        raise RuntimeError(f"Project failed to start:\n{result.stderr[-2000:]}")
+
+    profile = json.loads(result.stdout.strip().splitlines()[-1])
+    profile["modules"] = set(profile["modules"])
+    profile["imports"] = parse_importtime(result.stderr)
+    profile["import_seconds"] = sum(entry[1] for entry in profile["imports"]) / 1e6
+    return profile
+
+
+def package_totals(imports):
+    """Self import time (microseconds) summed per top-level package."""
+    totals = {}
+    for name, self_us, _, _ in imports:
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0) + self_us
+    return totals
+
+
+def check_budget(profile, budget=None):
+    """Return a list of human-readable budget violations (empty if within)."""
+    budget = budget or get_budget()
+    problems = []
+    if profile["seconds"] > budget["seconds"]:
+        problems.append(
+            f"cold start took {profile['seconds']:.2f} s (budget {budget['seconds']:.2f} s)"
+        )
+    if profile["rss_bytes"] is not None and profile["rss_bytes"] > budget["rss_mb"] * 2 ** 20:
+        problems.append(
+            f"RSS after startup is {profile['rss_bytes'] / 2 ** 20:.0f} MiB "
+            f"(budget {budget['rss_mb']} MiB)"
+        )
+    if len(profile["modules"]) > budget["max_modules"]:
+        problems.append(
+            f"{len(profile['modules'])} modules imported (budget {budget['max_modules']})"
+        )
+    for module in budget["forbidden_modules"]:
+        if module in profile["modules"]:
+            problems.append(f"{module} is imported at startup; import it lazily")
+    return problems
@@ -0,0 +1,9 @@
+# core/tasks.py
+from jobs.queue import task
+
+from .images import render_derivatives
+
+
+@task("core.render_image_derivatives", max_attempts=3)
+def render_image_derivatives(source_name, kind):
+    render_derivatives(source_name, kind)
@@ -0,0 +1,64 @@
+# core/templatetags/image_tags.py
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from core.images import FORMATS, RESPONSIVE, SPECS, derivative_name, has_derivatives
+
+register = template.Library()
+
+
+def _url(fieldfile, spec_name, extension):
+    return fieldfile.storage.url(derivative_name(fieldfile.name, spec_name, extension))
+
+
+@register.simple_tag
+def image_srcset(fieldfile, kind, extension="webp", spec=None):
+    """
+    `srcset` value for an image's derivatives: width descriptors for the
+    responsive sizes, or 1x/2x descriptors for a fixed-size spec.
+    """
+    if spec is None:
+        return ", ".join(
+            f"{_url(fieldfile, name, extension)} {width}w"
+            for name, width in RESPONSIVE[kind]
+        )
+    candidates = [f"{_url(fieldfile, spec, extension)} 1x"]
+    if any(name == f"{spec}2x" for name, _, _ in SPECS[kind]):
+        candidates.append(f"{_url(fieldfile, f'{spec}2x', extension)} 2x")
+    return ", ".join(candidates)
+
+
+@register.simple_tag
+def responsive_image(fieldfile, kind, spec=None, alt="", sizes="100vw", css_class=""):
+    """
+    <picture> with a WebP source and a JPEG fallback. Until the derivatives
+    have been generated, renders the original upload instead.
+    """
+    if not fieldfile:
+        return ""
+    if not has_derivatives(fieldfile.name, kind, fieldfile.storage):
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" loading="lazy">',
+            fieldfile.url, alt, css_class,
+        )
+
+    sources = [
+        (f"image/{extension}", image_srcset(fieldfile, kind, extension, spec))
+        for extension, _, _ in FORMATS[:-1]
+    ]
+    # `sizes` only applies to width descriptors, not 1x/2x candidates
+    sizes_attr = format_html(' sizes="{}"', sizes) if spec is None else ""
+    fallback_extension = FORMATS[-1][0]
+    fallback_spec = spec or RESPONSIVE[kind][0][0]
+    return format_html(
+        '<picture>{}<img src="{}" srcset="{}"{} alt="{}" class="{}" loading="lazy"></picture>',
+        format_html_join(
+            "", '<source type="{}" srcset="{}"{}>',
+            ((mime, srcset, sizes_attr) for mime, srcset in sources),
+        ),
+        _url(fieldfile, fallback_spec, fallback_extension),
+        image_srcset(fieldfile, kind, fallback_extension, spec),
+        sizes_attr,
+        alt,
+        css_class,
+    )
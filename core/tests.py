@@ -1,3 +1,272 @@
-from django.test import TestCase
+import base64
+import json
+import tempfile
+from io import BytesIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import SimpleTestCase, TestCase
+
+from accounts.models import CustomUser
+from blogs.models import Blog
+from blogs.search import search_blogs
+from core.benchmarking import check, run, seed_fixture
+from core.images import derivative_name, has_derivatives, render_derivatives
+from core.instrumentation import install, start, stop
+from core.middleware import RequestTimingMiddleware
+from core.pagination import CursorPaginator
+from core.seeding import finish, generate_blogs
+from core.startup import check_budget, get_budget, parse_importtime, profile_startup
+from core.templatetags.image_tags import responsive_image
+
+
+class StartupBudgetTests(SimpleTestCase):
+    """Web workers must boot within STARTUP_BUDGET (see core/startup.py)."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.profile = profile_startup()
+
+    def test_heavy_modules_are_not_imported_at_startup(self):
+        imported = [
+            module
+            for module in get_budget()["forbidden_modules"]
+            if module in self.profile["modules"]
+        ]
+        self.assertEqual(imported, [], "import these lazily, where they are used")
+
+    def test_startup_within_budget(self):
+        self.assertEqual(check_budget(self.profile), [])
+
+    def test_parse_importtime(self):
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     django.utils\n"
+            "import time:       300 |        420 |   django.core\n"
+            "import time:        80 |        500 | django\n"
+        )
+        self.assertEqual(
+            parse_importtime(output),
+            [("django.utils", 120, 120, 2), ("django.core", 300, 420, 1), ("django", 80, 500, 0)],
+        )
+
+
+class ImageDerivativeTests(SimpleTestCase):
+    """core/images.py and the responsive_image tag."""
+
+    def setUp(self):
+        cache.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.storage = FileSystemStorage(location=directory.name, base_url="/media/")
+
+    def _upload(self, name):
+        from PIL import Image
+
+        buffer = BytesIO()
+        Image.new("RGB", (40, 30), "red").save(buffer, "PNG")
+        return self.storage.save(name, ContentFile(buffer.getvalue()))
+
+    def test_extensions_do_not_share_derivatives(self):
+        self.assertNotEqual(
+            derivative_name("blog_images/cat.png", "card", "webp"),
+            derivative_name("blog_images/cat.jpg", "card", "webp"),
+        )
+
+    def test_existence_is_cached(self):
+        name = self._upload("blog_images/cat.png")
+        fieldfile = mock.Mock(storage=self.storage, url="/media/blog_images/cat.png")
+        fieldfile.name = name
+        self.assertFalse(has_derivatives(name, "blog", self.storage))
+
+        render_derivatives(name, "blog", self.storage)
+        with mock.patch.object(self.storage, "exists") as exists:
+            html = responsive_image(fieldfile, "blog", spec="card")
+            self.assertTrue(has_derivatives(name, "blog", self.storage))
+        exists.assert_not_called()
+        self.assertIn(f"/media/derivatives/{name}/card.webp", html)
+
+
+class CursorPaginationTests(TestCase):
+    """core/pagination.py: keyset pages in both directions."""
+
+    @classmethod
+    def setUpTestData(cls):
+        author = CustomUser.objects.create_user("writer", "writer@example.com")
+        cls.blogs = [
+            Blog.objects.create(title=f"Post {i}", content="Hello", author=author)
+            for i in range(12)
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.paginator = CursorPaginator(Blog.objects.all(), 5)
+
+    def _titles(self, page):
+        return [blog.title for blog in page]
+
+    def test_next_and_previous(self):
+        first = self.paginator.page()
+        self.assertEqual(self._titles(first), [f"Post {i}" for i in range(11, 6, -1)])
+        self.assertEqual((first.has_previous, first.has_next), (False, True))
+
+        second = self.paginator.page(first.next_cursor)
+        third = self.paginator.page(second.next_cursor)
+        self.assertEqual(self._titles(third), ["Post 1", "Post 0"])
+        self.assertFalse(third.has_next)
+
+        back = self.paginator.page(third.previous_cursor)
+        self.assertEqual(self._titles(back), self._titles(second))
+        self.assertEqual(self._titles(self.paginator.page(back.previous_cursor)), self._titles(first))
+        self.assertEqual(self.paginator.page(back.previous_cursor).has_previous, False)
+
+    def test_rows_added_while_paging_are_not_repeated(self):
+        first = self.paginator.page()
+        cursor = first.next_cursor
+        Blog.objects.create(title="Newer", content="Hello", author=self.blogs[0].author)
+        second = self.paginator.page(cursor)
+        self.assertEqual(self._titles(second), [f"Post {i}" for i in range(6, 1, -1)])
+
+    def test_bad_cursor_and_legacy_page_numbers(self):
+        self.assertEqual(
+            self._titles(self.paginator.page("not-a-cursor")), self._titles(self.paginator.page())
+        )
+        page = self.paginator.page_number(3)
+        self.assertEqual(self._titles(page), ["Post 1", "Post 0"])
+        self.assertEqual(page.total_count, 12)
+        self.assertIn("cursor=", page.previous_query)
+
+    def _cursor(self, *values):
+        return base64.urlsafe_b64encode(json.dumps({"v": list(values)}).encode()).decode()
+
+    def test_crafted_cursors_fall_back_to_the_first_page(self):
+        first = self._titles(self.paginator.page())
+        created_at = self.blogs[5].created_at.isoformat()
+        for values in ([{}, 1], [[1], 1], [None, None], [created_at, None], [created_at, "x"]):
+            with self.subTest(values=values):
+                page = self.paginator.page(self._cursor(*values))
+                self.assertEqual(self._titles(page), first)
+
+        paginator = CursorPaginator(
+            search_blogs(Blog.objects.all(), "post"), 5,
+            ordering=("search_rank", "-created_at", "-id"),
+        )
+        first = self._titles(paginator.page())
+        for rank in ("high", None, [0]):
+            with self.subTest(rank=rank):
+                page = paginator.page(self._cursor(rank, created_at, self.blogs[5].pk))
+                self.assertEqual(self._titles(page), first)
+
+    def test_page_numbers_past_the_offset_limit(self):
+        page = self.paginator.page_number("999999999999999999999")
+        self.assertEqual(self._titles(page), [f"Post {i}" for i in range(11, 6, -1)])
+        self.assertEqual(self._titles(self.paginator.page_number(99)), [])
+
+
+class QueryBudgetTests(TestCase):
+    """Every URL stays within its query budget (see core/benchmarking.py)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.fixture = seed_fixture(blogs=120, users=20)
+
+    def setUp(self):
+        cache.clear()
+
+    def _counts(self):
+        # A cold request and a warm one; the most either took is recorded
+        results = run(self.fixture, iterations=1, warmup=1, host="testserver")
+        return {(result["route"], result["role"]): result for result in results}
+
+    def test_every_url_within_query_budget(self):
+        for (route, role), result in self._counts().items():
+            with self.subTest(route=route, role=role):
+                self.assertLess(result["status"], 500)
+                self.assertLessEqual(result["queries"], result["budget"])
+
+    def test_query_counts_do_not_grow_with_data(self):
+        before = self._counts()
+        since = Blog.objects.order_by("-pk").values_list("pk", flat=True).first()
+        authors = dict(CustomUser.objects.values_list("pk", "date_joined"))
+        generate_blogs(300, authors, seed=1)
+        finish(since)
+        cache.clear()
+
+        after = self._counts()
+        for key, result in after.items():
+            with self.subTest(route=key[0], role=key[1]):
+                self.assertLessEqual(result["queries"], before[key]["queries"])
+
+    def test_check_reports_regressions(self):
+        result = {
+            "route": "blog_list",
+            "role": "anonymous",
+            "path": "/blogs/",
+            "status": 200,
+            "queries": 4,
+            "budget": 2,
+            "p50": 9.0,
+            "p95": 20.0,
+        }
+        baseline = {"blog_list:anonymous": {"p50": 5.0, "p95": 10.0, "queries": 2}}
+        failures = check([result], baseline, tolerance=0.25, slack_ms=2.0)
+        self.assertEqual(len(failures), 2)
+        self.assertIn("4 queries, budget 2", failures[0])
+        self.assertIn("p95 20.0 ms", failures[1])
+
+        result.update(queries=2, p95=14.0)
+        self.assertEqual(check([result], baseline, tolerance=0.25, slack_ms=2.0), [])
+
+
+class RequestTimingTests(TestCase):
+    """core.middleware.RequestTimingMiddleware and core/instrumentation.py."""
+
+    def test_server_timing_header(self):
+        self.client.force_login(
+            CustomUser.objects.create_user("staff", "staff@example.com", is_staff=True)
+        )
+        response = self.client.get("/")
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r'db;dur=[0-9.]+;desc="[0-9]+ queries"')
+        self.assertRegex(timing, r"tpl;dur=[1-9]")
+        self.assertIn("total;dur=", timing)
+
+    def test_server_timing_is_for_staff(self):
+        response = self.client.get("/accounts/login/")
+        self.assertNotIn("Server-Timing", response)
+
+        self.client.force_login(CustomUser.objects.create_user("reader", "reader@example.com"))
+        response = self.client.get("/accounts/login/")
+        self.assertNotIn("Server-Timing", response)
+
+        with self.settings(DEBUG=True):
+            self.client.logout()
+            self.assertIn("Server-Timing", self.client.get("/accounts/login/"))
+
+    def test_slow_requests_log_repeated_queries(self):
+        CustomUser.objects.create_user("reader")
+        with self.settings(REQUEST_TIMING={"slow_request_ms": 0}):
+            with self.assertLogs("core.middleware", "WARNING") as logs:
+                self.client.get("/accounts/login/")
+        self.assertIn("slow request method=GET path=/accounts/login/", logs.output[0])
+
+        install()
+        timings, token = start()
+        try:
+            for pk in (1, 2, 2):
+                list(CustomUser.objects.filter(pk=pk))
+        finally:
+            stop(token)
+        [(sql, count, identical)] = timings.duplicates()
+        self.assertEqual((count, identical), (3, 2))
+
+    def test_disabled_middleware_is_not_used(self):
+        with self.settings(REQUEST_TIMING={"enabled": False}):
+            with self.assertRaises(MiddlewareNotUsed):
+                RequestTimingMiddleware(lambda request: None)
+            response = self.client.get("/accounts/login/")
+        self.assertNotIn("Server-Timing", response)
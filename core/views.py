@@ -1,11 +1,34 @@
 # core/views.py
 from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+from django.views.decorators.http import condition
+
+from blogs.cache import get_or_render
+from blogs.conditional import list_etag, list_last_modified
 from blogs.models import Blog
 
 
+@condition(etag_func=list_etag, last_modified_func=list_last_modified)
 def home(request):
     """
     Home page: show latest published blogs.
+    Both blog lists come from the fragment cache for anonymous visitors.
     """
-    latest_blogs = Blog.objects.filter(status="published").order_by("-created_at")[:5]
-    return render(request, "home.html", {"latest_blogs": latest_blogs})
\ No newline at end of file
+
+    def render_lists():
+        context = {"latest_blogs": list(Blog.objects.for_listing()[:5])}
+        return (
+            render_to_string("home_activity.html", context, request=request),
+            render_to_string("home_recent.html", context, request=request),
+        )
+
+    latest_activity, recent_blogs = get_or_render("home", request, render_lists)
+    return render(
+        request,
+        "home.html",
+        {
+            "latest_activity": mark_safe(latest_activity),
+            "recent_blogs": mark_safe(recent_blogs),
+        },
+    )
@@ -1,3 +1,17 @@
+# dashboard/admin.py
 from django.contrib import admin
 
-# Register your models here.
+from .models import DailyStatistic, SiteStatistic
+
+
+@admin.register(SiteStatistic)
+class SiteStatisticAdmin(admin.ModelAdmin):
+    list_display = ("name", "bucket", "value", "updated_at")
+    list_filter = ("name",)
+
+
+@admin.register(DailyStatistic)
+class DailyStatisticAdmin(admin.ModelAdmin):
+    list_display = ("metric", "date", "value")
+    list_filter = ("metric",)
+    date_hierarchy = "date"
@@ -0,0 +1,34 @@
+# dashboard/management/commands/recount_statistics.py
+from django.core.management.base import BaseCommand
+
+from dashboard.stats import TOTAL, recount
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the materialized dashboard statistics (users, blogs per "
+        "status/category, users per role, daily posts and approvals) from "
+        "the source tables, in primary-key chunks, and replace the stored "
+        "values. Run it periodically (e.g. nightly from cron) to correct "
+        "any drift in the incrementally maintained counters."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Rows aggregated per query.",
+        )
+
+    def handle(self, *args, **options):
+        counters, daily = recount(chunk_size=options["chunk_size"])
+        for (name, bucket), value in sorted(counters.items()):
+            label = name if bucket == TOTAL else f"{name}[{bucket}]"
+            self.stdout.write(f"  {label:<32} {value:>10,}")
+        days = len({date for _, date in daily})
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recounted {len(counters)} counters and {days} days of daily series."
+            )
+        )
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStatistic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(choices=[('posts', 'Posts'), ('approvals', 'Approvals')], max_length=20)),
+                ('date', models.DateField()),
+                ('value', models.IntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['metric', '-date'],
+                'constraints': [models.UniqueConstraint(fields=('metric', 'date'), name='dailystatistic_metric_date')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SiteStatistic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50)),
+                ('bucket', models.CharField(blank=True, default='', max_length=50)),
+                ('value', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['name', 'bucket'],
+                'constraints': [models.UniqueConstraint(fields=('name', 'bucket'), name='sitestatistic_name_bucket')],
+            },
+        ),
+    ]
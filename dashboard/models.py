@@ -1,3 +1,55 @@
+# dashboard/models.py
 from django.db import models
 
-# Create your models here.
+
+class SiteStatistic(models.Model):
+    """
+    One materialized counter, e.g. ("blogs.status", "published") -> 1234 or
+    ("users", "") -> 56. Kept up to date incrementally by dashboard.signals
+    and reconciled by `manage.py recount_statistics`.
+    """
+
+    name = models.CharField(max_length=50)
+    bucket = models.CharField(max_length=50, blank=True, default="")
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["name", "bucket"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["name", "bucket"],
+                name="sitestatistic_name_bucket",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name}[{self.bucket}] = {self.value}"
+
+
+class DailyStatistic(models.Model):
+    """
+    Precomputed daily time series: `metric` is "posts" (blogs created that
+    day) or "approvals" (published blogs approved that day).
+    """
+
+    METRIC_CHOICES = (
+        ('posts', 'Posts'),
+        ('approvals', 'Approvals'),
+    )
+
+    metric = models.CharField(max_length=20, choices=METRIC_CHOICES)
+    date = models.DateField()
+    value = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["metric", "-date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["metric", "date"],
+                name="dailystatistic_metric_date",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.metric} {self.date}: {self.value}"
@@ -0,0 +1,114 @@
+# dashboard/signals.py
+"""
+Keep the materialized statistics (dashboard/stats.py) in step with every
+write path: single saves and deletes through the model signals, bulk
+paths through the blogs_moderated / blogs_recategorized /
+users_role_changed signals.
+"""
+from collections import Counter
+
+from django.db.models.signals import post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from accounts.models import CustomUser
+from accounts.signals import users_role_changed
+from blogs.models import Blog
+from blogs.signals import blogs_moderated, blogs_recategorized
+
+from .stats import BLOG_STATE_FIELDS, adjust, blog_deltas, blog_state, user_deltas
+
+
+def _skip(update_fields, tracked):
+    return update_fields is not None and not set(update_fields) & set(tracked)
+
+
+@receiver(pre_save, sender=Blog)
+def remember_blog_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or _skip(update_fields, BLOG_STATE_FIELDS):
+        instance._stats_before = False
+        return
+    instance._stats_before = None
+    if not instance._state.adding:
+        # The values the blog was loaded with; read the row only if they
+        # were deferred or the instance was built by hand
+        instance._stats_before = instance.loaded_values(BLOG_STATE_FIELDS)
+        if instance._stats_before is None:
+            instance._stats_before = (
+                Blog.objects.filter(pk=instance.pk).values_list(*BLOG_STATE_FIELDS).first()
+            )
+
+
+@receiver(post_save, sender=Blog)
+def count_saved_blog(sender, instance, update_fields=None, **kwargs):
+    before = instance.__dict__.pop("_stats_before", False)
+    if before is False:
+        return
+    adjust(*blog_deltas(before, blog_state(instance)))
+    # What the row holds now, for the next save of this instance
+    loaded = instance.__dict__.setdefault("_loaded_values", {})
+    for field in BLOG_STATE_FIELDS:
+        if update_fields is None or field in update_fields:
+            loaded[field] = getattr(instance, field)
+
+
+@receiver(pre_delete, sender=Blog)
+def count_deleted_blog(sender, instance, **kwargs):
+    # pre_delete runs in the deletion's transaction, while the row exists
+    adjust(*blog_deltas(blog_state(instance), None))
+
+
+@receiver(blogs_moderated, sender=Blog)
+def count_moderated_blogs(sender, blog_ids, status, previous, previous_approvals=(), **kwargs):
+    counters = Counter({("blogs.status", status): len(blog_ids)})
+    for old_status, count in previous.items():
+        counters[("blogs.status", old_status)] -= count
+
+    daily = Counter()
+    if status == "published":
+        daily[("approvals", timezone.localdate())] += len(blog_ids)
+    for approved_at in previous_approvals:
+        daily[("approvals", timezone.localdate(approved_at))] -= 1
+    adjust(counters, daily)
+
+
+@receiver(blogs_recategorized, sender=Blog)
+def count_recategorized_blogs(sender, changes, **kwargs):
+    counters = Counter()
+    for (old, new), count in changes.items():
+        counters[("blogs.category", old)] -= count
+        counters[("blogs.category", new)] += count
+    adjust(counters)
+
+
+@receiver(pre_save, sender=CustomUser)
+def remember_user_role(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or _skip(update_fields, ("role",)):
+        instance._stats_role = False
+        return
+    instance._stats_role = None
+    if not instance._state.adding:
+        instance._stats_role = (
+            CustomUser.objects.filter(pk=instance.pk).values_list("role", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=CustomUser)
+def count_saved_user(sender, instance, **kwargs):
+    before = instance.__dict__.pop("_stats_role", False)
+    if before is False:
+        return
+    adjust(user_deltas(before, instance.role))
+
+
+@receiver(pre_delete, sender=CustomUser)
+def count_deleted_user(sender, instance, **kwargs):
+    adjust(user_deltas(instance.role, None))
+
+
+@receiver(users_role_changed, sender=CustomUser)
+def count_role_changes(sender, role, previous, **kwargs):
+    counters = Counter({("users.role", role): sum(previous.values())})
+    for old_role, count in previous.items():
+        counters[("users.role", old_role)] -= count
+    adjust(counters)
@@ -0,0 +1,200 @@
+# dashboard/stats.py
+"""
+Materialized site statistics for the admin dashboard.
+
+Instead of COUNT(*) over users and blogs on every dashboard load, counters
+live in SiteStatistic rows:
+
+    ("users", "")                    all users
+    ("users.role", <role>)           users per role
+    ("blogs", "")                    all blogs
+    ("blogs.status", <status>)       blogs per status
+    ("blogs.category", <category>)   blogs per category
+
+and daily series ("posts", "approvals") in DailyStatistic rows. Writes
+keep them current with atomic `value = value + delta` updates (see
+dashboard/signals.py); recount() rebuilds everything from the source
+tables, in primary-key chunks, and is run by `manage.py
+recount_statistics` to correct any drift.
+"""
+from collections import Counter
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from accounts.models import CustomUser
+from blogs.models import Blog
+
+from .models import DailyStatistic, SiteStatistic
+
+TOTAL = ""
+
+# Blog columns the counters depend on, in blog_state() order
+BLOG_STATE_FIELDS = ("status", "category", "created_at", "approved_at")
+
+
+def blog_state(blog):
+    return tuple(getattr(blog, field) for field in BLOG_STATE_FIELDS)
+
+
+def blog_deltas(before, after):
+    """
+    Counter and daily deltas for a blog going from `before` to `after`
+    (blog_state() tuples; None for "did not exist").
+    """
+    counters = Counter()
+    daily = Counter()
+    for state, sign in ((before, -1), (after, 1)):
+        if state is None:
+            continue
+        status, category, created_at, approved_at = state
+        counters[("blogs", TOTAL)] += sign
+        counters[("blogs.status", status)] += sign
+        counters[("blogs.category", category)] += sign
+        daily[("posts", timezone.localdate(created_at))] += sign
+        if status == "published" and approved_at:
+            daily[("approvals", timezone.localdate(approved_at))] += sign
+    return counters, daily
+
+
+def user_deltas(before_role, after_role):
+    counters = Counter()
+    for role, sign in ((before_role, -1), (after_role, 1)):
+        if role is None:
+            continue
+        counters[("users", TOTAL)] += sign
+        counters[("users.role", role)] += sign
+    return counters
+
+
+def _add(model, lookup, delta, **extra):
+    if model.objects.filter(**lookup).update(value=F("value") + delta, **extra):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(value=delta, **lookup)
+    except IntegrityError:
+        # Created concurrently; add to that row instead
+        model.objects.filter(**lookup).update(value=F("value") + delta, **extra)
+
+
+def adjust(counters=None, daily=None):
+    """
+    Apply deltas: `counters` maps (name, bucket) and `daily` maps
+    (metric, date) to an amount. Nothing is written until recount() has
+    seeded the tables; the first read seeds them.
+    """
+    counters = {key: delta for key, delta in (counters or {}).items() if delta}
+    daily = {key: delta for key, delta in (daily or {}).items() if delta}
+    if not (counters or daily) or not SiteStatistic.objects.exists():
+        return
+
+    now = timezone.now()
+    for (name, bucket), delta in counters.items():
+        _add(SiteStatistic, {"name": name, "bucket": bucket}, delta, updated_at=now)
+    for (metric, date), delta in daily.items():
+        _add(DailyStatistic, {"metric": metric, "date": date}, delta)
+
+
+def site_statistics():
+    """{name: {bucket: value}} from one small query; seeds the table if empty."""
+    rows = list(SiteStatistic.objects.values_list("name", "bucket", "value"))
+    if not rows:
+        recount()
+        rows = list(SiteStatistic.objects.values_list("name", "bucket", "value"))
+
+    stats = {}
+    for name, bucket, value in rows:
+        stats.setdefault(name, {})[bucket] = value
+    return stats
+
+
+def daily_series(days):
+    """The last `days` days, oldest first: [{"date", "posts", "approvals"}]."""
+    today = timezone.localdate()
+    start = today - timedelta(days=days - 1)
+    values = {
+        (metric, date): value
+        for metric, date, value in DailyStatistic.objects.filter(date__gte=start)
+        .values_list("metric", "date", "value")
+    }
+    series = []
+    for offset in range(days):
+        date = start + timedelta(days=offset)
+        series.append({
+            "date": date,
+            "posts": values.get(("posts", date), 0),
+            "approvals": values.get(("approvals", date), 0),
+        })
+    return series
+
+
+def _chunks(queryset, chunk_size):
+    """Split `queryset` into primary-key ranges of about `chunk_size` rows."""
+    last_pk = None
+    while True:
+        window = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pks = window.order_by("pk").values_list("pk", flat=True)
+        bound = list(pks[chunk_size - 1:chunk_size])
+        if not bound:
+            yield window.order_by()
+            return
+        last_pk = bound[0]
+        yield window.filter(pk__lte=last_pk).order_by()
+
+
+def _group(queryset, field, annotation=None):
+    if annotation is not None:
+        queryset = queryset.annotate(**{field: annotation})
+    return queryset.values_list(field).annotate(total=Count("pk"))
+
+
+def recount(chunk_size=5000):
+    """
+    Recompute every counter and daily series from users and blogs, a
+    chunk of rows at a time, then replace the stored values in one
+    transaction. Returns (counters, daily).
+    """
+    counters = Counter()
+    daily = Counter()
+    for value, _ in Blog.STATUS_CHOICES:
+        counters[("blogs.status", value)] = 0
+    for value, _ in Blog.CATEGORY_CHOICES:
+        counters[("blogs.category", value)] = 0
+    for value, _ in CustomUser.ROLE_CHOICES:
+        counters[("users.role", value)] = 0
+    counters[("blogs", TOTAL)] = counters[("users", TOTAL)] = 0
+
+    for chunk in _chunks(Blog.objects.all(), chunk_size):
+        for status, total in _group(chunk, "status"):
+            counters[("blogs", TOTAL)] += total
+            counters[("blogs.status", status)] += total
+        for category, total in _group(chunk, "category"):
+            counters[("blogs.category", category)] += total
+        for day, total in _group(chunk, "day", TruncDate("created_at")):
+            daily[("posts", day)] += total
+        published = chunk.filter(status="published", approved_at__isnull=False)
+        for day, total in _group(published, "day", TruncDate("approved_at")):
+            daily[("approvals", day)] += total
+
+    for chunk in _chunks(CustomUser.objects.all(), chunk_size):
+        for role, total in _group(chunk, "role"):
+            counters[("users", TOTAL)] += total
+            counters[("users.role", role)] += total
+
+    with transaction.atomic():
+        SiteStatistic.objects.all().delete()
+        SiteStatistic.objects.bulk_create(
+            SiteStatistic(name=name, bucket=bucket, value=value)
+            for (name, bucket), value in counters.items()
+        )
+        DailyStatistic.objects.all().delete()
+        DailyStatistic.objects.bulk_create(
+            DailyStatistic(metric=metric, date=date, value=value)
+            for (metric, date), value in daily.items()
+            if value
+        )
+    return counters, daily
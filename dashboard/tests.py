@@ -1,3 +1,70 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-# Create your tests here.
+from accounts.models import CustomUser
+from blogs.models import Blog
+from blogs.moderation import moderate
+
+from .models import DailyStatistic
+from .stats import recount, site_statistics
+
+
+class StatisticsSyncTests(TestCase):
+    """The materialized counters follow every write (dashboard/signals.py)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = CustomUser.objects.create_user("writer", "writer@example.com")
+        cls.blog = Blog.objects.create(
+            title="Post", content="Hello", author=cls.author, category="Travel"
+        )
+
+    def setUp(self):
+        recount()
+
+    def _daily(self):
+        return set(DailyStatistic.objects.exclude(value=0).values_list("metric", "date", "value"))
+
+    def _assert_counts_match(self):
+        counted, daily = site_statistics(), self._daily()
+        recount()
+        self.assertEqual(counted, site_statistics())
+        self.assertEqual(daily, self._daily())
+
+    def test_save_reads_loaded_state(self):
+        blog = Blog.objects.get(pk=self.blog.pk)
+        blog.status = "pending"
+        with CaptureQueriesContext(connection) as queries:
+            blog.save()
+        reads = [
+            query["sql"] for query in queries
+            if query["sql"].startswith("SELECT") and 'FROM "blogs_blog"' in query["sql"]
+        ]
+        self.assertEqual(reads, [])
+        self.assertEqual(site_statistics()["blogs.status"]["pending"], 1)
+
+        # A second save of the same instance starts from what the first wrote
+        blog.category = "Health"
+        blog.save()
+        self._assert_counts_match()
+
+    def test_bulk_moderation(self):
+        pending = [
+            Blog.objects.create(title=title, content="Hi", author=self.author, status="pending")
+            for title in ("First", "Second")
+        ]
+        # Drafts are never moderated
+        moderate(Blog.objects.all(), "approve", self.author)
+        self.assertEqual(site_statistics()["blogs.status"]["published"], 2)
+        self._assert_counts_match()
+
+        moderate(Blog.objects.filter(pk=pending[0].pk), "reject", self.author)
+        self.assertEqual(site_statistics()["blogs.status"]["rejected"], 1)
+        self._assert_counts_match()
+
+    def test_deferred_state_is_read_from_the_row(self):
+        blog = Blog.objects.only("title").get(pk=self.blog.pk)
+        blog.status = "published"
+        blog.save()
+        self._assert_counts_match()
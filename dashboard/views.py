@@ -3,31 +3,78 @@ from django.contrib.auth.decorators import login_required
 from django.shortcuts import render
 
 from accounts.models import CustomUser
+from blogs.cache import author_summary
 from blogs.models import Blog
+from core.pagination import CursorPaginator
+
+from .stats import TOTAL, daily_series, site_statistics
+
+# Lengths (in days) of the time series the admin dashboard can show
+SERIES_DAYS = (7, 30, 90)
+
+
+def _counts(stats, name, choices):
+    """[(label, count)] for every choice, in choice order."""
+    buckets = stats.get(name, {})
+    return [(label, buckets.get(value, 0)) for value, label in choices]
 
 
 @login_required
 def dashboard_view(request):
     """
     Dashboard for both admin and regular user.
-    - Admin: total users, total blogs, recent blogs.
-    - User: list of their own blogs.
+    - Admin: site statistics (read from the materialized counters, not
+      counted live), optional daily series (?days=7|30|90), recent blogs.
+    - User: per-status summary (cached per author) and a paginated list of
+      their own blogs, optionally one status only (?status=).
     """
     if request.user.role == "admin":
-        total_users = CustomUser.objects.count()
-        total_blogs = Blog.objects.count()
-        recent_blogs = Blog.objects.order_by("-created_at")[:5]
+        stats = site_statistics()
+        recent_blogs = Blog.objects.for_listing(request.user)[:5]
+
+        try:
+            days = int(request.GET.get("days", 0))
+        except ValueError:
+            days = 0
+        series = daily_series(days) if days in SERIES_DAYS else None
 
         context = {
-            "total_users": total_users,
-            "total_blogs": total_blogs,
+            "total_users": stats.get("users", {}).get(TOTAL, 0),
+            "total_blogs": stats.get("blogs", {}).get(TOTAL, 0),
+            "status_counts": _counts(stats, "blogs.status", Blog.STATUS_CHOICES),
+            "category_counts": _counts(stats, "blogs.category", Blog.CATEGORY_CHOICES),
+            "role_counts": _counts(stats, "users.role", CustomUser.ROLE_CHOICES),
             "recent_blogs": recent_blogs,
+            "series": series,
+            "series_days": days if series else None,
+            "series_choices": SERIES_DAYS,
+            "series_max": max(
+                [max(day["posts"], day["approvals"]) for day in series or []] + [1]
+            ),
         }
         template_name = "admin_dashboard.html"
     else:
-        user_blogs = Blog.objects.filter(author=request.user).order_by("-created_at")
+        summary = author_summary(request.user.pk)
+        labels = dict(Blog.STATUS_CHOICES)
+        status = request.GET.get("status")
+        blogs = Blog.objects.for_author(request.user)
+        if status in labels:
+            blogs = blogs.filter(status=status)
+            count = summary[status]
+        else:
+            status = None
+            count = sum(summary.values())
+
+        paginator = CursorPaginator(blogs, 10, count=count)
+        user_blogs = paginator.page_from_request(request)
         context = {
             "user_blogs": user_blogs,
+            "page_obj": user_blogs,
+            "status": status,
+            "total_blogs": sum(summary.values()),
+            "status_counts": [
+                (value, labels[value], total) for value, total in summary.items()
+            ],
         }
         template_name = "user_dashboard.html"
 
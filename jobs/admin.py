@@ -0,0 +1,12 @@
+# jobs/admin.py
+from django.contrib import admin
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("task", "status", "priority", "attempts", "run_at", "created_at", "finished_at")
+    list_filter = ("status", "task")
+    search_fields = ("task", "dedup_key")
+    readonly_fields = ("created_at", "started_at", "finished_at", "locked_by", "locked_at", "heartbeat_at", "last_error")
@@ -0,0 +1,23 @@
+# jobs/management/commands/jobstats.py
+import json
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from jobs.metrics import snapshot
+
+
+class Command(BaseCommand):
+    help = "Print job queue depth, throughput and latency as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--window",
+            type=int,
+            default=300,
+            help="Seconds of history used for throughput and latency.",
+        )
+
+    def handle(self, *args, **options):
+        stats = snapshot(timedelta(seconds=options["window"]))
+        self.stdout.write(json.dumps(stats, indent=2))
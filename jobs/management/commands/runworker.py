@@ -0,0 +1,163 @@
+# jobs/management/commands/runworker.py
+import multiprocessing
+import signal
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, close_old_connections, connection, connections
+
+from jobs.queue import HEARTBEAT_INTERVAL, claim, heartbeat, requeue_stale, run, worker_name
+
+# How often (seconds) a worker looks for jobs abandoned by a dead worker
+STALE_CHECK_INTERVAL = 60
+
+
+class RunningJobs:
+    """Ids of the jobs this process's consumers are running right now."""
+
+    def __init__(self):
+        self._ids = set()
+        self._lock = threading.Lock()
+
+    def add(self, job_id):
+        with self._lock:
+            self._ids.add(job_id)
+
+    def discard(self, job_id):
+        with self._lock:
+            self._ids.discard(job_id)
+
+    def snapshot(self):
+        with self._lock:
+            return list(self._ids)
+
+
+def _consume(stop, poll_interval, burst, running):
+    """Claim and run jobs until `stop` is set (or the queue is empty, in burst mode)."""
+    worker = worker_name()
+    try:
+        while not stop.is_set():
+            close_old_connections()
+            try:
+                job = claim(worker)
+            except OperationalError:
+                # SQLite reports "database is locked" under contention
+                job = None
+            if job is None:
+                if burst:
+                    return
+                stop.wait(poll_interval)
+                continue
+            running.add(job.pk)
+            try:
+                run(job)
+            finally:
+                running.discard(job.pk)
+    finally:
+        connection.close()
+
+
+def _work(threads, poll_interval, burst):
+    """
+    One process: `threads` consumer threads, plus heartbeats for the jobs
+    they are running and stale-job housekeeping in the main thread.
+    """
+    stop = threading.Event()
+    running = RunningJobs()
+
+    def shutdown(signum, frame):
+        stop.set()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    consumers = [
+        threading.Thread(
+            target=_consume,
+            args=(stop, poll_interval, burst, running),
+            name=f"worker-{number}",
+        )
+        for number in range(threads)
+    ]
+    for consumer in consumers:
+        consumer.start()
+
+    next_heartbeat = next_stale_check = 0
+    while any(consumer.is_alive() for consumer in consumers):
+        if time.monotonic() >= next_heartbeat:
+            try:
+                heartbeat(running.snapshot())
+            except OperationalError:
+                pass
+            next_heartbeat = time.monotonic() + HEARTBEAT_INTERVAL.total_seconds()
+        if time.monotonic() >= next_stale_check:
+            try:
+                requeue_stale()
+            except OperationalError:
+                pass
+            next_stale_check = time.monotonic() + STALE_CHECK_INTERVAL
+        stop.wait(1)
+
+    for consumer in consumers:
+        consumer.join()
+    connection.close()
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background jobs from the database queue with N threads per "
+        "process across M processes. Stop with Ctrl+C or SIGTERM; running "
+        "jobs are allowed to finish."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=1, help="Consumer threads per process.")
+        parser.add_argument("--processes", type=int, default=1, help="Worker processes.")
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds an idle consumer waits before polling again.",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once no job is ready instead of waiting for more.",
+        )
+
+    def handle(self, *args, **options):
+        threads = max(options["threads"], 1)
+        processes = max(options["processes"], 1)
+        poll_interval = options["poll_interval"]
+        burst = options["burst"]
+
+        self.stdout.write(
+            f"Starting {processes} process(es) x {threads} thread(s)"
+            f"{' in burst mode' if burst else ''}."
+        )
+
+        if processes == 1:
+            _work(threads, poll_interval, burst)
+            return
+
+        # Children must open their own database connections
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        children = [
+            context.Process(target=_work, args=(threads, poll_interval, burst))
+            for _ in range(processes)
+        ]
+        for child in children:
+            child.start()
+
+        def forward(signum, frame):
+            for child in children:
+                if child.is_alive():
+                    child.terminate()
+
+        signal.signal(signal.SIGTERM, forward)
+        signal.signal(signal.SIGINT, forward)
+        for child in children:
+            child.join()
+        self.stdout.write("Workers stopped.")
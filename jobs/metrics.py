@@ -0,0 +1,64 @@
+# jobs/metrics.py
+from datetime import timedelta
+
+from django.db.models import Count
+from django.utils import timezone
+
+from .models import Job
+
+# Latency percentiles are computed over at most this many recent jobs
+SAMPLE_SIZE = 1000
+
+
+def _percentile(values, fraction):
+    if not values:
+        return None
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+    return values[index]
+
+
+def snapshot(window=timedelta(minutes=5)):
+    """
+    Queue health at a glance:
+      - depth: jobs per status, plus how many queued jobs are ready now
+      - throughput: jobs finished per minute over `window`
+      - latency: seconds from enqueue to start (wait) and start to finish (run)
+    """
+    now = timezone.now()
+    since = now - window
+
+    depth = {status: 0 for status, _ in Job.STATUS_CHOICES}
+    depth.update(
+        Job.objects.values_list("status").annotate(total=Count("id")).order_by()
+    )
+    depth["ready"] = Job.objects.filter(status="queued", run_at__lte=now).count()
+
+    finished = Job.objects.filter(status__in=["done", "failed"], finished_at__gte=since)
+    finished_by_status = dict(
+        finished.values_list("status").annotate(total=Count("id")).order_by()
+    )
+    minutes = window.total_seconds() / 60
+
+    recent = list(
+        finished.filter(status="done")
+        .order_by("-finished_at")
+        .values_list("created_at", "started_at", "finished_at")[:SAMPLE_SIZE]
+    )
+    wait = [(started - created).total_seconds() for created, started, _ in recent if started]
+    run = [(done - started).total_seconds() for _, started, done in recent if started]
+
+    return {
+        "window_seconds": int(window.total_seconds()),
+        "depth": depth,
+        "throughput_per_minute": {
+            "done": round(finished_by_status.get("done", 0) / minutes, 2),
+            "failed": round(finished_by_status.get("failed", 0) / minutes, 2),
+        },
+        "latency_seconds": {
+            "wait_p50": _percentile(wait, 0.5),
+            "wait_p95": _percentile(wait, 0.95),
+            "run_p50": _percentile(run, 0.5),
+            "run_p95": _percentile(run, 0.95),
+        },
+    }
@@ -0,0 +1,71 @@
+# jobs/models.py
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    One unit of background work, stored in the main database.
+    A worker (manage.py runworker) claims ready jobs by priority, runs the
+    registered task with `payload` as keyword arguments, and retries
+    failures with exponential backoff up to `max_attempts`.
+    """
+
+    STATUS_CHOICES = (
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+
+    task = models.CharField(max_length=200)
+    payload = models.JSONField(default=dict, blank=True)
+
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default="queued"
+    )
+
+    # Higher runs first
+    priority = models.SmallIntegerField(default=0)
+
+    # At most one queued job per key; see jobs.queue.enqueue
+    dedup_key = models.CharField(max_length=200, null=True, blank=True)
+
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    # Refreshed by the worker process while the job runs; see jobs.queue
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-priority", "run_at", "id"]
+        indexes = [
+            models.Index(
+                fields=["status", "-priority", "run_at", "id"],
+                name="job_ready_idx",
+            ),
+            models.Index(
+                fields=["status", "finished_at"],
+                name="job_finished_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dedup_key"],
+                condition=models.Q(status="queued"),
+                name="job_queued_dedup_key",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.status})"
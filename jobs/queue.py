@@ -0,0 +1,226 @@
+# jobs/queue.py
+"""
+Database-backed job queue.
+
+Declare work with the @task decorator (in an app's tasks.py, which is
+discovered at startup) and queue it with enqueue() or `func.enqueue()`:
+
+    @task("blogs.classify_blogs", priority=5)
+    def classify_blogs(blog_ids):
+        ...
+
+    classify_blogs.enqueue(blog_ids=[blog.pk], dedup_key=f"classify:{blog.pk}")
+
+The job row is written in the caller's transaction, so a worker only sees
+it once the surrounding request commits. `manage.py runworker` claims and
+runs jobs, and refreshes the heartbeat of the ones it is running; a job
+is only handed to another worker once its heartbeat stops.
+"""
+import logging
+import random
+import socket
+import threading
+import traceback
+from datetime import timedelta
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# Retry delay: BACKOFF_BASE * 2 ** (attempt - 1) seconds, capped, with jitter
+BACKOFF_BASE = 5
+BACKOFF_MAX = 60 * 60
+
+# Workers refresh the heartbeat of their running jobs this often...
+HEARTBEAT_INTERVAL = timedelta(seconds=30)
+# ...and a running job whose heartbeat is older than this is requeued
+STALE_AFTER = timedelta(minutes=5)
+
+_registry = {}
+
+
+class UnknownTask(Exception):
+    pass
+
+
+def task(name, *, priority=0, max_attempts=5):
+    """Register a function as a queueable task under `name`."""
+
+    def decorator(func):
+        _registry[name] = func
+        func.task_name = name
+
+        def enqueue_task(*, dedup_key=None, delay=None, priority=priority, **payload):
+            return enqueue(
+                name,
+                payload,
+                priority=priority,
+                dedup_key=dedup_key,
+                delay=delay,
+                max_attempts=max_attempts,
+            )
+
+        func.enqueue = enqueue_task
+        return func
+
+    return decorator
+
+
+def get_task(name):
+    try:
+        return _registry[name]
+    except KeyError:
+        raise UnknownTask(name)
+
+
+def enqueue(name, payload=None, *, priority=0, dedup_key=None, delay=None, max_attempts=5):
+    """
+    Queue a job and return it. With a `dedup_key`, a job that is already
+    queued under the same key is returned instead of adding a second one.
+    """
+    get_task(name)
+    run_at = timezone.now()
+    if delay:
+        run_at += delay if isinstance(delay, timedelta) else timedelta(seconds=delay)
+
+    fields = {
+        "task": name,
+        "payload": payload or {},
+        "priority": priority,
+        "dedup_key": dedup_key,
+        "max_attempts": max_attempts,
+        "run_at": run_at,
+    }
+    if dedup_key is None:
+        return Job.objects.create(**fields)
+    try:
+        with transaction.atomic():
+            return Job.objects.create(**fields)
+    except IntegrityError:
+        existing = Job.objects.filter(dedup_key=dedup_key, status="queued").first()
+        if existing is None:
+            # The duplicate was claimed in between; queue ours after all
+            return Job.objects.create(**fields)
+        return existing
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{threading.get_native_id()}"
+
+
+def _ready_jobs():
+    return Job.objects.filter(status="queued", run_at__lte=timezone.now()).order_by(
+        "-priority", "run_at", "id"
+    )
+
+
+def claim(worker=None):
+    """
+    Atomically take the next ready job, or return None.
+
+    Databases with SKIP LOCKED (PostgreSQL, MySQL 8) lock one ready row and
+    skip rows other workers hold. SQLite has no row locks, so candidates
+    are claimed with a compare-and-swap UPDATE that only one worker wins.
+    """
+    worker = worker or worker_name()
+    now = timezone.now()
+    claimed = {
+        "status": "running",
+        "locked_by": worker,
+        "locked_at": now,
+        "heartbeat_at": now,
+        "started_at": now,
+    }
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            job = _ready_jobs().select_for_update(skip_locked=True).first()
+            if job is None:
+                return None
+            for field, value in claimed.items():
+                setattr(job, field, value)
+            job.attempts += 1
+            job.save(update_fields=[*claimed, "attempts"])
+            return job
+
+    for job_id in _ready_jobs().values_list("id", flat=True)[:10]:
+        won = Job.objects.filter(id=job_id, status="queued").update(
+            attempts=F("attempts") + 1, **claimed
+        )
+        if won:
+            return Job.objects.get(id=job_id)
+    return None
+
+
+def backoff(attempt):
+    delay = min(BACKOFF_BASE * 2 ** (attempt - 1), BACKOFF_MAX)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def run(job):
+    """Run a claimed job and record the outcome. Returns True on success."""
+    try:
+        get_task(job.task)(**job.payload)
+    except Exception:
+        error = traceback.format_exc()
+        logger.exception("Job %s failed (attempt %d/%d)", job, job.attempts, job.max_attempts)
+        fields = {"last_error": error, "locked_by": "", "locked_at": None, "heartbeat_at": None}
+        if job.attempts < job.max_attempts:
+            _requeue(job.pk, run_at=timezone.now() + backoff(job.attempts), **fields)
+        else:
+            Job.objects.filter(pk=job.pk).update(
+                status="failed", finished_at=timezone.now(), **fields
+            )
+        return False
+
+    Job.objects.filter(pk=job.pk).update(
+        status="done", finished_at=timezone.now(), locked_by="", locked_at=None, heartbeat_at=None
+    )
+    return True
+
+
+def _requeue(job_id, condition=Q(), **fields):
+    """
+    Put a job back in the queue if it still matches `condition`. If a
+    newer job with the same dedup key is already queued, that one will do
+    the work, so this one is retired. Returns whether the job changed.
+    """
+    job = Job.objects.filter(condition, pk=job_id)
+    try:
+        with transaction.atomic():
+            return bool(job.update(status="queued", **fields))
+    except IntegrityError:
+        return bool(
+            job.update(status="done", finished_at=timezone.now(), locked_by="", locked_at=None)
+        )
+
+
+def heartbeat(job_ids):
+    """Record that the jobs in `job_ids` are still being worked on."""
+    if not job_ids:
+        return 0
+    return Job.objects.filter(pk__in=job_ids, status="running").update(
+        heartbeat_at=timezone.now()
+    )
+
+
+def requeue_stale(older_than=STALE_AFTER):
+    """
+    Put back running jobs whose worker stopped sending heartbeats (it
+    died or lost the database). Long jobs of a live worker are left
+    alone. Returns how many.
+    """
+    cutoff = timezone.now() - older_than
+    # Rows claimed before heartbeats existed only have locked_at
+    stale = Q(status="running") & (
+        Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, locked_at__lt=cutoff)
+    )
+    count = 0
+    for job_id in list(Job.objects.filter(stale).values_list("id", flat=True)):
+        # Re-checked in the UPDATE: the job may have finished or beaten since
+        count += _requeue(job_id, stale, locked_by="", locked_at=None, heartbeat_at=None)
+    return count
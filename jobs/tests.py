@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from .models import Job
+from .queue import claim, enqueue, heartbeat, requeue_stale, run, task
+
+
+@task("jobs.tests.record")
+def record(value):
+    if value == "fail":
+        raise ValueError(value)
+
+
+class QueueTests(TestCase):
+    """jobs/queue.py: claiming, retries and stale-job recovery."""
+
+    def test_claim_and_run(self):
+        job = enqueue("jobs.tests.record", {"value": 1})
+        claimed = claim("worker-a")
+        self.assertEqual((claimed.pk, claimed.status, claimed.attempts), (job.pk, "running", 1))
+        self.assertIsNone(claim("worker-b"))
+
+        self.assertTrue(run(claimed))
+        self.assertEqual(Job.objects.get(pk=job.pk).status, "done")
+
+    def test_failures_are_retried_with_backoff(self):
+        job = enqueue("jobs.tests.record", {"value": "fail"})
+        self.assertFalse(run(claim()))
+        job.refresh_from_db()
+        self.assertEqual(job.status, "queued")
+        self.assertGreater(job.run_at, timezone.now())
+        self.assertIn("ValueError", job.last_error)
+
+    def test_dedup_key(self):
+        first = record.enqueue(value=1, dedup_key="record")
+        self.assertEqual(record.enqueue(value=1, dedup_key="record"), first)
+
+    def test_only_jobs_without_heartbeat_are_requeued(self):
+        alive = enqueue("jobs.tests.record", {"value": 1})
+        dead = enqueue("jobs.tests.record", {"value": 2})
+        claim("worker-a"), claim("worker-b")
+        # Both were claimed long ago; only alive's worker still reports
+        long_ago = timezone.now() - timedelta(hours=1)
+        Job.objects.update(locked_at=long_ago, heartbeat_at=long_ago)
+        heartbeat([alive.pk])
+
+        self.assertEqual(requeue_stale(), 1)
+        statuses = dict(Job.objects.values_list("pk", "status"))
+        self.assertEqual(statuses, {alive.pk: "running", dead.pk: "queued"})
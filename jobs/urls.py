@@ -0,0 +1,9 @@
+# jobs/urls.py
+from django.urls import path
+from . import views
+
+app_name = "jobs"
+
+urlpatterns = [
+    path("metrics/", views.queue_metrics, name="metrics"),
+]
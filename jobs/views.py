@@ -0,0 +1,20 @@
+# jobs/views.py
+from datetime import timedelta
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
+
+from .metrics import snapshot
+
+
+@staff_member_required
+def queue_metrics(request):
+    """
+    Queue depth, throughput and latency as JSON, for dashboards and probes.
+    ?window=<seconds> sets the throughput/latency window (default 300).
+    """
+    try:
+        seconds = max(int(request.GET.get("window", 300)), 1)
+    except ValueError:
+        seconds = 300
+    return JsonResponse(snapshot(timedelta(seconds=seconds)))